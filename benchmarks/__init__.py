@@ -0,0 +1,18 @@
+"""Performance benchmark suite for the distribution pipeline."""
+
+from benchmarks.synthetic_data import (
+    generate_workbook, generate_rows, generate_stock_matrix
+)
+from benchmarks.results import (
+    build_report, save_report, load_report, find_regressions
+)
+
+__all__ = [
+    'generate_workbook',
+    'generate_rows',
+    'generate_stock_matrix',
+    'build_report',
+    'save_report',
+    'load_report',
+    'find_regressions',
+]
@@ -0,0 +1,7 @@
+"""Allows running the suite with ``python -m benchmarks``."""
+
+import sys
+
+from benchmarks.run_benchmarks import main
+
+sys.exit(main())
@@ -0,0 +1,151 @@
+"""Branch-count scaling and solver benchmarks for the distribution engine."""
+
+from typing import Dict, List, Sequence
+
+from benchmarks.kernel_benchmarks import _calculate_stocks, _strip
+from benchmarks.synthetic_data import generate_stock_matrix
+from benchmarks.timing import measure
+from src.domain.models.distribution import DistributionResult, Transfer
+from src.domain.models.entities import Branch, Product
+from src.domain.services.distribution_service import DistributionEngine
+from src.domain.services.flow_distribution_service import (
+    FlowDistributionEngine
+)
+from src.domain.services.priority_service import PriorityCalculator
+
+BRANCH_COUNTS = (6, 12, 25, 50, 100)
+SMALL_LINE_QUANTITY = 3
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def run_engine_benchmarks(
+    product_count: int, seed: int = 42, repeat: int = 3,
+    branch_counts: Sequence[int] = BRANCH_COUNTS
+) -> Dict[str, dict]:
+    """Times the heap engine against the re-sorting reference."""
+    heap_engine = DistributionEngine(PriorityCalculator())
+    reference_engine = ReferenceDistributionEngine(PriorityCalculator())
+    results = {}
+    for branch_count in branch_counts:
+        items = build_items(product_count, branch_count, seed)
+        results[f"heap_{branch_count}_branches"] = _strip(measure(
+            lambda: heap_engine.distribute_products(items), repeat
+        ))
+        results[f"reference_{branch_count}_branches"] = _strip(measure(
+            lambda: [reference_engine.distribute_product(*i) for i in items],
+            repeat
+        ))
+    return results
+
+
+def run_solver_benchmarks(
+    product_count: int, branch_count: int, seed: int = 42, repeat: int = 3
+) -> Dict[str, dict]:
+    """Times greedy against min-cost flow and reports lines and cost.
+
+    The flow solver runs with ring costs and with uniform default costs;
+    lines under SMALL_LINE_QUANTITY units are counted separately.
+    """
+    items = build_items(product_count, branch_count, seed)
+    pair_costs = ring_pair_costs(branch_count)
+    engines = {
+        "greedy": DistributionEngine(PriorityCalculator()),
+        "min_cost_flow": FlowDistributionEngine(
+            PriorityCalculator(), pair_costs=pair_costs
+        ),
+        "uniform_flow": FlowDistributionEngine(
+            PriorityCalculator(), pair_costs={}, default_cost=1.0
+        )
+    }
+    results = {}
+    for name, engine in engines.items():
+        timing = measure(lambda: engine.distribute_products(items), repeat)
+        transfers = [
+            transfer for result in timing["outcome"]
+            for transfer in result.transfers
+        ]
+        results[f"{name}_solver"] = {
+            **_strip(timing),
+            "transfer_lines": len(transfers),
+            "small_lines": sum(
+                transfer.quantity < SMALL_LINE_QUANTITY
+                for transfer in transfers
+            ),
+            "transfer_cost": sum(
+                pair_costs[(t.from_branch.name, t.to_branch.name)] * t.quantity
+                for t in transfers
+            )
+        }
+    return results
+
+
+def ring_pair_costs(branch_count: int) -> Dict[tuple, float]:
+    """Per-unit costs for branches on a ring: one plus the hop distance."""
+    return {
+        (f"branch_{source}", f"branch_{target}"): 1.0 + min(
+            abs(source - target), branch_count - abs(source - target)
+        )
+        for source in range(branch_count) for target in range(branch_count)
+        if source != target
+    }
+
+
+def build_items(product_count: int, branch_count: int, seed: int) -> List:
+    """Builds (product, needs, surpluses) items for a synthetic network."""
+    sales, balances = generate_stock_matrix(product_count, branch_count, seed)
+    branches = [Branch(f"branch_{index}") for index in range(branch_count)]
+    items = []
+    for index, row in enumerate(_calculate_stocks(sales, balances)):
+        pairs = list(zip(branches, row))
+        items.append((
+            Product(f"{index:06d}", f"Product {index:06d} tab"),
+            [pair for pair in pairs if pair[1].needed > 0],
+            [pair for pair in pairs
+             if pair[1].needed <= 0 and pair[1].surplus > 0]
+        ))
+    return items
+
+
+class ReferenceDistributionEngine(DistributionEngine):
+    """The original engine: re-sorts sources per need, tallies by scan."""
+
+    def distribute_product(
+        self, product, needing_branches, surplus_branches
+    ) -> DistributionResult:
+        """Distribute surplus exactly as before the heap rewrite."""
+        available = {b.name: s.surplus for b, s in surplus_branches}
+        transfers = []
+        for consumer, consumer_stock in self._sort_needs_by_priority(
+            needing_branches
+        ):
+            remaining = consumer_stock.needed
+            for provider, provider_stock in sorted(
+                surplus_branches, key=lambda item: available[item[0].name],
+                reverse=True
+            ):
+                if remaining <= 0:
+                    break
+                qty = min(remaining, max(0, available[provider.name]))
+                if qty > 0:
+                    transfers.append(Transfer(
+                        product, provider, consumer, qty,
+                        provider_stock.balance, consumer_stock.balance
+                    ))
+                    available[provider.name] -= qty
+                    remaining -= qty
+        fulfilled = {
+            b.name: sum(t.quantity for t in transfers if t.to_branch == b)
+            for b, _ in needing_branches
+        }
+        return DistributionResult(
+            product=product, transfers=transfers,
+            remaining_needed=sum(
+                max(0, s.needed - fulfilled.get(b.name, 0))
+                for b, s in needing_branches
+            ),
+            remaining_surplus=sum(available.values()),
+            remaining_branch_surplus=available
+        )
@@ -0,0 +1,76 @@
+"""Cold-start import benchmarks for the CLI entry point and GUI pages."""
+
+import glob
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES_DIRECTORY = os.path.join(
+    PROJECT_ROOT, "src", "presentation", "gui", "pages"
+)
+
+# Each probe runs in a fresh interpreter so nothing is cached between runs.
+CLI_PROBE = (
+    "import main\n"
+    "import src.presentation.cli.menu\n"
+    "from src.application.pipeline.steps import AVAILABLE_STEPS\n"
+)
+PAGE_PROBE = (
+    "import runpy\n"
+    "try:\n"
+    "    runpy.run_path({path!r}, run_name='__page__')\n"
+    "except BaseException:\n"
+    "    pass\n"
+)
+TIMER_TEMPLATE = (
+    "import sys, time, json\n"
+    "sys.path.insert(0, {root!r})\n"
+    "start, cpu_start = time.perf_counter(), time.process_time()\n"
+    "{body}"
+    "print(json.dumps({{'seconds': time.perf_counter() - start,"
+    " 'cpu': time.process_time() - cpu_start,"
+    " 'pandas_loaded': 'pandas' in sys.modules}}))\n"
+)
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def run_import_benchmarks(repeat: int = 3) -> Dict[str, dict]:
+    """Times a cold `python main.py` import and each GUI page render."""
+    results = {"cli_main": _time_probe(CLI_PROBE, repeat)}
+    for page_path in sorted(glob.glob(os.path.join(PAGES_DIRECTORY, "*.py"))):
+        page_name = os.path.splitext(os.path.basename(page_path))[0]
+        results[f"gui_{page_name}"] = _time_probe(
+            PAGE_PROBE.format(path=page_path), repeat
+        )
+    return results
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _time_probe(body: str, repeat: int) -> dict:
+    """Runs a probe in fresh interpreters and keeps the fastest run."""
+    script = TIMER_TEMPLATE.format(root=PROJECT_ROOT, body=body)
+    samples = [_run_interpreter(script) for _ in range(max(1, repeat))]
+    best = min(samples, key=lambda sample: sample["seconds"])
+    return {
+        "wall_seconds": round(best["seconds"], 6),
+        "cpu_seconds": round(best["cpu"], 6),
+        "pandas_loaded": best["pandas_loaded"]
+    }
+
+
+def _run_interpreter(script: str) -> dict:
+    """Executes a script in a new interpreter and parses its JSON line."""
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
@@ -0,0 +1,123 @@
+"""Micro-benchmarks for the hot domain and infrastructure kernels."""
+
+import os
+import tempfile
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_data import PERIOD_DAYS, generate_stock_matrix
+from benchmarks.timing import measure
+from src.domain.models.entities import Branch, Product
+from src.domain.models.scenario import Scenario
+from src.domain.services.calculations.scenario_calculator import (
+    evaluate_scenarios
+)
+from src.domain.services.classification.product_classifier import (
+    classify_product_type
+)
+from src.domain.services.distribution_service import DistributionEngine
+from src.domain.services.inventory.stock_calculator import StockCalculator
+from src.domain.services.priority_service import PriorityCalculator
+from src.infrastructure.excel.formatter import save_formatted_excel
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def run_kernel_benchmarks(
+    product_count: int, branch_count: int, seed: int = 42, repeat: int = 3
+) -> Dict[str, dict]:
+    """Times every hot kernel on the same synthetic network."""
+    sales, balances = generate_stock_matrix(product_count, branch_count, seed)
+    branches = [Branch(f"branch_{index}") for index in range(branch_count)]
+    products = [
+        Product(f"{index:06d}", f"Product {index:06d} tab")
+        for index in range(product_count)
+    ]
+    stocks = _calculate_stocks(sales, balances)
+    return {
+        "stock_calculator": _strip(measure(
+            lambda: _calculate_stocks(sales, balances), repeat
+        )),
+        "distribution_engine": _strip(measure(
+            lambda: _distribute_all(products, branches, stocks), repeat
+        )),
+        "scenario_sweep": _strip(measure(
+            lambda: _sweep_scenarios(stocks), repeat
+        )),
+        "classify_product_type": _strip(measure(
+            lambda: [classify_product_type(p.name) for p in products], repeat
+        )),
+        "save_formatted_excel": _strip(measure(
+            lambda: _save_excel(products, stocks, branches), repeat
+        ))
+    }
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _strip(measurement: dict) -> dict:
+    """Drops the kernel outcome so only timings are reported."""
+    return {
+        key: value for key, value in measurement.items() if key != "outcome"
+    }
+
+
+def _calculate_stocks(sales, balances) -> List[list]:
+    """Runs StockCalculator over the whole products x branches matrix."""
+    return [
+        [
+            StockCalculator.calculate_stock_level(
+                float(sale), float(balance), PERIOD_DAYS
+            )
+            for sale, balance in zip(sales_row, balances_row)
+        ]
+        for sales_row, balances_row in zip(sales, balances)
+    ]
+
+
+def _distribute_all(products, branches, stocks) -> int:
+    """Distributes every product and returns the transfer count."""
+    engine = DistributionEngine(PriorityCalculator())
+    transfer_count = 0
+    for product, product_stocks in zip(products, stocks):
+        pairs = list(zip(branches, product_stocks))
+        needs = [pair for pair in pairs if pair[1].needed > 0]
+        surpluses = [
+            pair for pair in pairs
+            if pair[1].needed <= 0 and pair[1].surplus > 0
+        ]
+        result = engine.distribute_product(product, needs, surpluses)
+        transfer_count += len(result.transfers)
+    return transfer_count
+
+
+def _sweep_scenarios(stocks) -> list:
+    """Evaluates the baseline plus two what-if scenarios in one batch."""
+    avg_sales = np.array([[stock.avg_sales for stock in row] for row in stocks])
+    balance = np.array([[stock.balance for stock in row] for row in stocks])
+    return evaluate_scenarios(avg_sales, balance, [
+        Scenario("baseline"), Scenario("coverage_30", coverage_days=30),
+        Scenario("half_consumption", consumption_factor=0.5)
+    ])
+
+
+def _save_excel(products, stocks, branches) -> None:
+    """Writes one formatted workbook of the first branch's stock levels."""
+    dataframe = pd.DataFrame([
+        {
+            "code": product.code, "product_name": product.name,
+            "balance": row[0].balance, "needed_quantity": row[0].needed,
+            "surplus_quantity": row[0].surplus
+        }
+        for product, row in zip(products, stocks)
+    ])
+    with tempfile.TemporaryDirectory() as directory:
+        save_formatted_excel(
+            dataframe, os.path.join(directory, f"{branches[0].name}.xlsx")
+        )
@@ -0,0 +1,209 @@
+"""Retained and peak memory benchmarks for the objects of one run."""
+
+import math
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from benchmarks.kernel_benchmarks import _calculate_stocks
+from benchmarks.synthetic_data import generate_stock_matrix
+from src.domain.models.distribution import LogisticsRecord, Transfer
+from src.domain.models.entities import StockLevel
+from src.domain.models.flyweights import EntityRegistry
+from src.domain.services.calculations.quantity_calculator import (
+    calculate_basic_quantities
+)
+from src.shared.constants import (
+    MAX_BALANCE_FOR_NEED_THRESHOLD, MIN_COVERAGE_FOR_SMALL_NEED_SUPPRESSION,
+    MIN_NEED_THRESHOLD, STOCK_COVERAGE_DAYS
+)
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def run_memory_benchmarks(
+    product_count: int, branch_count: int, seed: int = 42
+) -> Dict[str, dict]:
+    """Measures objects held by a run: plain per-row vs slotted interned."""
+    sales, balances = generate_stock_matrix(product_count, branch_count, seed)
+    rows = [
+        [(s.needed, s.surplus, s.balance, s.avg_sales, s.sales) for s in row]
+        for row in _calculate_stocks(sales, balances)
+    ]
+    return {
+        "plain_entities": _measure_retained(lambda: build_run_objects(
+            rows, _PlainProduct, _PlainBranch, _PlainStockLevel,
+            _PlainTransfer, _PlainRecord
+        )),
+        "slotted_interned": _measure_retained(
+            lambda: _build_interned(rows, EntityRegistry())
+        )
+    }
+
+
+def run_allocation_benchmarks(
+    product_count: int, seed: int = 42
+) -> Dict[str, dict]:
+    """Peak memory of one branch's quantity calculation, per chain."""
+    import pandas as pd
+    sales, balances = generate_stock_matrix(product_count, 1, seed)
+    branch_df = pd.DataFrame({
+        'avg_sales': sales[:, 0] / 91.0,
+        'balance': balances[:, 0].astype(float) + 0.5
+    })
+    return {
+        "quantities_pandas_chain": _measure_peak(
+            lambda: reference_basic_quantities(branch_df)
+        ),
+        "quantities_array_chain": _measure_peak(
+            lambda: calculate_basic_quantities(branch_df)
+        )
+    }
+
+
+def reference_basic_quantities(branch_df):
+    """The copy-and-mask chain the array calculation replaced."""
+    dataframe = branch_df.copy()
+    coverage = (dataframe['avg_sales'] * STOCK_COVERAGE_DAYS).apply(
+        lambda x: math.ceil(x)
+    )
+    dataframe['coverage_quantity'] = coverage
+    dataframe['surplus_quantity'] = (dataframe['balance'] - coverage).apply(
+        lambda x: max(0, math.floor(x))
+    )
+    dataframe['needed_quantity'] = (coverage - dataframe['balance']).apply(
+        lambda x: max(0, math.ceil(x))
+    )
+    df = dataframe.copy()
+    df.loc[
+        df['balance'] >= MAX_BALANCE_FOR_NEED_THRESHOLD, 'needed_quantity'
+    ] = 0
+    small_need_mask = (
+        (df['coverage_quantity'] >= MIN_COVERAGE_FOR_SMALL_NEED_SUPPRESSION) &
+        (df['needed_quantity'] > 0) &
+        (df['needed_quantity'] < MIN_NEED_THRESHOLD)
+    )
+    df.loc[small_need_mask, 'needed_quantity'] = 0
+    available_space = (
+        MAX_BALANCE_FOR_NEED_THRESHOLD - df['balance']
+    ).clip(lower=0)
+    df['needed_quantity'] = df['needed_quantity'].clip(upper=available_space)
+    return df
+
+
+def build_run_objects(
+    rows, make_product, make_branch, stock_class, transfer_class,
+    record_class
+) -> list:
+    """Builds the catalog, read-back transfers and logistics records.
+
+    Every transfer and record rebuilds its product and branches from the
+    row, as TransferReader and the surplus factory do.
+    """
+    catalog, transfers, records = [], [], []
+    for index, levels in enumerate(rows):
+        code, name = f"{index:06d}", f"Product {index:06d} tab"
+        catalog.append((
+            make_product(code, name),
+            [stock_class(*level) for level in levels]
+        ))
+        source = max(range(len(levels)), key=lambda column: levels[column][1])
+        for column, level in enumerate(levels):
+            if level[0] <= 0 or column == source:
+                continue
+            transfers.append(transfer_class(
+                make_product(code, name), make_branch(f"branch_{source}"),
+                make_branch(f"branch_{column}"), level[0],
+                levels[source][2], level[2]
+            ))
+            records.append(record_class(
+                make_product(code, name), level[0], f"branch_{column}",
+                'normal', levels[source][2], level[2], 'tablets'
+            ))
+    return [catalog, transfers, records]
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _build_interned(rows, registry: EntityRegistry) -> list:
+    """Builds the run objects from slotted classes and a fresh registry."""
+    return [registry, build_run_objects(
+        rows, registry.product, registry.branch, StockLevel, Transfer,
+        LogisticsRecord
+    )]
+
+
+def _measure_peak(function) -> dict:
+    """Runs function under tracemalloc and reports its peak allocation."""
+    tracemalloc.start()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    function()
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "wall_seconds": round(wall, 6), "cpu_seconds": round(cpu, 6),
+        "peak_bytes": peak
+    }
+
+
+def _measure_retained(function) -> dict:
+    """Runs function under tracemalloc and reports what its result holds."""
+    tracemalloc.start()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    outcome = function()
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del outcome
+    return {
+        "wall_seconds": round(wall, 6), "cpu_seconds": round(cpu, 6),
+        "retained_bytes": retained, "peak_bytes": peak
+    }
+
+
+@dataclass(frozen=True)
+class _PlainProduct:
+    code: str
+    name: str
+    category: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _PlainBranch:
+    name: str
+
+
+@dataclass(frozen=True)
+class _PlainStockLevel:
+    needed: int
+    surplus: int
+    balance: float
+    avg_sales: float
+    sales: float = 0.0
+
+
+@dataclass(frozen=True)
+class _PlainTransfer:
+    product: _PlainProduct
+    from_branch: _PlainBranch
+    to_branch: _PlainBranch
+    quantity: int
+    sender_balance: float = 0.0
+    receiver_balance: float = 0.0
+
+
+@dataclass(frozen=True)
+class _PlainRecord:
+    product: _PlainProduct
+    quantity: int
+    target_branch: str
+    transfer_type: str
+    sender_balance: float
+    receiver_balance: float
+    category: Optional[str] = None
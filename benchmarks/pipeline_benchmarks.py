@@ -0,0 +1,60 @@
+"""End-to-end timing of every pipeline service on a synthetic workbook."""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict
+
+from benchmarks.synthetic_data import generate_workbook
+from benchmarks.timing import measure
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def run_pipeline_benchmarks(
+    product_count: int, branch_count: int, seed: int = 42
+) -> Dict[str, dict]:
+    """Runs ingest to consolidate in an isolated data tree, timing each step."""
+    with _isolated_working_directory():
+        generate_workbook(
+            os.path.join("data", "input", f"synthetic_{product_count}.xlsx"),
+            product_count, branch_count, seed
+        )
+        return _time_full_sequence()
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+@contextmanager
+def _isolated_working_directory():
+    """Switches into a throwaway directory since data paths are relative."""
+    original_directory = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="benchmark_") as directory:
+        os.chdir(directory)
+        try:
+            yield directory
+        finally:
+            os.chdir(original_directory)
+
+
+def _time_full_sequence() -> Dict[str, dict]:
+    """Times each service of the standard sequence on a fresh manager."""
+    from src.application.pipeline.pipeline_config import PipelineConfig
+    from src.application.pipeline.workflow import PipelineManager
+    from src.infrastructure.cache.data_cache import DataSnapshotCache
+
+    DataSnapshotCache().clear()
+    manager = PipelineManager()
+    results = {}
+    for name, arguments in PipelineConfig.get_full_sequence(True):
+        measurement = measure(
+            lambda: manager.run_service(name, **arguments)
+        )
+        measurement["success"] = bool(measurement.pop("outcome"))
+        results[name] = measurement
+    DataSnapshotCache().clear()
+    return results
@@ -0,0 +1,61 @@
+"""Parse time and memory of the consolidated input sheet."""
+
+import os
+import tempfile
+import tracemalloc
+from typing import Dict
+from unittest import mock
+
+from benchmarks.synthetic_data import generate_renamed_csv
+from benchmarks.timing import measure
+from src.infrastructure.repositories.io import stock_reader
+from src.infrastructure.repositories.io.stock_reader import StockReader
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def run_reader_benchmarks(
+    product_count: int, branch_count: int, seed: int = 42, repeat: int = 3
+) -> Dict[str, dict]:
+    """Runs the normalized read of the wide sheet with and without projection.
+
+    Both cases go through StockReader._read_normalized_csv; the full case
+    only widens the column filter to keep every column.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = generate_renamed_csv(
+            os.path.join(directory, "renamed.csv"), product_count,
+            branch_count, seed
+        )
+        reader = StockReader(directory)
+        parse = lambda: reader._read_normalized_csv(path)[0]
+        with mock.patch.object(
+            stock_reader, '_is_input_column', lambda column: True
+        ):
+            full = _measure_parse(parse, repeat)
+        return {
+            "full_parse": full,
+            "projected_parse": _measure_parse(parse, repeat)
+        }
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _measure_parse(parse, repeat: int) -> dict:
+    """Best time of parse, its peak allocation and the frame it keeps."""
+    timing = measure(parse, repeat)
+    dataframe = timing.pop("outcome")
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        **timing,
+        "retained_bytes": int(dataframe.memory_usage(deep=True).sum()),
+        "peak_bytes": peak,
+        "columns": len(dataframe.columns)
+    }
@@ -0,0 +1,76 @@
+"""Persistence and regression comparison of benchmark results."""
+
+import json
+import os
+import platform
+from datetime import datetime
+from typing import Dict, List
+
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def build_report(parameters: dict, sections: Dict[str, dict]) -> dict:
+    """Wraps benchmark sections with run parameters and environment data."""
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "sections": sections
+    }
+
+
+def save_report(report: dict, output_path: str = None) -> str:
+    """Writes a report as JSON and returns its path."""
+    if output_path is None:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = os.path.join(DEFAULT_RESULTS_DIR, f"bench_{stamp}.json")
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    return output_path
+
+
+def load_report(path: str) -> dict:
+    """Reads a previously saved JSON report."""
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def find_regressions(
+    baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD
+) -> List[dict]:
+    """Lists timings whose wall time grew by more than the threshold."""
+    regressions = []
+    for section, entries in current.get("sections", {}).items():
+        baseline_entries = baseline.get("sections", {}).get(section, {})
+        for name, timing in entries.items():
+            previous = baseline_entries.get(name, {}).get("wall_seconds")
+            regression = _compare(section, name, previous, timing, threshold)
+            if regression:
+                regressions.append(regression)
+    return regressions
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _compare(section, name, previous, timing, threshold) -> dict:
+    """Returns a regression record when the slowdown exceeds the threshold."""
+    current_value = timing.get("wall_seconds")
+    if not previous or current_value is None:
+        return None
+    ratio = current_value / previous - 1.0
+    if ratio <= threshold:
+        return None
+    return {
+        "section": section, "name": name,
+        "baseline_seconds": previous, "current_seconds": current_value,
+        "slowdown_ratio": round(ratio, 4)
+    }
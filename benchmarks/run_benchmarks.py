@@ -0,0 +1,139 @@
+"""Command line entry point for the benchmark suite.
+
+Usage:
+    python -m benchmarks --products 2000 --branches 6
+    python -m benchmarks --baseline benchmarks/results/bench_old.json
+    python -m benchmarks --only imports
+    python -m benchmarks --only engine --products 500
+    python -m benchmarks --only solver --branches 12
+    python -m benchmarks --only memory --products 20000
+    python -m benchmarks --only readers --products 50000
+"""
+
+import argparse
+import sys
+from typing import List
+
+from benchmarks.results import (
+    DEFAULT_THRESHOLD, build_report, find_regressions, load_report,
+    save_report
+)
+
+SECTIONS = (
+    "pipeline", "kernels", "engine", "solver", "memory", "readers",
+    "imports"
+)
+
+
+def parse_arguments(arguments: List[str] = None) -> argparse.Namespace:
+    """Parses benchmark command line options."""
+    parser = argparse.ArgumentParser(description="Distribution benchmarks")
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--branches", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", choices=SECTIONS, default=None)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    return parser.parse_args(arguments)
+
+
+def run_sections(options: argparse.Namespace) -> dict:
+    """Runs the selected benchmark sections."""
+    sections = {}
+    if options.only in (None, "pipeline"):
+        from benchmarks.pipeline_benchmarks import run_pipeline_benchmarks
+        sections["pipeline"] = run_pipeline_benchmarks(
+            options.products, options.branches, options.seed
+        )
+    if options.only in (None, "kernels"):
+        from benchmarks.kernel_benchmarks import run_kernel_benchmarks
+        sections["kernels"] = run_kernel_benchmarks(
+            options.products, options.branches, options.seed, options.repeat
+        )
+    if options.only in (None, "engine"):
+        from benchmarks.engine_benchmarks import run_engine_benchmarks
+        sections["engine"] = run_engine_benchmarks(
+            options.products, options.seed, options.repeat
+        )
+    if options.only in (None, "solver"):
+        from benchmarks.engine_benchmarks import run_solver_benchmarks
+        sections["solver"] = run_solver_benchmarks(
+            options.products, options.branches, options.seed, options.repeat
+        )
+    if options.only in (None, "memory"):
+        from benchmarks.memory_benchmarks import (
+            run_allocation_benchmarks, run_memory_benchmarks
+        )
+        sections["memory"] = {
+            **run_memory_benchmarks(
+                options.products, options.branches, options.seed
+            ),
+            **run_allocation_benchmarks(options.products, options.seed)
+        }
+    if options.only in (None, "readers"):
+        from benchmarks.reader_benchmarks import run_reader_benchmarks
+        sections["readers"] = run_reader_benchmarks(
+            options.products, options.branches, options.seed, options.repeat
+        )
+    if options.only in (None, "imports"):
+        from benchmarks.import_benchmarks import run_import_benchmarks
+        sections["imports"] = run_import_benchmarks(options.repeat)
+    return sections
+
+
+def main(arguments: List[str] = None) -> int:
+    """Runs benchmarks, saves JSON and returns 1 when regressions exist."""
+    options = parse_arguments(arguments)
+    parameters = {
+        "products": options.products, "branches": options.branches,
+        "seed": options.seed, "repeat": options.repeat
+    }
+    report = build_report(parameters, run_sections(options))
+    path = save_report(report, options.output)
+    _print_report(report, path)
+    if not options.baseline:
+        return 0
+    regressions = find_regressions(
+        load_report(options.baseline), report, options.threshold
+    )
+    _print_regressions(regressions, options.threshold)
+    return 1 if regressions else 0
+
+
+def _print_report(report: dict, path: str) -> None:
+    """Prints a compact timing table."""
+    for section, entries in report["sections"].items():
+        print(f"\n[{section}]")
+        for name, timing in entries.items():
+            retained = timing.get('retained_bytes')
+            peak = timing.get('peak_bytes')
+            lines = timing.get('transfer_lines')
+            print(
+                f"  {name:<24} wall {timing['wall_seconds']:>9.4f}s"
+                f"  cpu {timing['cpu_seconds']:>9.4f}s"
+                + (f"  held {retained / 2**20:>8.1f} MiB" if retained else "")
+                + (f"  peak {peak / 2**20:>8.1f} MiB" if peak else "")
+                + (f"  lines {lines:>7} (small {timing['small_lines']})"
+                   if lines is not None else "")
+            )
+    print(f"\nResults written to {path}")
+
+
+def _print_regressions(regressions: List[dict], threshold: float) -> None:
+    """Prints every regression above the threshold."""
+    if not regressions:
+        print(f"No regressions above {threshold:.0%}.")
+        return
+    for item in regressions:
+        print(
+            f"REGRESSION {item['section']}/{item['name']}: "
+            f"{item['baseline_seconds']:.4f}s -> "
+            f"{item['current_seconds']:.4f}s "
+            f"(+{item['slowdown_ratio']:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
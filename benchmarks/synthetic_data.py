@@ -0,0 +1,145 @@
+"""Deterministic synthetic workbook generator in the real input layout."""
+
+import os
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+from openpyxl import Workbook
+
+from src.shared.constants import BRANCHES
+from src.infrastructure.converters.mappers.column_mapper import (
+    get_column_mapping
+)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+PRODUCT_FORMS = [
+    'tab', 'capsule', 'injection', 'syrup', 'cream', 'sachet', 'drops', 'gel'
+]
+BASE_HEADERS = ["كود", "إسم الصنف", "سعر البيع", "الشركة", "الوحدة"]
+TOTAL_HEADERS = ["إجمالى المبيعات", "إجمالى رصيد الصنف"]
+PERIOD_DAYS = 91
+PERIOD_END = datetime(2024, 12, 1)
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def get_branch_headers(branch_count: int = len(BRANCHES)) -> List[tuple]:
+    """Returns (sales, balance) Arabic headers for the first N branches."""
+    arabic_by_english = {
+        english: arabic for arabic, english in get_column_mapping().items()
+    }
+    return [
+        (arabic_by_english[f"{branch}_sales"],
+         arabic_by_english[f"{branch}_balance"])
+        for branch in BRANCHES[:_clamp_branch_count(branch_count)]
+    ]
+
+
+def build_period_title(days: int = PERIOD_DAYS) -> str:
+    """Builds the date-range title line found above the real headers."""
+    start = PERIOD_END - timedelta(days=days)
+    return (
+        f"الفترة من {start:%d/%m/%Y %H:%M} "
+        f"إلى {PERIOD_END:%d/%m/%Y %H:%M}"
+    )
+
+
+def generate_stock_matrix(
+    product_count: int, branch_count: int, seed: int = 42
+) -> tuple:
+    """Returns deterministic (sales, balances) arrays of products x branches."""
+    generator = np.random.default_rng(seed)
+    sales = generator.poisson(40, size=(product_count, branch_count))
+    balances = generator.integers(0, 60, size=(product_count, branch_count))
+    return sales, balances
+
+
+def generate_rows(
+    product_count: int, branch_count: int = len(BRANCHES), seed: int = 42
+) -> List[list]:
+    """Generates deterministic product rows matching the header layout."""
+    branch_count = _clamp_branch_count(branch_count)
+    sales, balances = generate_stock_matrix(product_count, branch_count, seed)
+    prices = np.random.default_rng(seed + 1).integers(
+        5, 500, size=product_count
+    )
+    return [
+        _build_row(index, prices[index], sales[index], balances[index])
+        for index in range(product_count)
+    ]
+
+
+def generate_workbook(
+    output_path: str,
+    product_count: int,
+    branch_count: int = len(BRANCHES),
+    seed: int = 42
+) -> str:
+    """Writes a synthetic input workbook and returns its path."""
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Sheet1")
+    worksheet.append([build_period_title()])
+    worksheet.append(_build_headers(branch_count))
+    for row in generate_rows(product_count, branch_count, seed):
+        worksheet.append(row)
+    workbook.save(output_path)
+    return output_path
+
+
+def generate_renamed_csv(
+    output_path: str,
+    product_count: int,
+    branch_count: int = len(BRANCHES),
+    seed: int = 42
+) -> str:
+    """Writes the renamed (English header) CSV that StockReader loads."""
+    import pandas as pd
+    mapping = get_column_mapping()
+    headers = [mapping.get(header, header) for header in _build_headers(
+        branch_count
+    )]
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8-sig', newline='') as handle:
+        handle.write(build_period_title() + '\n')
+        pd.DataFrame(
+            generate_rows(product_count, branch_count, seed), columns=headers
+        ).to_csv(handle, index=False, lineterminator='\n')
+    return output_path
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _clamp_branch_count(branch_count: int) -> int:
+    """Limits branch count to the branches known by the column mapping."""
+    return max(1, min(branch_count, len(BRANCHES)))
+
+
+def _build_headers(branch_count: int) -> List[str]:
+    """Builds the full Arabic header row."""
+    headers = list(BASE_HEADERS) + list(TOTAL_HEADERS)
+    for sales_header, balance_header in get_branch_headers(branch_count):
+        headers.extend([sales_header, balance_header])
+    return headers
+
+
+def _build_row(index: int, price, sales, balances) -> list:
+    """Builds one product row with totals and per-branch pairs."""
+    form = PRODUCT_FORMS[index % len(PRODUCT_FORMS)]
+    row = [
+        f"{index + 1:06d}", f"Product {index:06d} {form}", int(price),
+        f"Company {index % 37}", "Box",
+        int(sales.sum()), int(balances.sum())
+    ]
+    for branch_sales, branch_balance in zip(sales, balances):
+        row.extend([int(branch_sales), int(branch_balance)])
+    return row
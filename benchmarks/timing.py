@@ -0,0 +1,20 @@
+"""Timing helpers shared by all benchmark modules."""
+
+import time
+from typing import Callable
+
+
+def measure(function: Callable, repeat: int = 1) -> dict:
+    """Runs a callable and returns its best wall and CPU time in seconds."""
+    best_wall, best_cpu, outcome = float("inf"), float("inf"), None
+    for _ in range(max(1, repeat)):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        outcome = function()
+        best_wall = min(best_wall, time.perf_counter() - wall_start)
+        best_cpu = min(best_cpu, time.process_time() - cpu_start)
+    return {
+        "wall_seconds": round(best_wall, 6),
+        "cpu_seconds": round(best_cpu, 6),
+        "outcome": outcome
+    }
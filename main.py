@@ -23,7 +23,7 @@ def run_cli():
     
     setup_logging()
     
-    args = sys.argv[1:]
+    args = _configure_profiling(sys.argv[1:])
     use_latest = "--latest" in args
     
     # CASE 1: Isolated step execution via --step flag
@@ -40,7 +40,7 @@ def run_cli():
                 print(f"Error: Step {step_id} not found.")
                 return
         except (IndexError, ValueError):
-            print("Usage: python main.py --step <id> [--latest]")
+            print("Usage: python main.py --step <id> [--latest] [--profile cpu|mem]")
             return
 
     # CASE 2: Positional step ID (Defaults to dependency-aware execution like the menu)
@@ -63,6 +63,19 @@ def run_cli():
     run_menu()
 
 
+def _configure_profiling(args: list) -> list:
+    """Enables --profile [cpu|mem] and returns the remaining arguments."""
+    if "--profile" not in args:
+        return args
+    from src.shared.utility.profiling import PROFILE_MODES, set_profile_mode
+    index = args.index("--profile")
+    has_mode = index + 1 < len(args) and args[index + 1] in PROFILE_MODES
+    mode = args[index + 1] if has_mode else "cpu"
+    set_profile_mode(mode)
+    print(f"--- [CLI] Profiling enabled ({mode}) -> data/logs/profiles ---")
+    return args[:index] + args[index + (2 if has_mode else 1):]
+
+
 if __name__ == "__main__":
     if "--gui" in sys.argv:
         run_gui()
@@ -1,25 +1,59 @@
 """Factory for creating data repositories with standard configurations."""
 
+from src.application.ports.repository import DataRepository
 from src.infrastructure.repositories.base.pandas_repository import PandasDataRepository
 from src.shared.config.paths import (
     RENAMED_CSV_DIR, ANALYTICS_DIR, SURPLUS_DIR, 
     SHORTAGE_DIR, TRANSFERS_CSV_DIR, TRANSFERS_ROOT_DIR,
-    SALES_REPORT_DIR
+    SALES_REPORT_DIR, REPOSITORY_DATABASE_PATH, SCENARIO_DIR
 )
+from src.shared.constants import REPOSITORY_BACKEND
 
 
 class RepositoryFactory:
     """Centralizes repository initialization logic."""
 
+    @staticmethod
+    def create_repository(backend: str = None) -> DataRepository:
+        """Creates the repository for a backend name ("pandas" or "sqlite")."""
+        backend = backend or REPOSITORY_BACKEND
+        if backend == "sqlite":
+            return RepositoryFactory.create_sqlite_repository()
+        if backend == "pandas":
+            return RepositoryFactory.create_pandas_repository()
+        raise ValueError(f"Unknown repository backend: {backend}")
+
     @staticmethod
     def create_pandas_repository() -> PandasDataRepository:
         """Creates a PandasDataRepository with default path configuration."""
-        return PandasDataRepository(
+        return PandasDataRepository(**RepositoryFactory._default_paths())
+
+    @staticmethod
+    def create_sqlite_repository(database_path: str = None) -> DataRepository:
+        """Creates SQLite tables paired with the default output tree."""
+        from src.infrastructure.repositories.base.composite_repository import (
+            CompositeDataRepository
+        )
+        from src.infrastructure.repositories.base.sqlite_repository import (
+            SqliteDataRepository
+        )
+        store = SqliteDataRepository(
+            database_path or REPOSITORY_DATABASE_PATH, RENAMED_CSV_DIR
+        )
+        return CompositeDataRepository(
+            store, RepositoryFactory.create_pandas_repository()
+        )
+
+    @staticmethod
+    def _default_paths() -> dict:
+        """Returns the standard directory configuration."""
+        return dict(
             input_dir=RENAMED_CSV_DIR,
             output_dir=TRANSFERS_ROOT_DIR,
             surplus_dir=SURPLUS_DIR,
             shortage_dir=SHORTAGE_DIR,
             analytics_dir=ANALYTICS_DIR,
             transfers_dir=TRANSFERS_CSV_DIR,
-            sales_analysis_dir=SALES_REPORT_DIR
+            sales_analysis_dir=SALES_REPORT_DIR,
+            scenario_dir=SCENARIO_DIR
         )
@@ -8,18 +8,7 @@ from src.shared.config.paths import (
     TRANSFERS_ROOT_DIR
 )
 
-# Use Case Imports
-from src.application.use_cases.archive_data import ArchiveData
-from src.application.use_cases.ingest_data import IngestData
-from src.application.use_cases.validate_inventory import ValidateInventory
-from src.application.use_cases.analyze_sales import AnalyzeSales
-from src.application.use_cases.normalize_schema import NormalizeSchema
-from src.application.use_cases.segment_branches import SegmentBranches
-from src.application.use_cases.optimize_transfers import OptimizeTransfers
-from src.application.use_cases.classify_transfers import ClassifyTransfers
-from src.application.use_cases.report_surplus import ReportSurplus
-from src.application.use_cases.report_shortage import ReportShortage
-from src.application.use_cases.consolidate_transfers import ConsolidateTransfers
+from src.application.pipeline.service_registry import lazy_use_case
 
 
 class PipelineConfig:
@@ -28,18 +17,44 @@ class PipelineConfig:
     @staticmethod
     def initialize_services(repository) -> dict:
         """Connects all use cases with the shared data repository."""
+        factories = PipelineConfig.define_service_factories(
+            lambda: repository
+        )
+        return {name: build() for name, build in factories.items()}
+
+    @staticmethod
+    def define_service_factories(repository_provider) -> dict:
+        """Maps each service to a builder that imports its use case lazily."""
         return {
-            "archive": ArchiveData(), 
-            "ingest": IngestData(),
-            "validate": ValidateInventory(), 
-            "analyze": AnalyzeSales(),
-            "normalize": NormalizeSchema(), 
-            "segment": SegmentBranches(repository),
-            "optimize": OptimizeTransfers(repository), 
-            "classify": ClassifyTransfers(repository),
-            "report_surplus": ReportSurplus(repository), 
-            "report_shortage": ReportShortage(repository),
-            "consolidate": ConsolidateTransfers(repository)
+            "archive": lazy_use_case("archive_data", "ArchiveData"),
+            "ingest": lazy_use_case("ingest_data", "IngestData"),
+            "validate": lazy_use_case(
+                "validate_inventory", "ValidateInventory"
+            ),
+            "analyze": lazy_use_case("analyze_sales", "AnalyzeSales"),
+            "normalize": lazy_use_case("normalize_schema", "NormalizeSchema"),
+            "segment": lazy_use_case(
+                "segment_branches", "SegmentBranches", repository_provider
+            ),
+            "optimize": lazy_use_case(
+                "optimize_transfers", "OptimizeTransfers", repository_provider
+            ),
+            "classify": lazy_use_case(
+                "classify_transfers", "ClassifyTransfers", repository_provider
+            ),
+            "report_surplus": lazy_use_case(
+                "report_surplus", "ReportSurplus", repository_provider
+            ),
+            "report_shortage": lazy_use_case(
+                "report_shortage", "ReportShortage", repository_provider
+            ),
+            "consolidate": lazy_use_case(
+                "consolidate_transfers", "ConsolidateTransfers",
+                repository_provider
+            ),
+            "scenarios": lazy_use_case(
+                "sweep_scenarios", "SweepScenarios", repository_provider
+            )
         }
 
     @staticmethod
@@ -71,7 +86,8 @@ class PipelineConfig:
             "normalize": ["ingest"], "segment": ["normalize"],
             "optimize": ["segment"], "classify": ["optimize"],
             "report_surplus": ["segment"], "report_shortage": ["segment"],
-            "consolidate": ["optimize", "report_surplus"]
+            "consolidate": ["optimize", "report_surplus"],
+            "scenarios": ["segment"]
         }
 
     @staticmethod
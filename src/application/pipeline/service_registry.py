@@ -0,0 +1,47 @@
+"""Lazily populated registry of pipeline use case instances."""
+
+import importlib
+import threading
+from typing import Callable, Dict, List
+
+
+class LazyServiceRegistry(dict):
+    """Dictionary of services that builds each one on first access."""
+
+    def __init__(self, factories: Dict[str, Callable]):
+        super().__init__()
+        self._factories = factories
+        self._lock = threading.Lock()
+
+    def __missing__(self, name: str):
+        """Builds, stores and returns a service the first time it is used."""
+        if name not in self._factories:
+            raise KeyError(name)
+        with self._lock:
+            if not dict.__contains__(self, name):
+                self[name] = self._factories[name]()
+            return dict.__getitem__(self, name)
+
+    def __contains__(self, name) -> bool:
+        """A service is known when it is built or has a factory."""
+        return dict.__contains__(self, name) or name in self._factories
+
+    def names(self) -> List[str]:
+        """Returns all registered service names without building them."""
+        extra = [name for name in self.keys() if name not in self._factories]
+        return list(self._factories) + extra
+
+
+def lazy_use_case(
+    module_name: str, class_name: str, repository_provider: Callable = None
+) -> Callable:
+    """Returns a factory that imports and instantiates a use case on call."""
+    def build():
+        module = importlib.import_module(
+            f"src.application.use_cases.{module_name}"
+        )
+        use_case = getattr(module, class_name)
+        if repository_provider is None:
+            return use_case()
+        return use_case(repository_provider())
+    return build
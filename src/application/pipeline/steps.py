@@ -1,8 +1,35 @@
+"""Pipeline step metadata with lazily created execution services.
+
+Importing this module is cheap: the PipelineManager (and with it the
+repository, every use case, pandas and openpyxl) is only built the first
+time a step function is actually called.
+"""
+
+from typing import Callable
 from src.domain.models.step import Step
-from src.application.pipeline.workflow import PipelineManager
 
-# Initialize the manager once
-manager = PipelineManager()
+_manager = None
+
+
+def get_manager():
+    """Returns the shared PipelineManager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        from src.application.pipeline.workflow import PipelineManager
+        _manager = PipelineManager()
+    return _manager
+
+
+def _service_runner(service_name: str, forward_latest: bool = True) -> Callable:
+    """Builds a step function that runs a service on the shared manager."""
+    def run(use_latest_file=None):
+        if not forward_latest:
+            return get_manager().run_service(service_name)
+        return get_manager().run_service(
+            service_name, use_latest_file=use_latest_file
+        )
+    return run
+
 
 # Available steps definition, now mapped to Domain Services
 AVAILABLE_STEPS = [
@@ -10,86 +37,66 @@ AVAILABLE_STEPS = [
         id="1",
         name="Data Archiving",
         description="Archive and clear previous output data",
-        function=lambda use_latest_file=None: manager.run_service("archive")
+        function=_service_runner("archive", forward_latest=False)
     ),
     Step(
         id="2",
         name="Source Ingestion",
         description="Convert raw Excel input to CSV format",
-        function=lambda use_latest_file=None: manager.run_service(
-            "ingest", use_latest_file=use_latest_file
-        )
+        function=_service_runner("ingest")
     ),
     Step(
         id="3",
         name="Inventory Validation",
         description="Validate data integrity and business rules",
-        function=lambda use_latest_file=None: manager.run_service(
-            "validate", use_latest_file=use_latest_file
-        )
+        function=_service_runner("validate")
     ),
     Step(
         id="4",
         name="Sales Analytics",
         description="Generate sales intelligence and performance reports",
-        function=lambda use_latest_file=None: manager.run_service(
-            "analyze", use_latest_file=use_latest_file
-        )
+        function=_service_runner("analyze")
     ),
     Step(
         id="5",
         name="Schema Normalization",
         description="Standardize column headers and data formats",
-        function=lambda use_latest_file=None: manager.run_service(
-            "normalize", use_latest_file=use_latest_file
-        )
+        function=_service_runner("normalize")
     ),
     Step(
         id="6",
         name="Branch Segmentation",
         description="Partition global data into branch-specific datasets",
-        function=lambda use_latest_file=None: manager.run_service(
-            "segment", use_latest_file=use_latest_file
-        )
+        function=_service_runner("segment")
     ),
     Step(
         id="7",
         name="Transfer Optimization",
         description="Calculate optimal stock movements between branches",
-        function=lambda use_latest_file=None: manager.run_service(
-            "optimize", use_latest_file=use_latest_file
-        )
+        function=_service_runner("optimize")
     ),
     Step(
         id="8",
         name="Transfer Classification",
         description="Group transfers by category and convert to Excel",
-        function=lambda use_latest_file=None: manager.run_service(
-            "classify", use_latest_file=use_latest_file
-        )
+        function=_service_runner("classify")
     ),
     Step(
         id="9",
         name="Surplus Reporting",
         description="Report excess inventory with no local demand",
-        function=lambda use_latest_file=None: manager.run_service(
-            "report_surplus", use_latest_file=use_latest_file
-        )
+        function=_service_runner("report_surplus")
     ),
     Step(
         id="10",
         name="Shortage Reporting",
         description="Identify and report network-wide inventory gaps",
-        function=lambda use_latest_file=None: manager.run_service(
-            "report_shortage", use_latest_file=use_latest_file
-        )
+        function=_service_runner("report_shortage")
     ),
     Step(
         id="11",
         name="Consolidated Reporting",
         description="Merge transfers and surplus into final logistics files",
-        function=lambda use_latest_file=None: manager.run_service(
-            "consolidate", use_latest_file=use_latest_file
-        )
+        function=_service_runner("consolidate")
     )
 ]
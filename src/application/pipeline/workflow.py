@@ -4,26 +4,35 @@ import os
 from datetime import datetime
 from typing import Dict, Optional
 from src.shared.utility.logging_utils import get_logger
-from src.infrastructure.repositories.base.pandas_repository import (
-    PandasDataRepository
-)
 from src.shared.config.paths import (
     RENAMED_CSV_DIR, ANALYTICS_DIR, SURPLUS_DIR, 
     SHORTAGE_DIR, TRANSFERS_CSV_DIR, TRANSFERS_ROOT_DIR
 )
 from src.domain.models.pipeline import StepResult, PipelineState
 from src.domain.exceptions.pipeline_exceptions import PrerequisiteNotFoundError
-from src.shared.utility.telemetry import execution_timer
+from src.shared.utility.telemetry import (
+    execution_timer, telemetry_span, start_run, finish_run,
+    get_current_run, save_run
+)
+from src.shared.utility.profiling import profile_block
+from src.shared.constants import TELEMETRY_TRACE_MEMORY
 from src.application.pipeline.pipeline_config import PipelineConfig
+from src.application.pipeline.service_registry import LazyServiceRegistry
 logger = get_logger(__name__)
 
 class PipelineManager:
-    """Orchestrates use cases with performance tracking."""
+    """Orchestrates use cases with performance tracking.
+
+    The repository and each use case are built on first use, so creating
+    a manager does not import pandas or touch the filesystem.
+    """
 
     def __init__(self, repository=None):
-        self._repository = repository or self._create_default_repository()
+        self._repository = repository
         self._config = PipelineConfig()
-        self._services = self._config.initialize_services(self._repository)
+        self._services = LazyServiceRegistry(
+            self._config.define_service_factories(self._get_repository)
+        )
         self._contracts = self._config.define_contracts()
         self._dependencies = self._config.define_dependencies()
         self._history: Dict[str, StepResult] = {}
@@ -31,17 +40,38 @@ class PipelineManager:
     def run_all(self, use_latest_file: bool = None) -> bool:
         """Executes the complete distribution sequence in order."""
         sequence = self._config.get_full_sequence(use_latest_file)
-        for name, args in sequence:
-            if not self.run_service(name, **args):
-                return False
-        return True
+        owns_run = self._begin_telemetry_run()
+        if owns_run:
+            self._reset_run_caches()
+        try:
+            for name, args in sequence:
+                if not self.run_service(name, **args):
+                    return False
+            return True
+        finally:
+            self._end_telemetry_run(owns_run)
 
     def run_service(self, service_name: str, **kwargs) -> bool:
-        """Executes a service with timing and rescue logic."""
+        """Executes a service with timing, telemetry and rescue logic."""
+        owns_run = self._begin_telemetry_run()
+        if owns_run:
+            self._reset_run_caches()
+        try:
+            return self._run_service_guarded(service_name, **kwargs)
+        finally:
+            self._end_telemetry_run(owns_run)
+
+    def _run_service_guarded(self, service_name: str, **kwargs) -> bool:
+        """Runs one service, rescuing missing prerequisites."""
         try:
             self._resolve_prerequisites(service_name, **kwargs)
-            with execution_timer(service_name):
-                success = self._services[service_name].execute(**kwargs)
+            try:
+                with execution_timer(service_name), telemetry_span(
+                    service_name, kind="service"
+                ), profile_block(service_name):
+                    success = self._services[service_name].execute(**kwargs)
+            finally:
+                self._invalidate_output_index()
             self._record_result(service_name, success, "Success")
             return success
         except PrerequisiteNotFoundError as error:
@@ -52,7 +82,7 @@ class PipelineManager:
     def get_workflow_state(self) -> PipelineState:
         """Returns the current collective health of the pipeline."""
         results = {}
-        for name in self._services:
+        for name in self._services.names():
             is_present = self._is_data_present(name)
             if is_present:
                 results[name] = StepResult(
@@ -87,11 +117,51 @@ class PipelineManager:
             return False
         return self.run_service(name, **kwargs)
 
+    def _begin_telemetry_run(self) -> bool:
+        """Starts a telemetry run unless one is already collecting."""
+        if get_current_run() is not None:
+            return False
+        start_run(trace_memory=TELEMETRY_TRACE_MEMORY)
+        return True
+
+    def _end_telemetry_run(self, owns_run: bool) -> None:
+        """Stores the span tree of a run this call started."""
+        if owns_run:
+            run = finish_run()
+            if run and run.spans:
+                save_run(run)
+
+    def _reset_run_caches(self) -> None:
+        """Drops lookup tables filled by the previous run."""
+        from src.domain.models.flyweights import get_entity_registry
+        from src.domain.models.product_dictionary import (
+            start_product_dictionary
+        )
+        from src.domain.services.product_ordering import (
+            get_product_sort_index
+        )
+        get_product_sort_index().clear()
+        get_entity_registry().clear()
+        start_product_dictionary()
+
+    def _invalidate_output_index(self) -> None:
+        """Forgets cached output listings after a service may have written."""
+        from src.infrastructure.cache.directory_index import (
+            DirectoryIndexCache
+        )
+        DirectoryIndexCache().invalidate()
+
     def _record_result(self, name: str, success: bool, message: str) -> None:
         """Stores the outcome of a service execution in history."""
         self._history[name] = StepResult(name, success, datetime.now(), message)
 
-    def _create_default_repository(self) -> PandasDataRepository:
+    def _get_repository(self):
+        """Returns the repository, creating the default one on first use."""
+        if self._repository is None:
+            self._repository = self._create_default_repository()
+        return self._repository
+
+    def _create_default_repository(self):
         """Initializes the standard repository for the manager."""
         from src.application.factories.repository_factory import RepositoryFactory
-        return RepositoryFactory.create_pandas_repository()
+        return RepositoryFactory.create_repository()
@@ -1,7 +1,7 @@
 """Interfaces for data persistence."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from src.domain.models.entities import (
     Product, Branch, StockLevel, ConsolidatedStock, BranchStock
 )
@@ -37,6 +37,21 @@ class DataRepository(ABC):
         """Load stock levels (needed, surplus, etc.) for a specific branch."""
         pass
 
+    def load_product_fingerprints(self) -> Dict[str, str]:
+        """Map product codes to input row hashes ({} if unsupported)."""
+        return {}
+
+    def load_products_by_code(self, codes: Set[str]) -> List[Product]:
+        """Load only the products with the given codes."""
+        return [p for p in self.load_products() if p.code in codes]
+
+    def load_stock_levels_by_code(
+        self, branch: Branch, codes: Set[str]
+    ) -> Dict[str, StockLevel]:
+        """Load stock levels of only the given product codes."""
+        levels = self.load_stock_levels(branch)
+        return {code: levels[code] for code in codes if code in levels}
+
     @abstractmethod
     def save_transfers(self, transfers: List[Transfer]) -> None:
         """Persist generated transfers."""
@@ -78,6 +93,13 @@ class DataRepository(ABC):
         """Save combined transfers (merged and separate) with formatting."""
         pass
 
+    @abstractmethod
+    def save_scenario_comparison(
+        self, summary_rows: List[Dict], product_rows: List[Dict]
+    ) -> None:
+        """Save side-by-side what-if scenario comparisons."""
+        pass
+
     @abstractmethod
     def list_outputs(
         self, category_name: str, branch_name_filter: Optional[str] = None
@@ -2,6 +2,7 @@
 
 import os
 from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import file_span, telemetry_span
 from src.domain.services.analysis.sales_analyzer import analyze_csv_data
 from src.shared.reporting.report_generator import generate_report
 from src.infrastructure.adapters.file_selector import FileSelectorService
@@ -35,7 +36,8 @@ class AnalyzeSales:
     def _run_analysis_safely(self, csv_path: str, filename: str) -> bool:
         """Runs domain analysis logic and handles potential failures."""
         try:
-            results = analyze_csv_data(csv_path)
+            with telemetry_span("compute"):
+                results = analyze_csv_data(csv_path)
             
             # Save results to CSV (Standardize with 'csv' subfolder)
             from src.shared.config.paths import SALES_REPORT_DIR
@@ -58,8 +60,10 @@ class AnalyzeSales:
             if 'date_range' in df.columns:
                 df['date_range'] = df['date_range'].apply(lambda x: str(x) if x else "")
                 
-            df.to_csv(csv_report_path, index=False, encoding='utf-8-sig')
-            df.to_excel(excel_report_path, index=False)
+            with file_span(csv_report_path):
+                df.to_csv(csv_report_path, index=False, encoding='utf-8-sig')
+            with file_span(excel_report_path):
+                df.to_excel(excel_report_path, index=False)
             
             logger.info("Saved analysis reports: CSV=%s, Excel=%s", csv_report_path, excel_report_path)
 
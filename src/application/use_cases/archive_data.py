@@ -2,11 +2,22 @@
 
 from src.shared.utility.archiver import (
     archive_all_output, 
-    clear_output_directory
+    clear_output_directory,
+    archive_output_streaming,
+    swap_out_directory,
+    remove_retired_directories,
+    store_output
+)
+from src.infrastructure.repositories.metadata.artifact_manifest import (
+    prune_manifest
 )
 from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import telemetry_span
 from src.shared.utility.file_handler import has_files_in_directory
-from src.shared.config.paths import OUTPUT_DIR, ARCHIVE_DIR
+from src.shared.config.paths import (
+    OUTPUT_DIR, ARCHIVE_DIR, ARCHIVE_STORE_DIR
+)
+from src.shared.constants import ARCHIVE_MODE, ARCHIVE_READ_WORKERS
 
 logger = get_logger(__name__)
 
@@ -17,15 +28,24 @@ class ArchiveData:
     def __init__(self):
         self._output_directory = OUTPUT_DIR
         self._archive_base_directory = ARCHIVE_DIR
+        self._archive_store_directory = ARCHIVE_STORE_DIR
 
     def execute(self, **kwargs) -> bool:
         """Archivates previous output files if they exist."""
         try:
+            remove_retired_directories(self._output_directory)
             if not has_files_in_directory(self._output_directory):
                 logger.info("No previous output to archive. Starting fresh...")
                 return True
             
-            return self._perform_archiving_and_cleanup()
+            if ARCHIVE_MODE == "store":
+                archived = self._perform_store_archive()
+            elif ARCHIVE_MODE == "stream":
+                archived = self._perform_streaming_archive()
+            else:
+                archived = self._perform_archiving_and_cleanup()
+            prune_manifest()
+            return archived
         except Exception as error:
             logger.exception(f"ArchiveData use case failed: {error}")
             return False
@@ -34,19 +54,51 @@ class ArchiveData:
         """Handles the sequence of archiving data and clearing the output."""
         logger.info("Archiving previous output files...")
         
-        archive_result = archive_all_output(
-            archive_base_dir=self._archive_base_directory, 
-            create_zip=True
-        )
+        with telemetry_span("persist"):
+            archive_result = archive_all_output(
+                archive_base_dir=self._archive_base_directory, 
+                create_zip=True
+            )
         
-        if archive_result.get('zip_path'):
-            logger.info("✓ Output archived to:\n%s", archive_result["zip_path"])
+        if archive_result.get('zip_file'):
+            logger.info("✓ Output archived to:\n%s", archive_result["zip_file"])
         
         return self._clear_output_safely()
 
+    def _perform_streaming_archive(self) -> bool:
+        """Zips output in one pass, then swaps the output tree out."""
+        logger.info("Archiving previous output files...")
+        with telemetry_span("persist"):
+            archive_result = archive_output_streaming(
+                self._output_directory, self._archive_base_directory,
+                workers=ARCHIVE_READ_WORKERS
+            )
+        logger.info("✓ Output archived to:\n%s", archive_result["zip_file"])
+        return self._swap_output_out()
+
+    def _perform_store_archive(self) -> bool:
+        """Stores changed output blobs plus a run manifest, then swaps out."""
+        logger.info("Archiving previous output files...")
+        with telemetry_span("persist"):
+            archive_result = store_output(
+                self._output_directory, self._archive_store_directory
+            )
+        logger.info("✓ Output archived to:\n%s", archive_result["manifest"])
+        return self._swap_output_out()
+
+    def _swap_output_out(self) -> bool:
+        """Swaps the output tree out, falling back to a file-by-file clear."""
+        with telemetry_span("cleanup"):
+            swapped = swap_out_directory(self._output_directory)
+        if swapped:
+            logger.info("✓ Output directory cleared successfully")
+            return True
+        return self._clear_output_safely()
+
     def _clear_output_safely(self) -> bool:
         """Clears the output directory and logs any issues."""
-        clear_success = clear_output_directory(self._output_directory)
+        with telemetry_span("cleanup"):
+            clear_success = clear_output_directory(self._output_directory)
         if clear_success:
             logger.info("✓ Output directory cleared successfully")
         else:
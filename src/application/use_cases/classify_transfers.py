@@ -3,6 +3,7 @@
 import os
 from src.application.ports.repository import DataRepository
 from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import telemetry_span
 
 logger = get_logger(__name__)
 
@@ -23,7 +24,9 @@ class ClassifyTransfers:
         Loads transfers from the repository and saves them split by category.
         """
         try:
-            transfers_list = self._repository.load_transfers()
+            with telemetry_span("load") as span:
+                transfers_list = self._repository.load_transfers()
+                span.record_rows(rows_out=len(transfers_list or []))
             if not transfers_list:
                 logger.warning("No transfers found to classify.")
                 return True
@@ -31,10 +34,12 @@ class ClassifyTransfers:
             logger.info("Classifying %d transfers by category...", len(transfers_list))
             
             # The repository handles the actual splitting and saving logic
-            self._repository.save_split_transfers(
-                transfers_list=transfers_list,
-                excel_directory=self._excel_output_directory
-            )
+            with telemetry_span("persist") as span:
+                self._repository.save_split_transfers(
+                    transfers_list=transfers_list,
+                    excel_directory=self._excel_output_directory
+                )
+                span.record_rows(rows_in=len(transfers_list))
             
             logger.info("✓ Transfer classification completed successfully")
             return True
@@ -1,7 +1,9 @@
 from datetime import datetime
 from src.domain.services.branches.config import get_branches
 from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import bind_run, telemetry_span
 from src.domain.models.entities import Branch
+from src.domain.models.flyweights import intern_branch
 from src.application.ports.repository import DataRepository
 from src.domain.services.model_factory import DomainModelFactory
 from src.domain.services.consolidation_service import ConsolidationEngine
@@ -32,23 +34,33 @@ class ConsolidateTransfers:
 
     def execute_for_branch(self, branch: Branch, timestamp: str) -> tuple:
         """Executes the consolidation logic for a specific branch."""
-        transfers, surplus_raw = self._load_branch_input_data(branch)
-        if not transfers and not surplus_raw:
-            return 0, 0
+        with telemetry_span(branch.name, kind="branch"):
+            with telemetry_span("load") as span:
+                transfers, surplus_raw = self._load_branch_input_data(branch)
+                span.record_rows(rows_out=len(transfers) + len(surplus_raw))
+            if not transfers and not surplus_raw:
+                return 0, 0
 
+            with telemetry_span("compute"):
+                merged, separate = self._build_payloads(
+                    branch, transfers, surplus_raw
+                )
+            with telemetry_span("persist"):
+                self._save_results(branch, merged, separate, timestamp)
+            return len(merged), len(separate)
+
+    def _build_payloads(self, branch, transfers, surplus_raw) -> tuple:
+        """Combines transfers and surplus into merged/separate payloads."""
         network_state = self._factory.create_network_state(
-            [Branch(n) for n in get_branches()], 
+            [intern_branch(n) for n in get_branches()], 
             self._repository.load_stock_levels
         )
         surplus_entries = self._factory.create_surplus_entries(surplus_raw, branch)
         
-        report = self._engine.combine_data(
+        records = self._engine.combine_columns(
             branch, transfers, surplus_entries, network_state
         )
-        merged, separate = self._presenter.prepare_payloads(report)
-        
-        self._save_results(branch, merged, separate, timestamp)
-        return len(merged), len(separate)
+        return self._presenter.prepare_table_payloads(records)
 
     def _process_all_branches(self, timestamp: str) -> tuple:
         """Iterates through all branches in parallel to consolidate data."""
@@ -56,9 +68,10 @@ class ConsolidateTransfers:
         merged_total = 0
         separate_total = 0
         
+        execute = bind_run(self.execute_for_branch)
         with ThreadPoolExecutor() as executor:
             futures = [
-                executor.submit(self.execute_for_branch, Branch(name), timestamp)
+                executor.submit(execute, intern_branch(name), timestamp)
                 for name in get_branches()
             ]
             for future in futures:
@@ -2,6 +2,7 @@
 
 import os
 from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import file_span
 from src.shared.utility.file_handler import ensure_directory_exists
 from src.infrastructure.converters.converters.excel_to_csv import convert_excel_to_csv
 from src.infrastructure.adapters.file_selector import FileSelectorService
@@ -30,7 +31,8 @@ class IngestData:
         output_path = self._get_output_path(excel_filename)
 
         logger.info("Ingesting %s -> %s", excel_filename, output_path)
-        success = convert_excel_to_csv(input_path, output_path)
+        with file_span(output_path):
+            success = convert_excel_to_csv(input_path, output_path)
         
         self._log_result(success, excel_filename, output_path)
         return success
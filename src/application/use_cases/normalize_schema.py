@@ -4,6 +4,7 @@ import os
 import re
 from datetime import datetime
 from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import file_span
 from src.shared.utility.file_handler import ensure_directory_exists
 from src.infrastructure.converters.converters.csv_column_renamer import (
     rename_csv_columns
@@ -50,7 +51,8 @@ class NormalizeSchema:
     def _perform_normalization(self, input_path: str, output_path: str) -> bool:
         """Calls the domain service to rename columns and log success."""
         try:
-            rename_csv_columns(input_path, output_path)
+            with file_span(output_path):
+                rename_csv_columns(input_path, output_path)
             logger.info("✓ Data normalization completed successfully")
             return True
         except Exception as error:
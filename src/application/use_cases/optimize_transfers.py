@@ -1,13 +1,19 @@
+import hashlib
+import os
+import sys
+from functools import lru_cache
 from typing import List, Tuple
 from src.domain.models.entities import (
     Branch, Product, StockLevel, NetworkStockState
 )
 from src.domain.models.distribution import DistributionResult
+from src.domain.models.product_dictionary import get_product_dictionary
 from src.domain.services.distribution_service import DistributionEngine
 from src.domain.services.priority_service import PriorityCalculator
 from src.application.ports.repository import DataRepository
 from src.domain.services.model_factory import DomainModelFactory
 from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import telemetry_span
 
 logger = get_logger(__name__)
 
@@ -15,16 +21,22 @@ logger = get_logger(__name__)
 class OptimizeTransfers:
     """Orchestrates the process of determining optimal stock movements."""
 
-    def __init__(self, repository: DataRepository, engine=None):
+    def __init__(
+        self, repository: DataRepository, engine=None, state=None,
+        solver: str = None
+    ):
         self._repository = repository
-        self._engine = engine or DistributionEngine(PriorityCalculator())
+        self._state = state or self._default_state(engine)
+        self._engine = engine or self._default_engine(solver)
         self._factory = DomainModelFactory()
 
     def execute(self, **kwargs) -> List[DistributionResult]:
         """Runs the distribution optimization process and persists transfers."""
         try:
             results = self.calculate()
-            self.save(results)
+            with telemetry_span("persist") as span:
+                self.save(results)
+                span.record_rows(rows_in=len(results))
             logger.info("✓ Transfer optimization completed successfully")
             return results
         except Exception as error:
@@ -32,22 +44,36 @@ class OptimizeTransfers:
             return []
 
     def calculate(self) -> List[DistributionResult]:
-        """Performs parallel calculation for all products."""
-        branches = self._repository.load_branches()
-        products = self._repository.load_products()
-        network_state = self._factory.create_network_state(
-            branches, self._repository.load_stock_levels
+        """Distributes every product, reusing results of unchanged rows."""
+        fingerprints = (
+            self._repository.load_product_fingerprints()
+            if self._state else None
         )
-        stocks_map = {
-            b.name: self._repository.load_stock_levels(b) for b in branches
+        if not isinstance(fingerprints, dict) or not fingerprints:
+            return self._calculate_products()
+        signature = self._policy_signature()
+        previous = self._state.load(signature)
+        changed = {
+            code for code, fingerprint in fingerprints.items()
+            if previous.get(code, (None,))[0] != fingerprint
         }
-        
-        return [
-            result for product in products 
-            if (result := self._process_single_product(
-                product, branches, stocks_map, network_state
-            ))
-        ]
+        subset = changed if len(changed) < len(fingerprints) else None
+        fresh = {
+            result.product.code: result
+            for result in self._calculate_products(subset)
+        } if changed else {}
+        entries = {
+            code: (fingerprint, fresh.get(code) if code in changed
+                   else previous[code][1])
+            for code, fingerprint in fingerprints.items()
+        }
+        if changed or entries.keys() != previous.keys():
+            self._state.save(signature, entries)
+        logger.info(
+            "Redistributed %s changed of %s products",
+            len(changed), len(fingerprints)
+        )
+        return [result for _, result in entries.values() if result]
 
     def save(self, results: List[DistributionResult]) -> None:
         """Persists the generated transfers to the repository."""
@@ -56,29 +82,124 @@ class OptimizeTransfers:
         ]
         self._repository.save_transfers(transfers)
 
-    def _process_single_product(
-        self, product, branches, stocks_map, network_state
-    ) -> DistributionResult:
-        """Determines distribution for a single product across branches."""
-        needs, surpluses, sales = self._collect_distribution_needs(
-            product, branches, stocks_map
-        )
-        if not needs and not surpluses:
+    def _calculate_products(self, codes=None) -> List[DistributionResult]:
+        """Distributes all products, or only those whose code is in codes."""
+        with telemetry_span("load") as span:
+            branches = self._repository.load_branches()
+            if codes is None:
+                products = self._repository.load_products()
+                stocks_map = {
+                    b.name: self._repository.load_stock_levels(b)
+                    for b in branches
+                }
+            else:
+                products = self._repository.load_products_by_code(codes)
+                stocks_map = {
+                    b.name: self._repository.load_stock_levels_by_code(
+                        b, codes
+                    ) for b in branches
+                }
+            network_state = self._factory.create_network_state(
+                branches, lambda branch: stocks_map[branch.name]
+            )
+            span.record_rows(rows_out=len(products))
+        
+        with telemetry_span("compute") as span:
+            product_ids, columns = self._index_stocks(
+                products, branches, stocks_map
+            )
+            collected = [
+                (product, *self._collect_distribution_needs(
+                    branches, [column[product_id] for column in columns]
+                )) for product, product_id in zip(products, product_ids)
+            ]
+            collected = [entry for entry in collected if entry[1] or entry[2]]
+            distributed = self._engine.distribute_products(
+                entry[:3] for entry in collected
+            )
+            balances = self._extract_product_balances(
+                [entry[0].code for entry in collected], branches,
+                network_state
+            )
+            results = [
+                self._annotate_result(result, branch_balances, entry[3])
+                for result, branch_balances, entry in zip(
+                    distributed, balances, collected
+                )
+            ]
+            span.record_rows(rows_in=len(products), rows_out=len(results))
+        return results
+
+    @staticmethod
+    def _default_engine(solver: str = None):
+        """Engine for the configured transfer solver."""
+        from src.shared.constants import TRANSFER_SOLVER
+        solver = solver or TRANSFER_SOLVER
+        if solver == "greedy":
+            return DistributionEngine(PriorityCalculator())
+        if solver == "min_cost_flow":
+            from src.domain.services.flow_distribution_service import (
+                FlowDistributionEngine
+            )
+            return FlowDistributionEngine(PriorityCalculator())
+        raise ValueError(f"Unknown transfer solver: {solver}")
+
+    @staticmethod
+    def _default_state(engine):
+        """Result store for incremental runs; none for custom engines."""
+        from src.shared.constants import INCREMENTAL_DISTRIBUTION
+        if engine is not None or not INCREMENTAL_DISTRIBUTION:
             return None
-        result = self._engine.distribute_product(product, needs, surpluses)
-        result.branch_balances = self._extract_product_balances(
-            product.code, branches, network_state
+        from src.infrastructure.cache.distribution_state import (
+            DistributionStateStore
         )
+        return DistributionStateStore()
+
+    def _policy_signature(self) -> str:
+        """Everything besides the input row that shapes a product's result."""
+        from src.shared import constants
+        return repr((
+            [branch.name for branch in self._repository.load_branches()],
+            constants.PRIORITY_WEIGHTS, constants.STOCK_COVERAGE_DAYS,
+            constants.MAX_BALANCE_FOR_NEED_THRESHOLD,
+            constants.MIN_COVERAGE_FOR_SMALL_NEED_SUPPRESSION,
+            constants.MIN_NEED_THRESHOLD, type(self._engine).__name__,
+            sorted(constants.TRANSFER_PAIR_COSTS.items()),
+            constants.DEFAULT_TRANSFER_PAIR_COST, _distribution_code_stamp()
+        ))
+
+    @staticmethod
+    def _annotate_result(result, branch_balances, sales) -> DistributionResult:
+        """Attaches branch balances and total sales to a product result."""
+        result.branch_balances = branch_balances
         result.total_sales = sales
         return result
 
-    def _collect_distribution_needs(self, product, branches, stocks_map) -> tuple:
-        """Collects needs, surpluses, and total sales for a product."""
-        needs, surpluses, total_sales = [], [], 0.0
+    @staticmethod
+    def _index_stocks(products, branches, stocks_map) -> tuple:
+        """Product ids and, per branch, its stock levels indexed by id."""
+        dictionary = get_product_dictionary()
+        product_ids = dictionary.encode(
+            product.code for product in products
+        ).tolist()
+        columns = []
         for branch in branches:
-            branch_stocks = stocks_map[branch.name]
-            if product.code in branch_stocks:
-                stock = branch_stocks[product.code]
+            stocks = stocks_map[branch.name]
+            stock_ids = dictionary.encode(stocks).tolist()
+            column = [None] * len(dictionary)
+            for stock_id, stock in zip(stock_ids, stocks.values()):
+                column[stock_id] = stock
+            columns.append(column)
+        return product_ids, columns
+
+    def _collect_distribution_needs(self, branches, stocks) -> tuple:
+        """Collects needs, surpluses, and total sales for a product.
+
+        stocks holds the product's StockLevel per branch, None if absent.
+        """
+        needs, surpluses, total_sales = [], [], 0.0
+        for branch, stock in zip(branches, stocks):
+            if stock is not None:
                 total_sales += stock.sales
                 if stock.needed > 0:
                     needs.append((branch, stock))
@@ -87,10 +208,31 @@ class OptimizeTransfers:
         return needs, surpluses, total_sales
 
     def _extract_product_balances(
-        self, product_code: str, branches: List[Branch], state: NetworkStockState
-    ) -> dict:
-        """Extracts branch balances for a specific product."""
-        return {
-            branch.name: state.get_balance(branch.name, product_code) 
-            for branch in branches
-        }
+        self, product_codes: List[str], branches: List[Branch],
+        state: NetworkStockState
+    ) -> List[dict]:
+        """Branch balances per product, gathered in one matrix slice."""
+        names = [branch.name for branch in branches]
+        block = state.gather(
+            state.rows_of(product_codes)[:, None],
+            state.columns_of(names)[None, :]
+        )
+        return [dict(zip(names, row)) for row in block.tolist()]
+
+
+@lru_cache(maxsize=None)
+def _distribution_code_stamp() -> str:
+    """Hashes the domain sources and this use case, so code edits miss."""
+    domain_dir = os.path.dirname(os.path.dirname(os.path.abspath(
+        sys.modules[DistributionEngine.__module__].__file__
+    )))
+    sources = [os.path.abspath(__file__)] + sorted(
+        os.path.join(directory, name)
+        for directory, _, names in os.walk(domain_dir)
+        for name in names if name.endswith('.py')
+    )
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sources:
+        with open(path, 'rb') as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
@@ -3,6 +3,7 @@
 from src.application.ports.repository import DataRepository
 from src.application.use_cases.optimize_transfers import OptimizeTransfers
 from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import telemetry_span
 
 logger = get_logger(__name__)
 
@@ -31,7 +32,9 @@ class ReportSurplus:
             results = self._optimizer.calculate()
             
             # 2. Persist the surplus specific report
-            self._repository.save_remaining_surplus(results)
+            with telemetry_span("persist") as span:
+                self._repository.save_remaining_surplus(results)
+                span.record_rows(rows_in=len(results))
             
             logger.info("✓ Surplus reporting completed successfully")
             return True
@@ -4,6 +4,7 @@ from typing import Dict, List
 from src.domain.services.branch_service import BranchSplitter
 from src.application.ports.repository import DataRepository
 from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import telemetry_span
 
 logger = get_logger(__name__)
 
@@ -22,17 +23,22 @@ class SegmentBranches:
     def execute(self, **kwargs) -> bool:
         """Loads consolidated data, splits it, and persists the results."""
         try:
-            branches = self._repository.load_branches()
-            data = self._repository.load_consolidated_stock()
+            with telemetry_span("load") as span:
+                branches = self._repository.load_branches()
+                data = self._repository.load_consolidated_stock()
+                span.record_rows(rows_out=len(data or []))
             
             if not data:
                 logger.error("No consolidated data found to segment.")
                 return False
                 
             logger.info("Segmenting data for %d branches...", len(branches))
-            split_results = self._splitter.split_by_branch(data, branches)
+            with telemetry_span("compute") as span:
+                split_results = self._splitter.split_by_branch(data, branches)
+                span.record_rows(rows_in=len(data))
             
-            self._save_segmented_branches(branches, split_results)
+            with telemetry_span("persist"):
+                self._save_segmented_branches(branches, split_results)
             logger.info("✓ Data segmentation completed successfully")
             return True
         except Exception as error:
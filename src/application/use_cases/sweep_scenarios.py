@@ -0,0 +1,131 @@
+"""Use case for batched what-if sweeps over policy parameters."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from src.application.ports.repository import DataRepository
+from src.domain.models.product_dictionary import (
+    MISSING_ID, get_product_dictionary
+)
+from src.domain.models.scenario import Scenario, ScenarioOutcome
+from src.shared.constants import (
+    SCENARIO_PRESETS, SCENARIO_BATCH_SIZE, SCENARIO_WORKERS
+)
+from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import telemetry_span
+
+logger = get_logger(__name__)
+
+
+class SweepScenarios:
+    """Evaluates N policy scenarios against one loaded network matrix."""
+
+    def __init__(self, repository: DataRepository):
+        self._repository = repository
+
+    def execute(
+        self, scenarios: Optional[List[Scenario]] = None,
+        workers: int = SCENARIO_WORKERS, **kwargs
+    ) -> bool:
+        """Runs the sweep and saves a side-by-side comparison."""
+        try:
+            outcomes, products = self.calculate(scenarios, workers)
+            with telemetry_span("persist"):
+                self._repository.save_scenario_comparison(
+                    self._summary_rows(outcomes),
+                    self._product_rows(outcomes, products)
+                )
+            logger.info("✓ Compared %s scenarios", len(outcomes))
+            return True
+        except Exception as error:
+            logger.exception(f"SweepScenarios execution failed: {error}")
+            return False
+
+    def calculate(
+        self, scenarios: Optional[List[Scenario]] = None,
+        workers: int = SCENARIO_WORKERS
+    ) -> tuple:
+        """Returns (outcomes, products) with the network loaded once."""
+        import numpy as np
+        from src.domain.services.calculations.scenario_calculator import (
+            evaluate_scenarios
+        )
+        scenarios = scenarios or [Scenario(**p) for p in SCENARIO_PRESETS]
+        with telemetry_span("load") as span:
+            products, avg_sales, balance = self._load_network(np)
+            span.record_rows(rows_out=len(products))
+        batches = [
+            scenarios[start:start + SCENARIO_BATCH_SIZE]
+            for start in range(0, len(scenarios), SCENARIO_BATCH_SIZE)
+        ]
+        with telemetry_span("compute") as span:
+            run = lambda batch: evaluate_scenarios(avg_sales, balance, batch)
+            if workers > 1 and len(batches) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(run, batches))
+            else:
+                results = [run(batch) for batch in batches]
+            span.record_rows(rows_in=len(products) * len(scenarios))
+        return [o for batch in results for o in batch], products
+
+    def _load_network(self, np) -> tuple:
+        """Builds (products, avg_sales, balance) matrices from stock levels."""
+        dictionary = get_product_dictionary()
+        branches = self._repository.load_branches()
+        products = self._repository.load_products()
+        product_ids = dictionary.encode([product.code for product in products])
+        # One spare slot so MISSING_ID (-1) lands on a row of -1 as well.
+        row_of = np.full(len(dictionary) + 1, -1, dtype=np.int64)
+        row_of[product_ids] = np.arange(len(products))
+        avg_sales = np.zeros((len(products), len(branches)))
+        balance = np.zeros((len(products), len(branches)))
+        for column, branch in enumerate(branches):
+            stocks = list(self._repository.load_stock_levels(branch).items())
+            stock_ids = dictionary.lookup(code for code, _ in stocks)
+            stock_ids[stock_ids >= len(row_of) - 1] = MISSING_ID
+            rows = row_of[stock_ids]
+            known = rows >= 0
+            avg_sales[rows[known], column] = np.fromiter(
+                (stock.avg_sales for _, stock in stocks), dtype=float,
+                count=len(stocks)
+            )[known]
+            balance[rows[known], column] = np.fromiter(
+                (stock.balance for _, stock in stocks), dtype=float,
+                count=len(stocks)
+            )[known]
+        return products, avg_sales, balance
+
+    def _summary_rows(self, outcomes: List[ScenarioOutcome]) -> List[Dict]:
+        """One totals row per scenario."""
+        return [
+            {
+                'scenario': outcome.scenario.name,
+                'coverage_days': outcome.scenario.coverage_days,
+                'consumption_factor': outcome.scenario.consumption_factor,
+                'transfer_lines': int(outcome.transfer_lines.sum()),
+                'transferred_quantity': int(outcome.transferred.sum()),
+                'shortage_products': int((outcome.shortage > 0).sum()),
+                'shortage_quantity': int(outcome.shortage.sum()),
+                'surplus_products': int((outcome.remaining_surplus > 0).sum()),
+                'remaining_surplus': int(outcome.remaining_surplus.sum())
+            }
+            for outcome in outcomes
+        ]
+
+    def _product_rows(self, outcomes, products) -> List[Dict]:
+        """Per-product columns side by side, skipping all-zero products."""
+        rows = []
+        for index, product in enumerate(products):
+            values = {}
+            for outcome in outcomes:
+                name = outcome.scenario.name
+                values[f'{name}_transferred'] = int(outcome.transferred[index])
+                values[f'{name}_shortage'] = int(outcome.shortage[index])
+                values[f'{name}_surplus'] = int(
+                    outcome.remaining_surplus[index]
+                )
+            if any(values.values()):
+                rows.append(
+                    {'code': product.code, 'product_name': product.name,
+                     **values}
+                )
+        return rows
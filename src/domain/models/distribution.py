@@ -5,7 +5,7 @@ from typing import List, Dict, Optional
 from src.domain.models.entities import Product, Branch
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transfer:
     """Represents a movement of goods between branches."""
     product: Product
@@ -16,7 +16,7 @@ class Transfer:
     receiver_balance: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DistributionResult:
     """Captures the outcome of a distribution run for a product."""
     product: Product
@@ -28,7 +28,7 @@ class DistributionResult:
     total_sales: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LogisticsRecord:
     """Represents a single entry in a logistics report."""
     product: Product
@@ -38,14 +38,3 @@ class LogisticsRecord:
     sender_balance: float
     receiver_balance: float
     category: Optional[str] = None
-
-
-@dataclass(frozen=True)
-class ConsolidatedLogisticsReport:
-    """Encapsulates a collection of logistics records for a source branch."""
-    source_branch: Branch
-    records: List[LogisticsRecord]
-
-    def has_records(self) -> bool:
-        """Checks if the report contains any records."""
-        return len(self.records) > 0
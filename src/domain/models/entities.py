@@ -1,18 +1,24 @@
 """Domain models for basic entities."""
 
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass, field
 from typing import Optional, List, Dict
+import numpy as np
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Product:
     """Represents a pharmaceutical product."""
     code: str
     name: str
     category: Optional[str] = None
 
+    def __reduce__(self):
+        """Unpickles into the shared instance for these values."""
+        from src.domain.models.flyweights import intern_product
+        return intern_product, (self.code, self.name, self.category)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StockLevel:
     """Represents the stock status of a product in a branch."""
     needed: int
@@ -22,7 +28,7 @@ class StockLevel:
     sales: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Branch:
     """Represents a pharmacy branch."""
     name: str
@@ -31,15 +37,20 @@ class Branch:
         if not self.name:
             raise ValueError("Branch name cannot be empty")
 
+    def __reduce__(self):
+        """Unpickles into the shared instance with this name."""
+        from src.domain.models.flyweights import intern_branch
+        return intern_branch, (self.name,)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BranchStock:
     """Represents a product's stock status within a specific branch."""
     product: Product
     stock: StockLevel
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConsolidatedStock:
     """
     Represents a product's stock status across all branches before splitting.
@@ -49,20 +60,88 @@ class ConsolidatedStock:
     branch_stocks: Dict[str, StockLevel]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class NetworkStockState:
     """
     Encapsulates the stock balances across the entire branch network.
-    Structure: {branch_name: {product_code: balance}}
+    Built from {branch_name: {product_code: balance}} into a (products x
+    branches) matrix, with one trailing zero row and column so that a
+    missing code or branch (index -1) reads as 0.0.
     """
-    balances: Dict[str, Dict[str, float]]
+    balances: InitVar[Dict[str, Dict[str, float]]]
+    values: np.ndarray = field(init=False)
+    row_index: Dict[str, int] = field(init=False)
+    column_index: Dict[str, int] = field(init=False)
+
+    def __post_init__(self, balances) -> None:
+        row_index = {}
+        for branch_balances in balances.values():
+            for code in branch_balances:
+                row_index.setdefault(code, len(row_index))
+        values = np.zeros((len(row_index) + 1, len(balances) + 1))
+        for column, branch_balances in enumerate(balances.values()):
+            rows = [row_index[code] for code in branch_balances]
+            values[rows, column] = np.fromiter(
+                branch_balances.values(), dtype=float,
+                count=len(branch_balances)
+            )
+        object.__setattr__(self, 'values', values)
+        object.__setattr__(self, 'row_index', row_index)
+        object.__setattr__(
+            self, 'column_index',
+            {name: column for column, name in enumerate(balances)}
+        )
+
+    def __eq__(self, other) -> bool:
+        """Equal when both hold the same balance for every branch and code."""
+        if not isinstance(other, NetworkStockState):
+            return NotImplemented
+        if (self.row_index.keys() != other.row_index.keys()
+                or self.column_index.keys() != other.column_index.keys()):
+            return False
+        rows = other.rows_of(self.row_index)
+        columns = other.columns_of(self.column_index)
+        return np.array_equal(
+            self.values[:-1, :-1], other.values[np.ix_(rows, columns)]
+        )
+
+    def to_balances(self) -> Dict[str, Dict[str, float]]:
+        """Rebuilds {branch: {code: balance}}, 0.0 where a branch had none."""
+        codes = list(self.row_index)
+        return {
+            branch: dict(zip(codes, self.values[:-1, column].tolist()))
+            for branch, column in self.column_index.items()
+        }
 
     def get_balance(self, branch_name: str, product_code: str) -> float:
         """Retrieves balance for a specific branch and product."""
-        return self.balances.get(branch_name, {}).get(product_code, 0.0)
-
-
-@dataclass(frozen=True)
+        return float(self.values[
+            self.row_index.get(product_code, -1),
+            self.column_index.get(branch_name, -1)
+        ])
+
+    def rows_of(self, product_codes) -> np.ndarray:
+        """Matrix rows of product codes, -1 for unknown codes."""
+        row_index = self.row_index
+        return np.fromiter(
+            (row_index.get(code, -1) for code in product_codes),
+            dtype=np.int64
+        )
+
+    def columns_of(self, branch_names) -> np.ndarray:
+        """Matrix columns of branch names, -1 for unknown branches."""
+        column_index = self.column_index
+        return np.fromiter(
+            (column_index.get(name, -1) for name in branch_names),
+            dtype=np.int64
+        )
+
+    def gather(self, product_rows, branch_cols) -> np.ndarray:
+        """Balances at many (row, column) pairs at once, broadcast numpy-style."""
+        return self.values[np.asarray(product_rows), np.asarray(branch_cols)]
+
+
+@dataclass(frozen=True, slots=True)
 class SurplusEntry:
     """Represents a product with surplus stock in a branch."""
     product: Product
@@ -0,0 +1,75 @@
+"""Shared Product and Branch instances (flyweights) for a process.
+
+Readers and factories build a Product for every row and a Branch for
+every transfer end. Interning them through one registry keeps a single
+instance per distinct value, so a run holds one object per product and
+branch however many transfers, surplus entries or records reference it.
+Products are keyed by their full value (code, name, category), never by
+code alone, so interning cannot change what any report prints. The
+pipeline clears the registry when a run starts; instances handed out
+earlier stay valid, since entities compare by value.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+from src.domain.models.entities import Branch, Product
+
+
+class EntityRegistry:
+    """Hands out one shared instance per distinct Product or Branch."""
+
+    def __init__(self):
+        self._products: Dict[Tuple, Product] = {}
+        self._branches: Dict[str, Branch] = {}
+        self._lock = threading.Lock()
+
+    def product(
+        self, code: str, name: str, category: Optional[str] = None
+    ) -> Product:
+        """Returns the shared Product for these values."""
+        key = (code, name, category)
+        product = self._products.get(key)
+        if product is None:
+            with self._lock:
+                product = self._products.setdefault(
+                    key, Product(code=code, name=name, category=category)
+                )
+        return product
+
+    def branch(self, name: str) -> Branch:
+        """Returns the shared Branch with this name."""
+        branch = self._branches.get(name)
+        if branch is None:
+            with self._lock:
+                branch = self._branches.setdefault(name, Branch(name=name))
+        return branch
+
+    def size(self) -> Tuple[int, int]:
+        """Number of interned (products, branches)."""
+        return len(self._products), len(self._branches)
+
+    def clear(self) -> None:
+        """Drops every interned instance."""
+        with self._lock:
+            self._products = {}
+            self._branches = {}
+
+
+_registry = EntityRegistry()
+
+
+def get_entity_registry() -> EntityRegistry:
+    """Returns the process-wide registry."""
+    return _registry
+
+
+def intern_product(
+    code: str, name: str, category: Optional[str] = None
+) -> Product:
+    """Shared Product for these values."""
+    return _registry.product(code, name, category)
+
+
+def intern_branch(name: str) -> Branch:
+    """Shared Branch with this name."""
+    return _registry.branch(name)
@@ -5,7 +5,7 @@ from typing import List, Dict, Optional
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineContract:
     """Defines the expected output and metadata for a pipeline step."""
     service_name: str
@@ -14,7 +14,7 @@ class PipelineContract:
     description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepResult:
     """Captures the outcome of a single pipeline step execution."""
     service_name: str
@@ -24,7 +24,7 @@ class StepResult:
     metadata: Optional[Dict] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineState:
     """Represents the overall readiness and health of the workflow."""
     step_results: Dict[str, StepResult]
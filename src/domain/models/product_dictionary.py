@@ -0,0 +1,70 @@
+"""Run-scoped dictionary of dense integer product ids.
+
+Entities, stock maps and files keep string product codes. The transfer
+and scenario use cases encode those codes into dense int32 ids to line
+up each branch's stock map with the product rows by list and array
+indexing. Each caller context (one Streamlit session, one CLI run) has
+its own dictionary and the pipeline starts a fresh one per run, so a run
+starting in one session never renumbers ids another session is using.
+"""
+
+import threading
+from contextvars import ContextVar
+from typing import Dict, Iterable, Optional
+import numpy as np
+
+MISSING_ID = -1
+
+
+class ProductDictionary:
+    """Assigns dense int32 ids to product codes in order of first sight."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def encode(self, codes: Iterable) -> np.ndarray:
+        """Ids for codes, assigning new ones to unseen codes."""
+        codes = list(codes)
+        ids = self.lookup(codes)
+        if (ids == MISSING_ID).any():
+            with self._lock:
+                for code in codes:
+                    self._ids.setdefault(code, len(self._ids))
+            ids = self.lookup(codes)
+        return ids
+
+    def lookup(self, codes: Iterable) -> np.ndarray:
+        """Ids for codes, with MISSING_ID for codes never encoded."""
+        codes = list(codes)
+        ids = self._ids
+        return np.fromiter(
+            (ids.get(code, MISSING_ID) for code in codes),
+            dtype=np.int32, count=len(codes)
+        )
+
+    def clear(self) -> None:
+        """Forgets every id."""
+        with self._lock:
+            self._ids = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+_current_dictionary: ContextVar[Optional[ProductDictionary]] = ContextVar(
+    "product_dictionary", default=None
+)
+
+
+def start_product_dictionary() -> ProductDictionary:
+    """Binds a fresh dictionary to the calling context for a new run."""
+    dictionary = ProductDictionary()
+    _current_dictionary.set(dictionary)
+    return dictionary
+
+
+def get_product_dictionary() -> ProductDictionary:
+    """Returns the calling context's dictionary, starting one if needed."""
+    dictionary = _current_dictionary.get()
+    return dictionary if dictionary is not None else start_product_dictionary()
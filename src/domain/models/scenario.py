@@ -0,0 +1,37 @@
+"""Domain models for what-if policy scenarios."""
+
+from dataclasses import dataclass, field
+from typing import Dict
+from src.shared.constants import (
+    PRIORITY_WEIGHTS,
+    STOCK_COVERAGE_DAYS,
+    MAX_BALANCE_FOR_NEED_THRESHOLD,
+    MIN_COVERAGE_FOR_SMALL_NEED_SUPPRESSION,
+    MIN_NEED_THRESHOLD
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """One set of policy parameters; defaults reproduce the live policy."""
+    name: str
+    coverage_days: float = STOCK_COVERAGE_DAYS
+    weights: Dict[str, float] = field(
+        default_factory=lambda: dict(PRIORITY_WEIGHTS)
+    )
+    max_balance: float = MAX_BALANCE_FOR_NEED_THRESHOLD
+    min_coverage_for_suppression: float = (
+        MIN_COVERAGE_FOR_SMALL_NEED_SUPPRESSION
+    )
+    min_need: float = MIN_NEED_THRESHOLD
+    consumption_factor: float = 1.0
+
+
+@dataclass(slots=True)
+class ScenarioOutcome:
+    """Per-product distribution totals for one scenario."""
+    scenario: Scenario
+    transferred: "np.ndarray"
+    transfer_lines: "np.ndarray"
+    shortage: "np.ndarray"
+    remaining_surplus: "np.ndarray"
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from typing import Callable, Any
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Step:
     """Represents a single execution step in the pipeline."""
     id: str
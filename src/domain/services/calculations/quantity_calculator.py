@@ -1,41 +1,52 @@
 """Basic quantity calculations"""
 
 import math
+import numpy as np
 import pandas as pd
 from src.shared.constants import STOCK_COVERAGE_DAYS
 from src.domain.services.inventory.inventory_policy import InventoryPolicy
 
 
-def _calculate_coverage_quantity(avg_sales: pd.Series) -> pd.Series:
-    """Calculate target coverage quantity using ceiling."""
-    return (avg_sales * STOCK_COVERAGE_DAYS).apply(lambda x: math.ceil(x))
+def calculate_quantity_arrays(avg_sales, balance) -> tuple:
+    """Coverage, surplus and policy-adjusted need as NumPy arrays.
 
+    One float64 work buffer carries every intermediate step in place;
+    the three results are the only other allocations. Raises ValueError
+    for NaN or infinite inputs, which have no integer quantity.
+    """
+    work = np.multiply(avg_sales, STOCK_COVERAGE_DAYS, dtype=np.float64)
+    if not (np.isfinite(work).all() and np.isfinite(balance).all()):
+        raise ValueError("avg_sales and balance must be finite numbers")
+    np.ceil(work, out=work)
+    coverage = work.astype(np.int64)
 
-def _calculate_surplus(balance: pd.Series, coverage: pd.Series) -> pd.Series:
-    """Calculate surplus quantity using floor."""
-    return (balance - coverage).apply(lambda x: max(0, math.floor(x)))
+    np.subtract(balance, coverage, out=work)
+    np.floor(work, out=work)
+    np.maximum(work, 0, out=work)
+    surplus = work.astype(np.int64)
 
+    np.subtract(coverage, balance, out=work)
+    np.ceil(work, out=work)
+    np.maximum(work, 0, out=work)
+    needed = work.astype(np.int64)
 
-def _calculate_needed(coverage: pd.Series, balance: pd.Series) -> pd.Series:
-    """Calculate needed quantity using ceiling."""
-    return (coverage - balance).apply(lambda x: max(0, math.ceil(x)))
+    # Apply centralized business rules (Max Balance, Small Need, Capping)
+    needed = InventoryPolicy.apply_array_rules(
+        needed, balance, coverage, work
+    )
+    return coverage, surplus, needed
 
 
 def calculate_basic_quantities(branch_df: pd.DataFrame) -> pd.DataFrame:
     """Calculate coverage, surplus, and needed quantities."""
-    dataframe = branch_df.copy()
-    coverage = _calculate_coverage_quantity(dataframe['avg_sales'])
-    
-    dataframe['coverage_quantity'] = coverage
-    dataframe['surplus_quantity'] = _calculate_surplus(
-        dataframe['balance'], coverage
+    coverage, surplus, needed = calculate_quantity_arrays(
+        branch_df['avg_sales'].to_numpy(), branch_df['balance'].to_numpy()
     )
-    dataframe['needed_quantity'] = _calculate_needed(
-        coverage, dataframe['balance']
+    return branch_df.assign(
+        coverage_quantity=coverage,
+        surplus_quantity=surplus,
+        needed_quantity=needed
     )
-    
-    # Apply centralized business rules (Max Balance, Small Need, Capping)
-    return InventoryPolicy.apply_vectorized_rules(dataframe)
 
 
 def _calculate_branch_remaining(
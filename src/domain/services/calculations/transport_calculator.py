@@ -0,0 +1,126 @@
+"""Batched min-cost transportation solver (successive shortest paths).
+
+Every product is a bipartite flow problem over the same branch axis:
+sources carry surplus, sinks carry need and ``cost[i, j]`` prices one unit
+moved from branch i to branch j. Products are stacked on the first axis,
+so each Bellman-Ford relaxation and each augmentation is one NumPy pass
+over all unfinished products. Sinks are augmented in the given priority
+order, so each sink receives exactly what the greedy engine would give it
+while the source assignment has the least total cost. Equal-cost sources
+are tied toward the one with the most supply left, as the greedy engine
+picks them, so uniform costs do not split a need across extra lines.
+"""
+
+import numpy as np
+
+_TOLERANCE = 1e-9
+
+
+def solve_transport(
+    supply: np.ndarray, demand: np.ndarray, order: np.ndarray,
+    cost: np.ndarray
+) -> np.ndarray:
+    """Returns (products, branches, branches) integer flows from i to j."""
+    supply = np.asarray(supply, dtype=np.int64).copy()
+    demand = np.asarray(demand, dtype=np.int64).copy()
+    product_count, branch_count = supply.shape
+    flow = np.zeros((product_count, branch_count, branch_count), np.int64)
+    active = np.flatnonzero((supply.sum(axis=1) > 0) & (demand.sum(axis=1) > 0))
+    while active.size:
+        distance_to_sink, from_source, from_sink = _shortest_paths(
+            supply[active], flow[active], cost
+        )
+        target, found = _next_sink(
+            demand[active], order[active], distance_to_sink
+        )
+        active, target = active[found], target[found]
+        if not active.size:
+            break
+        _augment(
+            active, target, from_source[found], from_sink[found],
+            supply, demand, flow
+        )
+        active = active[
+            (supply[active].sum(axis=1) > 0) & (demand[active].sum(axis=1) > 0)
+        ]
+    return flow
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _shortest_paths(supply, flow, cost) -> tuple:
+    """Bellman-Ford over the residual graph of every product at once."""
+    rows, branch_count = supply.shape
+    to_source = np.where(supply > 0, 0.0, np.inf)
+    to_sink = np.full((rows, branch_count), np.inf)
+    from_sink = np.full((rows, branch_count), -1)
+    from_source = np.full((rows, branch_count), -1)
+    backward = np.where(flow > 0, -cost[None], np.inf)
+    for _ in range(2 * branch_count + 1):
+        # Predecessors move only on strict improvement, so equal-cost ties
+        # never close a zero-cost cycle through a backward edge.
+        candidates = to_source[:, :, None] + cost[None]
+        best = candidates.min(axis=1)
+        shorter = best < to_sink - _TOLERANCE
+        to_sink = np.where(shorter, best, to_sink)
+        from_source = np.where(
+            shorter, _largest_tied_source(candidates, best, supply),
+            from_source
+        )
+        via_flow = to_sink[:, None, :] + backward
+        relaxed = via_flow.min(axis=2)
+        improved = relaxed < to_source - _TOLERANCE
+        if not improved.any():
+            break
+        to_source = np.where(improved, relaxed, to_source)
+        from_sink = np.where(improved, via_flow.argmin(axis=2), from_sink)
+    return to_sink, from_source, from_sink
+
+
+def _largest_tied_source(candidates, best, supply) -> np.ndarray:
+    """Among sources within tolerance of the best cost, the largest one."""
+    tied = candidates <= best[:, None, :] + _TOLERANCE
+    return np.where(tied, supply[:, :, None], -1).argmax(axis=1)
+
+
+def _next_sink(demand, order, distance_to_sink) -> tuple:
+    """Highest-priority sink that still needs stock and can be reached."""
+    open_sinks = (demand > 0) & np.isfinite(distance_to_sink)
+    ordered = np.take_along_axis(open_sinks, order, axis=1)
+    position = ordered.argmax(axis=1)
+    target = order[np.arange(len(order)), position]
+    return target, ordered.any(axis=1)
+
+
+def _augment(
+    products, target, from_source, from_sink, supply, demand, flow
+) -> None:
+    """Pushes the bottleneck amount along each product's shortest path."""
+    local = np.arange(len(products))
+    amount = demand[products, target].copy()
+    sink, path, pending = target.copy(), [], np.ones(len(products), bool)
+    for _ in range(supply.shape[1] + 1):
+        source = from_source[local, sink]
+        previous_sink = from_sink[local, source]
+        path.append((pending.copy(), source, sink, previous_sink))
+        starts = pending & (previous_sink < 0)
+        amount = np.where(
+            starts, np.minimum(amount, supply[products, source]), amount
+        )
+        pending &= previous_sink >= 0
+        if not pending.any():
+            break
+        amount = np.where(pending, np.minimum(
+            amount, flow[products, source, np.maximum(previous_sink, 0)]
+        ), amount)
+        sink = np.where(pending, previous_sink, sink)
+    for mask, source, sink, previous_sink in path:
+        picked = products[mask]
+        flow[picked, source[mask], sink[mask]] += amount[mask]
+        undo = mask & (previous_sink >= 0)
+        flow[products[undo], source[undo], previous_sink[undo]] -= amount[undo]
+        starts = mask & (previous_sink < 0)
+        supply[products[starts], source[starts]] -= amount[starts]
+    demand[products, target] -= amount
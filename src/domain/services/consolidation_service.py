@@ -1,87 +1,64 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+import pandas as pd
 from src.domain.models.entities import Branch, NetworkStockState, SurplusEntry
-from src.domain.models.distribution import (
-    Transfer, LogisticsRecord, ConsolidatedLogisticsReport
-)
+from src.domain.models.distribution import Transfer
 from src.domain.services.classification.product_classifier import (
     classify_product_type
 )
+from src.domain.services.product_ordering import get_product_sort_index
 
 
 class ConsolidationEngine:
     """Handles the logical combination of transfers and surplus stock."""
 
-    def combine_data(
+    def __init__(self):
+        self._categories: Dict[str, str] = {}
+
+    def combine_columns(
         self,
         branch: Branch,
         transfers: List[Transfer],
         surplus_entries: List[SurplusEntry],
         network_state: NetworkStockState
-    ) -> ConsolidatedLogisticsReport:
-        """Combines transfers and surplus into a domain report."""
-        records = []
-        self._append_normal_transfers(records, branch, transfers, network_state)
-        self._append_surplus_records(
-            records, branch, surplus_entries, network_state
-        )
-        
-        return ConsolidatedLogisticsReport(
-            source_branch=branch,
-            records=records
-        )
+    ) -> pd.DataFrame:
+        """Combines transfers and surplus into one records table.
 
-    def _append_normal_transfers(
-        self, 
-        records: List[LogisticsRecord], 
-        branch: Branch, 
-        transfers: List[Transfer], 
-        network_state: NetworkStockState
-    ) -> None:
-        """Processes normal transfers and adds them to the record list."""
-        for transfer in transfers:
-            sender_balance = network_state.get_balance(
-                branch.name, transfer.product.code
-            )
-            receiver_balance = network_state.get_balance(
-                transfer.to_branch.name, transfer.product.code
-            )
-            
-            records.append(LogisticsRecord(
-                product=transfer.product,
-                quantity=transfer.quantity,
-                target_branch=transfer.to_branch.name,
-                transfer_type='normal',
-                sender_balance=sender_balance,
-                receiver_balance=receiver_balance,
-                category=classify_product_type(transfer.product.name)
-            ))
-
-    def _append_surplus_records(
-        self, 
-        records: List[LogisticsRecord], 
-        branch: Branch, 
-        surplus_entries: List[SurplusEntry], 
-        network_state: NetworkStockState
-    ) -> None:
-        """Processes surplus entries and adds them to records."""
-        # Fix: Administration does not send surplus to itself
+        Balances are gathered from the network matrix and categories mapped
+        per distinct name, once for the whole table. Administration does not
+        send surplus to itself.
+        """
         if branch.name == 'administration':
-            return
+            surplus_entries = []
+        items = [*transfers, *surplus_entries]
+        if not items:
+            return pd.DataFrame()
+        codes = [item.product.code for item in items]
+        names = [item.product.name for item in items]
+        targets = [transfer.to_branch.name for transfer in transfers]
+        targets += ['administration'] * len(surplus_entries)
+        rows = network_state.rows_of(codes)
+        dataframe = pd.DataFrame({
+            'code': codes,
+            'product_name': names,
+            'quantity_to_transfer': [item.quantity for item in items],
+            'target_branch': targets,
+            'transfer_type': ['normal'] * len(transfers)
+            + ['surplus'] * len(surplus_entries),
+            'sender_balance': network_state.gather(
+                rows, network_state.columns_of([branch.name])
+            ),
+            'receiver_balance': network_state.gather(
+                rows, network_state.columns_of(targets)
+            ),
+            'product_category': self._category_column(names)
+        })
+        dataframe['sort_rank'] = get_product_sort_index().ranks(names)
+        return dataframe
 
-        for surplus in surplus_entries:
-            sender_balance = network_state.get_balance(
-                branch.name, surplus.product.code
-            )
-            receiver_balance = network_state.get_balance(
-                'administration', surplus.product.code
-            )
-            
-            records.append(LogisticsRecord(
-                product=surplus.product,
-                quantity=surplus.quantity,
-                target_branch='administration',
-                transfer_type='surplus',
-                sender_balance=sender_balance,
-                receiver_balance=receiver_balance,
-                category=classify_product_type(surplus.product.name)
-            ))
+    def _category_column(self, names: List[str]) -> list:
+        """Category per name, classifying each distinct name only once."""
+        categories = self._categories
+        for name in set(names):
+            if name not in categories:
+                categories[name] = classify_product_type(name) or 'other'
+        return [categories[name] for name in names]
@@ -1,13 +1,19 @@
 """Domain service for stock distribution logic."""
 
-from typing import List, Dict, Tuple
+import heapq
+from typing import Iterable, List, Dict, Tuple
 from src.domain.models.entities import Product, Branch, StockLevel
 from src.domain.models.distribution import Transfer, DistributionResult
 from src.domain.services.priority_service import PriorityCalculator
 
 
 class DistributionEngine:
-    """Pure domain logic for distributing surplus to needing branches."""
+    """Pure domain logic for distributing surplus to needing branches.
+
+    Remaining surplus lives in a max-heap keyed by (-available, position),
+    which pops sources in the same order as a stable descending sort of
+    the surplus list, so transfers match the original re-sorting loop.
+    """
 
     def __init__(self, priority_calculator: PriorityCalculator):
         self._calculator = priority_calculator
@@ -21,17 +27,28 @@ class DistributionEngine:
             branch.name: stock.surplus 
             for branch, stock in surplus_branches
         }
-        transfers = []
+        heap = self._build_surplus_heap(surplus_branches, available_surplus)
+        transfers, fulfilled = [], {}
         for consumer_branch, consumer_stock in sorted_needs:
-            branch_transfers = self._fulfill_branch_need(
-                product, consumer_branch, consumer_stock, 
-                surplus_branches, available_surplus
+            self._fulfill_branch_need(
+                product, consumer_branch, consumer_stock,
+                heap, available_surplus, transfers, fulfilled
             )
-            transfers.extend(branch_transfers)
         return self._build_distribution_result(
-            product, transfers, needing_branches, available_surplus
+            product, transfers, needing_branches, available_surplus,
+            fulfilled
         )
 
+    def distribute_products(
+        self, items: Iterable[Tuple]
+    ) -> List[DistributionResult]:
+        """Distributes many (product, needs, surpluses) items in one call."""
+        distribute = self.distribute_product
+        return [
+            distribute(product, needs, surpluses)
+            for product, needs, surpluses in items
+        ]
+
     def _sort_needs_by_priority(self, needing_branches):
         """Sorts needing branches by vulnerability score (descending)."""
         return sorted(
@@ -42,47 +59,53 @@ class DistributionEngine:
             reverse=True
         )
 
+    def _build_surplus_heap(self, surplus_branches, available_surplus):
+        """Max-heap of sources with surplus left, ties in list order."""
+        heap = [
+            (-available_surplus[branch.name], position, branch, stock)
+            for position, (branch, stock) in enumerate(surplus_branches)
+            if available_surplus[branch.name] > 0
+        ]
+        heapq.heapify(heap)
+        return heap
+
     def _fulfill_branch_need(
-        self, product, consumer, consumer_stock, 
-        surplus_branches, available_surplus
-    ) -> List[Transfer]:
-        """Fulfill single branch's need from surplus sources."""
-        transfers = []
+        self, product, consumer, consumer_stock,
+        heap, available_surplus, transfers, fulfilled
+    ) -> None:
+        """Fulfill single branch's need from the largest sources first."""
         remaining_needed = consumer_stock.needed
-        sorted_sources = sorted(
-            surplus_branches,
-            key=lambda item: available_surplus[item[0].name],
-            reverse=True
-        )
-        for provider_branch, provider_stock in sorted_sources:
-            if remaining_needed <= 0:
-                break
+        while remaining_needed > 0 and heap:
+            _, position, provider_branch, provider_stock = heapq.heappop(heap)
             qty = self._calculate_transfer_quantity(
                 remaining_needed, available_surplus[provider_branch.name]
             )
-            if qty > 0:
-                transfers.append(Transfer(
-                    product=product, from_branch=provider_branch, 
-                    to_branch=consumer, quantity=qty,
-                    sender_balance=provider_stock.balance,
-                    receiver_balance=consumer_stock.balance
-                ))
-                available_surplus[provider_branch.name] -= qty
-                remaining_needed -= qty
-        return transfers
+            if qty <= 0:
+                continue
+            transfers.append(Transfer(
+                product=product, from_branch=provider_branch,
+                to_branch=consumer, quantity=qty,
+                sender_balance=provider_stock.balance,
+                receiver_balance=consumer_stock.balance
+            ))
+            available_surplus[provider_branch.name] -= qty
+            remaining_needed -= qty
+            fulfilled[consumer.name] = fulfilled.get(consumer.name, 0) + qty
+            left = available_surplus[provider_branch.name]
+            if left > 0:
+                heapq.heappush(
+                    heap, (-left, position, provider_branch, provider_stock)
+                )
 
     def _calculate_transfer_quantity(self, needed: int, available: int) -> int:
         """Calculates the maximum possible transfer quantity."""
         return min(needed, max(0, available))
 
     def _build_distribution_result(
-        self, product, transfers, original_needs, available_surplus
+        self, product, transfers, original_needs, available_surplus,
+        fulfilled
     ) -> DistributionResult:
         """Constructs the final distribution result with metrics."""
-        fulfilled = {
-            b.name: sum(t.quantity for t in transfers if t.to_branch == b)
-            for b, s in original_needs
-        }
         remaining_needed = sum(
             max(0, s.needed - fulfilled.get(b.name, 0))
             for b, s in original_needs
@@ -0,0 +1,137 @@
+"""Domain service for min-cost-flow stock distribution."""
+
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+from src.domain.models.distribution import DistributionResult, Transfer
+from src.domain.services.calculations.transport_calculator import (
+    solve_transport
+)
+from src.domain.services.distribution_service import DistributionEngine
+from src.domain.services.priority_service import PriorityCalculator
+from src.shared import constants
+
+
+class FlowDistributionEngine(DistributionEngine):
+    """Distributes surplus as a min-cost transportation problem.
+
+    Needs are served in the same priority order as the greedy engine, so
+    every branch receives the same quantity; only the choice of sources
+    differs, minimizing the summed per-unit pair costs.
+    """
+
+    def __init__(
+        self, priority_calculator: PriorityCalculator,
+        pair_costs: Dict[Tuple[str, str], float] = None,
+        default_cost: float = None, batch_size: int = None
+    ):
+        super().__init__(priority_calculator)
+        self._pair_costs = (
+            constants.TRANSFER_PAIR_COSTS if pair_costs is None else pair_costs
+        )
+        self._default_cost = (
+            constants.DEFAULT_TRANSFER_PAIR_COST
+            if default_cost is None else default_cost
+        )
+        self._batch_size = batch_size or constants.FLOW_SOLVER_BATCH_SIZE
+
+    def distribute_product(
+        self, product, needing_branches, surplus_branches
+    ) -> DistributionResult:
+        """Distribute one product's surplus at minimum transfer cost."""
+        return self.distribute_products(
+            [(product, needing_branches, surplus_branches)]
+        )[0]
+
+    def distribute_products(
+        self, items: Iterable[Tuple]
+    ) -> List[DistributionResult]:
+        """Solves (product, needs, surpluses) items in batched NumPy passes."""
+        items = list(items)
+        results = []
+        for start in range(0, len(items), self._batch_size):
+            results.extend(
+                self._solve_batch(items[start:start + self._batch_size])
+            )
+        return results
+
+    # =========================================================================
+    # PRIVATE HELPERS
+    # =========================================================================
+
+    def _solve_batch(self, items) -> List[DistributionResult]:
+        """Builds the stacked arrays for a batch and solves them together."""
+        branches = self._branch_axis(items)
+        index = {branch.name: column for column, branch in enumerate(branches)}
+        supply = np.zeros((len(items), len(branches)), dtype=np.int64)
+        demand = np.zeros_like(supply)
+        order = np.tile(np.arange(len(branches)), (len(items), 1))
+        ranked_needs = []
+        for row, (_, needs, surpluses) in enumerate(items):
+            for branch, stock in surpluses:
+                supply[row, index[branch.name]] = max(0, stock.surplus)
+            ranked = self._sort_needs_by_priority(needs)
+            for position, (branch, stock) in enumerate(ranked):
+                demand[row, index[branch.name]] = max(0, stock.needed)
+                order[row, position] = index[branch.name]
+            self._fill_order(order[row], len(ranked))
+            ranked_needs.append(ranked)
+        flow = solve_transport(supply, demand, order, self._cost_matrix(branches))
+        return [
+            self._build_result(item, ranked, flow[row], index)
+            for row, (item, ranked) in enumerate(zip(items, ranked_needs))
+        ]
+
+    @staticmethod
+    def _branch_axis(items) -> list:
+        """Every branch seen in the batch, in first-appearance order."""
+        seen = {}
+        for _, needs, surpluses in items:
+            for branch, _ in [*needs, *surpluses]:
+                seen.setdefault(branch.name, branch)
+        return list(seen.values())
+
+    @staticmethod
+    def _fill_order(row_order, ranked_count) -> None:
+        """Completes a priority row with the columns that are not sinks."""
+        used = set(row_order[:ranked_count].tolist())
+        row_order[ranked_count:] = [
+            column for column in range(len(row_order)) if column not in used
+        ]
+
+    def _cost_matrix(self, branches) -> np.ndarray:
+        """Per-unit pair costs; moving stock within a branch is forbidden."""
+        cost = np.array([
+            [self._pair_costs.get((source.name, target.name), self._default_cost)
+             for target in branches]
+            for source in branches
+        ], dtype=float).reshape(len(branches), len(branches))
+        np.fill_diagonal(cost, np.inf)
+        return cost
+
+    def _build_result(self, item, ranked_needs, flow, index):
+        """Turns one product's flow matrix into a DistributionResult."""
+        product, needs, surpluses = item
+        available = {branch.name: stock.surplus for branch, stock in surpluses}
+        transfers = []
+        for consumer, consumer_stock in ranked_needs:
+            for provider, provider_stock in surpluses:
+                qty = int(flow[index[provider.name], index[consumer.name]])
+                if qty <= 0:
+                    continue
+                transfers.append(Transfer(
+                    product=product, from_branch=provider,
+                    to_branch=consumer, quantity=qty,
+                    sender_balance=provider_stock.balance,
+                    receiver_balance=consumer_stock.balance
+                ))
+                available[provider.name] -= qty
+        received = flow.sum(axis=0)
+        return DistributionResult(
+            product=product, transfers=transfers,
+            remaining_needed=sum(
+                max(0, stock.needed - int(received[index[branch.name]]))
+                for branch, stock in needs
+            ),
+            remaining_surplus=sum(available.values()),
+            remaining_branch_surplus=available
+        )
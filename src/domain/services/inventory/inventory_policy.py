@@ -1,7 +1,9 @@
 """Centralized domain policy for inventory adjustments and business rules."""
 
+from __future__ import annotations
+
 import math
-import pandas as pd
+import numpy as np
 from src.shared.constants import (
     MAX_BALANCE_FOR_NEED_THRESHOLD,
     MIN_COVERAGE_FOR_SMALL_NEED_SUPPRESSION,
@@ -61,26 +63,64 @@ class InventoryPolicy:
             dataframe: DataFrame containing 'balance', 'coverage_quantity', 'needed_quantity'
             
         Returns:
-            pd.DataFrame: Modified DataFrame
+            pd.DataFrame: Copy with the adjusted 'needed_quantity' column
         """
-        df = dataframe.copy()
-        
+        adjusted = InventoryPolicy.apply_array_rules(
+            dataframe['needed_quantity'].to_numpy(copy=True),
+            dataframe['balance'].to_numpy(),
+            dataframe['coverage_quantity'].to_numpy()
+        )
+        return dataframe.assign(needed_quantity=adjusted)
+
+    @staticmethod
+    def apply_array_rules(
+        needed: np.ndarray,
+        balance: np.ndarray,
+        coverage: np.ndarray,
+        work: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Applies the three rules to NumPy arrays without temporaries.
+
+        needed is adjusted in place; two boolean masks and, when given,
+        the float64 work buffer are the only scratch space. Capping keeps
+        pandas' clip dtype: the result only turns float when a capped
+        value is fractional.
+
+        Returns:
+            np.ndarray: needed, or the float buffer holding the result
+        """
+        mask = np.empty(len(needed), dtype=bool)
+        flag = np.empty(len(needed), dtype=bool)
+
         # Rule 1: Max Balance Suppression
-        df.loc[
-            df['balance'] >= MAX_BALANCE_FOR_NEED_THRESHOLD, 
-            'needed_quantity'
-        ] = 0
-        
+        np.greater_equal(balance, MAX_BALANCE_FOR_NEED_THRESHOLD, out=mask)
+        np.putmask(needed, mask, 0)
+
         # Rule 2: Small Need Suppression
-        small_need_mask = (
-            (df['coverage_quantity'] >= MIN_COVERAGE_FOR_SMALL_NEED_SUPPRESSION) &
-            (df['needed_quantity'] > 0) & 
-            (df['needed_quantity'] < MIN_NEED_THRESHOLD)
+        np.greater_equal(
+            coverage, MIN_COVERAGE_FOR_SMALL_NEED_SUPPRESSION, out=mask
         )
-        df.loc[small_need_mask, 'needed_quantity'] = 0
-        
+        np.greater(needed, 0, out=flag)
+        np.logical_and(mask, flag, out=mask)
+        np.less(needed, MIN_NEED_THRESHOLD, out=flag)
+        np.logical_and(mask, flag, out=mask)
+        np.putmask(needed, mask, 0)
+
         # Rule 3: Max Balance Capping
-        available_space = (MAX_BALANCE_FOR_NEED_THRESHOLD - df['balance']).clip(lower=0)
-        df['needed_quantity'] = df['needed_quantity'].clip(upper=available_space)
-        
-        return df
+        space = np.empty(len(needed), dtype=np.result_type(
+            balance.dtype, np.asarray(MAX_BALANCE_FOR_NEED_THRESHOLD).dtype
+        )) if work is None else work
+        np.subtract(MAX_BALANCE_FOR_NEED_THRESHOLD, balance, out=space)
+        np.maximum(space, 0, out=space)
+        np.less(space, needed, out=mask)
+        out = needed if _keeps_dtype(space[mask], needed.dtype) else space
+        np.minimum(needed, space, out=out, casting='unsafe')
+        return out
+
+
+def _keeps_dtype(values: np.ndarray, dtype) -> bool:
+    """True when values fit dtype exactly, as pandas' clip decides."""
+    if dtype.kind == 'f' or values.dtype.kind in 'iub':
+        return True
+    return bool(np.all(values == np.floor(values)))
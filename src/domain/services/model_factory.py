@@ -2,8 +2,9 @@
 
 from typing import List, Dict
 from src.domain.models.entities import (
-    Product, Branch, NetworkStockState, SurplusEntry
+    Branch, NetworkStockState, SurplusEntry
 )
+from src.domain.models.flyweights import intern_product
 
 
 class DomainModelFactory:
@@ -31,7 +32,7 @@ class DomainModelFactory:
         """Converts raw surplus dictionaries into SurplusEntry entities."""
         entries = []
         for raw in raw_surplus_list:
-            product = Product(code=raw['code'], name=raw['product_name'])
+            product = intern_product(raw['code'], raw['product_name'])
             entries.append(SurplusEntry(
                 product=product,
                 quantity=raw['quantity'],
@@ -0,0 +1,91 @@
+"""Run-wide product sort ranks shared by every export.
+
+Reports list products by case-insensitive name. Instead of lower-casing
+and string-sorting every slice they write, exporters map names to an
+integer rank that is computed once for the whole catalog and order each
+slice with a stable integer argsort, before the rows become a DataFrame.
+Ranks follow ``str.lower()`` order, equal keys keep their input order and
+non-string names sort last, as with ``sort_values(key=str.lower)``. The
+pipeline clears the index when a run starts, so names from earlier runs
+do not accumulate.
+"""
+
+import threading
+from typing import Dict, Iterable, Optional
+import numpy as np
+
+_UNRANKED = np.iinfo(np.int64).max
+
+
+class ProductSortIndex:
+    """Maps product names to dense ranks of their lower-cased form."""
+
+    def __init__(self):
+        self._ranks: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def register(self, names: Iterable) -> None:
+        """Adds names, re-ranking the catalog only when some are new."""
+        new_names = {
+            name for name in names
+            if isinstance(name, str) and name not in self._ranks
+        }
+        if not new_names:
+            return
+        with self._lock:
+            known = self._ranks
+            keys = sorted({name.lower() for name in (*known, *new_names)})
+            positions = {key: position for position, key in enumerate(keys)}
+            self._ranks = {
+                name: positions[name.lower()] for name in (*known, *new_names)
+            }
+
+    def ranks(self, names) -> np.ndarray:
+        """Integer rank per name; unseen names are registered first."""
+        names = list(names)
+        ranked = self._lookup(names)
+        unknown = [
+            name for name, rank in zip(names, ranked)
+            if rank < 0 and isinstance(name, str)
+        ]
+        if unknown:
+            self.register(unknown)
+            ranked = self._lookup(names)
+        ranked[ranked < 0] = _UNRANKED
+        return ranked
+
+    def order(self, names) -> np.ndarray:
+        """Positions that sort names case-insensitively, ties kept stable."""
+        return np.argsort(self.ranks(names), kind='stable')
+
+    def _lookup(self, names: list) -> np.ndarray:
+        """Known ranks, with -1 for names not registered yet."""
+        ranks = self._ranks
+        return np.fromiter(
+            (ranks.get(name, -1) for name in names),
+            dtype=np.int64, count=len(names)
+        )
+
+    def clear(self) -> None:
+        """Forgets every registered name."""
+        with self._lock:
+            self._ranks = {}
+
+
+_index: Optional[ProductSortIndex] = None
+
+
+def get_product_sort_index() -> ProductSortIndex:
+    """Returns the process-wide sort index, creating it on first use."""
+    global _index
+    if _index is None:
+        _index = ProductSortIndex()
+    return _index
+
+
+def sort_records_by_name(records: list, key: str = 'product_name') -> list:
+    """Orders row dicts by the shared product name ranks."""
+    order = get_product_sort_index().order(
+        [record[key] for record in records]
+    )
+    return [records[position] for position in order]
@@ -0,0 +1,67 @@
+"""Mtime-keyed cache of artifact listings to avoid repeated tree walks."""
+
+import os
+import threading
+from typing import Any, Dict, Hashable, List, Optional
+
+
+class DirectoryIndexCache:
+    """Caches listing results until a pipeline write or directory change.
+
+    Each entry remembers the modification time of every directory that was
+    listed to build it. A lookup only stats those directories, so reruns
+    with unchanged outputs never call ``os.listdir``. Files rewritten in
+    place do not touch directory mtimes, so the pipeline also calls
+    ``invalidate`` after each service.
+    """
+
+    _instance = None
+    _entries: Dict[Hashable, tuple] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(DirectoryIndexCache, cls).__new__(cls)
+        return cls._instance
+
+    def lookup(self, key: Hashable) -> Optional[List[Dict[str, Any]]]:
+        """Returns a copy of the cached listing or None when stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        signature, results = entry
+        if any(
+            read_directory_mtime(path) != mtime
+            for path, mtime in signature.items()
+        ):
+            self.discard(key)
+            return None
+        return [dict(item) for item in results]
+
+    def store(
+        self, key: Hashable, results: List[Dict[str, Any]],
+        signature: Dict[str, Optional[int]]
+    ) -> None:
+        """Stores a listing with the directory mtimes it was built from."""
+        snapshot = [dict(item) for item in results]
+        with self._lock:
+            self._entries[key] = (dict(signature), snapshot)
+
+    def discard(self, key: Hashable) -> None:
+        """Drops a single cached listing."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self) -> None:
+        """Drops every cached listing after outputs were written."""
+        with self._lock:
+            self._entries.clear()
+
+
+def read_directory_mtime(path: str) -> Optional[int]:
+    """Returns a directory's mtime in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
@@ -0,0 +1,66 @@
+"""Persisted per-product distribution results keyed by input row hashes."""
+
+import os
+import pickle
+import tempfile
+from typing import Dict, Optional, Tuple
+
+
+class DistributionStateStore:
+    """Keeps {code: (fingerprint, DistributionResult)} between runs.
+
+    Entries are only returned for the policy signature they were saved
+    with. The unpickled state is memoized per file and (mtime, size), so
+    the optimize and report steps of one run read it from disk once.
+    """
+
+    _memo: Dict[str, Tuple[tuple, str, dict]] = {}
+
+    def __init__(self, path: Optional[str] = None):
+        from src.shared.config import paths
+        self._path = path or paths.DISTRIBUTION_STATE_PATH
+
+    def load(self, signature: str) -> Dict[str, tuple]:
+        """Returns stored entries, or {} when missing or saved differently."""
+        stat = _stat_signature(self._path)
+        if stat is None:
+            return {}
+        memo = self._memo.get(self._path)
+        if memo is None or memo[0] != stat:
+            try:
+                with open(self._path, 'rb') as handle:
+                    stored_signature, entries = pickle.load(handle)
+            except Exception:
+                return {}
+            memo = (stat, stored_signature, entries)
+            self._memo[self._path] = memo
+        return memo[2] if memo[1] == signature else {}
+
+    def save(self, signature: str, entries: Dict[str, tuple]) -> None:
+        """Atomically replaces the stored entries."""
+        directory = os.path.dirname(self._path) or "."
+        os.makedirs(directory, exist_ok=True)
+        descriptor, partial = tempfile.mkstemp(dir=directory, suffix='.part')
+        with os.fdopen(descriptor, 'wb') as handle:
+            pickle.dump(
+                (signature, entries), handle, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(partial, self._path)
+        self._memo[self._path] = (
+            _stat_signature(self._path), signature, entries
+        )
+
+    def clear(self) -> None:
+        """Deletes the stored state."""
+        self._memo.pop(self._path, None)
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+
+def _stat_signature(path: str) -> Optional[tuple]:
+    """Returns (mtime_ns, size) of a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,101 @@
+"""Content fingerprints of written outputs, so unchanged files are kept.
+
+The ledger is a JSON-lines file: each write appends one
+``[path, fingerprint, mtime_ns, size]`` line and the latest line per path
+wins. Superseded lines are compacted away when the ledger is loaded.
+"""
+
+import json
+import os
+import threading
+from typing import Tuple
+
+COMPACT_RATIO = 2
+
+_lock = threading.Lock()
+_loaded: dict = {}
+
+
+def frame_fingerprint(dataframe) -> str:
+    """Hashes a DataFrame's columns and values."""
+    import hashlib
+    import pandas as pd
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(dataframe.columns)).encode('utf-8'))
+    digest.update(
+        pd.util.hash_pandas_object(dataframe, index=False).to_numpy().tobytes()
+    )
+    return digest.hexdigest()
+
+
+def is_output_current(path: str, fingerprint: str) -> bool:
+    """True when path was written from the same content and is untouched."""
+    from src.shared.constants import INCREMENTAL_DISTRIBUTION
+    if not INCREMENTAL_DISTRIBUTION:
+        return False
+    entry = _entries().get(os.path.abspath(path))
+    return entry is not None and entry == [fingerprint, *_file_state(path)]
+
+
+def remember_output(path: str, fingerprint: str) -> None:
+    """Appends the fingerprint of a file that was just written."""
+    key = os.path.abspath(path)
+    entry = [fingerprint, *_file_state(path)]
+    with _lock:
+        _entries()[key] = entry
+        ledger_path = _ledger_path()
+        os.makedirs(os.path.dirname(ledger_path) or ".", exist_ok=True)
+        with open(ledger_path, 'a', encoding='utf-8') as handle:
+            handle.write(json.dumps([key, *entry]) + '\n')
+
+
+def _entries() -> dict:
+    """Returns the ledger for the configured path, loading it once."""
+    ledger_path = _ledger_path()
+    if ledger_path not in _loaded:
+        entries, line_count = _read_ledger(ledger_path)
+        if line_count > COMPACT_RATIO * len(entries):
+            _write_ledger(ledger_path, entries)
+        _loaded[ledger_path] = entries
+    return _loaded[ledger_path]
+
+
+def _read_ledger(ledger_path: str) -> Tuple[dict, int]:
+    """Replays ledger lines, skipping missing files and partial lines."""
+    entries, line_count = {}, 0
+    try:
+        with open(ledger_path, 'r', encoding='utf-8') as handle:
+            for line in handle:
+                line_count += 1
+                try:
+                    key, *entry = json.loads(line)
+                except ValueError:
+                    continue
+                entries[key] = entry
+    except OSError:
+        pass
+    return entries, line_count
+
+
+def _write_ledger(ledger_path: str, entries: dict) -> None:
+    """Rewrites the ledger with one line per path."""
+    os.makedirs(os.path.dirname(ledger_path) or ".", exist_ok=True)
+    with open(f"{ledger_path}.part", 'w', encoding='utf-8') as handle:
+        for key, entry in entries.items():
+            handle.write(json.dumps([key, *entry]) + '\n')
+    os.replace(f"{ledger_path}.part", ledger_path)
+
+
+def _file_state(path: str) -> list:
+    """Returns [mtime_ns, size] of a file, or [None, None] if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return [None, None]
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _ledger_path() -> str:
+    """Reads the ledger location at call time so tests can redirect it."""
+    from src.shared.config import paths
+    return paths.OUTPUT_LEDGER_PATH
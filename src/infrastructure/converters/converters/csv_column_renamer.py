@@ -3,9 +3,15 @@
 import pandas as pd
 from src.infrastructure.converters.mappers.column_mapper import get_column_mapping
 
+_VERBATIM = {'dtype': str, 'keep_default_na': False}
+
 
 def _read_csv_with_date_detection(csv_path: str) -> tuple:
-    """Read CSV and detect date header."""
+    """Read CSV and detect date header.
+
+    Cells are kept as the text they are, so codes such as 000123 and
+    every other value are copied through unchanged.
+    """
     with open(csv_path, 'r', encoding='utf-8-sig') as file:
         first_line = file.readline().strip()
     
@@ -13,10 +19,12 @@ def _read_csv_with_date_detection(csv_path: str) -> tuple:
     start_date, end_date = extract_dates_from_header(first_line)
     
     if start_date and end_date:
-        dataframe = pd.read_csv(csv_path, skiprows=1, encoding='utf-8-sig')
+        dataframe = pd.read_csv(
+            csv_path, skiprows=1, encoding='utf-8-sig', **_VERBATIM
+        )
         return dataframe, True, first_line
         
-    dataframe = pd.read_csv(csv_path, encoding='utf-8-sig')
+    dataframe = pd.read_csv(csv_path, encoding='utf-8-sig', **_VERBATIM)
     return dataframe, False, first_line
 
 
@@ -0,0 +1,106 @@
+"""Repository that pairs a SQLite store with the CSV/Excel file tree."""
+
+from typing import List, Dict
+from src.domain.models.entities import (
+    Product, Branch, StockLevel, ConsolidatedStock, BranchStock
+)
+from src.domain.models.distribution import Transfer, DistributionResult
+from src.application.ports.repository import DataRepository
+from src.infrastructure.repositories.base.pandas_repository import (
+    PandasDataRepository
+)
+from src.infrastructure.repositories.base.sqlite_repository import (
+    SqliteDataRepository
+)
+
+
+class CompositeDataRepository(DataRepository):
+    """Reads from SQLite first and writes both tables and export files.
+
+    The GUI and the archiver read the CSV and Excel exports, so every save
+    still goes to the file repository; stock, transfers and surplus are
+    also stored in SQLite, and loads fall back to the files when the run
+    has no rows yet. Consolidated input is copied into SQLite on first load.
+    """
+
+    def __init__(
+        self, store: SqliteDataRepository, files: PandasDataRepository
+    ):
+        self._store = store
+        self._files = files
+
+    def load_branches(self) -> List[Branch]:
+        return self._files.load_branches()
+
+    def load_products(self) -> List[Product]:
+        return [item.product for item in self.load_consolidated_stock()]
+
+    def load_consolidated_stock(self) -> List[ConsolidatedStock]:
+        items = self._store.load_consolidated_stock()
+        if not items:
+            items = self._files.load_consolidated_stock()
+            self._store.save_consolidated_stock(items)
+        return items
+
+    def load_product_fingerprints(self) -> Dict[str, str]:
+        return self._files.load_product_fingerprints()
+
+    def load_products_by_code(self, codes) -> List[Product]:
+        return self._files.load_products_by_code(codes)
+
+    def load_stock_levels(self, branch: Branch) -> Dict[str, StockLevel]:
+        return (
+            self._store.load_stock_levels(branch)
+            or self._files.load_stock_levels(branch)
+        )
+
+    def load_stock_levels_by_code(self, branch, codes):
+        return self._files.load_stock_levels_by_code(branch, codes)
+
+    def save_branch_stocks(self, branch: Branch, stocks: List[BranchStock]):
+        self._files.save_branch_stocks(branch, stocks)
+        self._store.save_branch_stocks(branch, stocks)
+
+    def load_transfers(self) -> List[Transfer]:
+        return self._store.load_transfers() or self._files.load_transfers()
+
+    def save_transfers(self, transfers: List[Transfer]):
+        self._files.save_transfers(transfers)
+        self._store.save_transfers(transfers)
+
+    def save_remaining_surplus(self, results: List[DistributionResult]):
+        self._files.save_remaining_surplus(results)
+        self._store.save_remaining_surplus(results)
+
+    def load_remaining_surplus(self, branch: Branch) -> List[Dict]:
+        return (
+            self._store.load_remaining_surplus(branch)
+            or self._files.load_remaining_surplus(branch)
+        )
+
+    def save_shortage_report(self, results: List[DistributionResult]):
+        self._files.save_shortage_report(results)
+
+    def save_split_transfers(self, transfers_list, excel_directory):
+        self._files.save_split_transfers(transfers_list, excel_directory)
+
+    def save_combined_transfers(
+        self, branch, merged_data_list, separate_data_list, timestamp_string
+    ):
+        self._files.save_combined_transfers(
+            branch, merged_data_list, separate_data_list, timestamp_string
+        )
+
+    def save_scenario_comparison(self, summary_rows, product_rows):
+        self._files.save_scenario_comparison(summary_rows, product_rows)
+
+    def list_outputs(self, category_name, branch_name_filter=None):
+        return self._files.list_outputs(category_name, branch_name_filter)
+
+    def find_product_surplus(self, product_code: str) -> List[Dict]:
+        """Returns every branch still holding surplus of a product."""
+        return self._store.find_product_surplus(product_code)
+
+    def find_product_transfers(self, product_code: str) -> List[Dict]:
+        """Returns every planned transfer of a product across branches."""
+        return self._store.find_product_transfers(product_code)
@@ -5,20 +5,9 @@ from src.domain.models.entities import (
     Product, Branch, StockLevel, ConsolidatedStock, BranchStock
 )
 from src.domain.models.distribution import Transfer, DistributionResult
+from src.domain.models.flyweights import intern_branch
 from src.application.ports.repository import DataRepository
 from src.shared.constants import BRANCHES
-from src.infrastructure.repositories.persistence.transfers_persistence import (
-    save_step7_transfers, save_step8_split_transfers
-)
-from src.infrastructure.repositories.persistence.surplus_persistence import (
-    save_surplus_reports
-)
-from src.infrastructure.repositories.persistence.shortage_persistence import (
-    save_shortage_reports
-)
-from src.infrastructure.repositories.persistence.combined_transfers_persistence import (
-    save_step11_combined_transfers
-)
 from src.infrastructure.repositories.metadata.artifact_lister import ArtifactLister
 from src.infrastructure.repositories.io.stock_reader import StockReader
 from src.infrastructure.repositories.io.stock_writer import StockWriter
@@ -28,7 +17,11 @@ from src.infrastructure.cache.data_cache import DataSnapshotCache
 
 
 class PandasDataRepository(DataRepository):
-    """Facade for persistence, delegating to specialized components."""
+    """Facade for persistence, delegating to specialized components.
+
+    Persistence modules (pandas, openpyxl) are imported on first save so
+    that browsing outputs does not pay for them.
+    """
 
     def __init__(self, input_dir: str, output_dir: str, **kwargs):
         self._output_dir = output_dir
@@ -40,20 +33,41 @@ class PandasDataRepository(DataRepository):
         self._surplus = SurplusReader(kwargs.get('surplus_dir', output_dir))
         self._transfers = TransferReader(output_dir)
         self._input_dir = input_dir
+        self._scenario_dir = kwargs.get('scenario_dir', output_dir)
 
     def load_branches(self) -> List[Branch]:
-        return [Branch(name=name) for name in BRANCHES]
+        return [intern_branch(name) for name in BRANCHES]
 
     def load_products(self) -> List[Product]:
         consolidated = self.load_consolidated_stock()
         return [item.product for item in consolidated]
 
     def load_consolidated_stock(self) -> List[ConsolidatedStock]:
+        return self._reader.load_consolidated_stock(self._latest_input_path())
+
+    def load_product_fingerprints(self) -> Dict[str, str]:
+        return self._reader.load_row_fingerprints(self._latest_input_path())
+
+    def load_products_by_code(self, codes) -> List[Product]:
+        consolidated = self._reader.load_consolidated_stock(
+            self._latest_input_path(), codes
+        )
+        return [item.product for item in consolidated]
+
+    def load_stock_levels_by_code(self, branch, codes):
+        key = f"stock_levels_{branch.name}"
+        if self._cache.has(key):
+            return super().load_stock_levels_by_code(branch, codes)
+        return self._reader.load_stock_levels(
+            branch.name, self._get_current_duration(), codes
+        )
+
+    def _latest_input_path(self) -> Optional[str]:
+        """Returns the latest renamed CSV, or None when there is none."""
         from src.shared.utility.file_handler import get_latest_file
         import os
         name = get_latest_file(self._input_dir, ".csv")
-        path = os.path.join(self._input_dir, name) if name else None
-        return self._reader.load_consolidated_stock(path)
+        return os.path.join(self._input_dir, name) if name else None
 
     def load_stock_levels(self, branch: Branch) -> Dict[str, StockLevel]:
         key = f"stock_levels_{branch.name}"
@@ -89,19 +103,31 @@ class PandasDataRepository(DataRepository):
         self._writer.save_branch_stocks(branch, stocks)
 
     def save_transfers(self, transfers: List[Transfer]):
+        from src.infrastructure.repositories.persistence.transfers_persistence import (
+            save_step7_transfers
+        )
         save_step7_transfers(transfers, self._transfers_dir)
 
     def save_split_transfers(self, transfers_list, excel_directory):
         from datetime import datetime
+        from src.infrastructure.repositories.persistence.transfers_persistence import (
+            save_step8_split_transfers
+        )
         now = datetime.now().strftime("%Y%m%d_%H%M%S")
         save_step8_split_transfers(
             transfers_list, self._transfers_dir, excel_directory, now
         )
 
     def save_remaining_surplus(self, results: List[DistributionResult]):
+        from src.infrastructure.repositories.persistence.surplus_persistence import (
+            save_surplus_reports
+        )
         save_surplus_reports(results, self._lister._surplus_directory)
 
     def save_shortage_report(self, results: List[DistributionResult]):
+        from src.infrastructure.repositories.persistence.shortage_persistence import (
+            save_shortage_reports
+        )
         save_shortage_reports(results, self._lister._shortage_directory)
 
     def load_remaining_surplus(self, branch: Branch) -> List[Dict]:
@@ -110,9 +136,18 @@ class PandasDataRepository(DataRepository):
     def save_combined_transfers(
         self, branch, merged_data_list, separate_data_list, timestamp_string
     ):
+        from src.infrastructure.repositories.persistence.combined_transfers_persistence import (
+            save_step11_combined_transfers
+        )
         save_step11_combined_transfers(
             branch, merged_data_list, separate_data_list, timestamp_string
         )
 
+    def save_scenario_comparison(self, summary_rows, product_rows):
+        from src.infrastructure.repositories.persistence.scenario_persistence import (
+            save_scenario_comparison
+        )
+        save_scenario_comparison(summary_rows, product_rows, self._scenario_dir)
+
     def list_outputs(self, category_name, branch_name_filter=None):
         return self._lister.list_outputs(category_name, branch_name_filter)
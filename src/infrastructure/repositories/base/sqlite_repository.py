@@ -0,0 +1,184 @@
+"""SQLite-backed implementation of the DataRepository port."""
+
+import os
+from typing import List, Dict, Optional
+from src.domain.models.entities import (
+    Product, Branch, StockLevel, ConsolidatedStock, BranchStock
+)
+from src.domain.models.distribution import Transfer, DistributionResult
+from src.domain.models.flyweights import intern_branch
+from src.domain.services.inventory.stock_calculator import StockCalculator
+from src.domain.services.product_ordering import get_product_sort_index
+from src.application.ports.repository import DataRepository
+from src.infrastructure.cache.data_cache import DataSnapshotCache
+from src.infrastructure.repositories.io.sqlite_store import SqliteStore
+from src.infrastructure.repositories.mappers.row_mappers import RowMapper
+from src.shared.constants import BRANCHES
+
+
+class SqliteDataRepository(DataRepository):
+    """Keeps stock, transfers and surplus in indexed SQLite tables.
+
+    Rows are keyed by run, branch and product, where the run is the latest
+    renamed input CSV (name and mtime); only that run's rows are kept.
+    Transfers load in insert order, matching the CSV. Loads return empty
+    results when a run has no rows. Split, combined, shortage and scenario
+    exports are file layouts only, so this repository stores nothing for
+    them; use CompositeDataRepository to write those files alongside the tables.
+    """
+
+    def __init__(self, database_path: str, input_dir: str):
+        self._store = SqliteStore(database_path)
+        self._input_dir = input_dir
+        self._cache = DataSnapshotCache()
+
+    def load_branches(self) -> List[Branch]:
+        return [intern_branch(name) for name in BRANCHES]
+
+    def load_products(self) -> List[Product]:
+        return [item.product for item in self.load_consolidated_stock()]
+
+    def load_consolidated_stock(self) -> List[ConsolidatedStock]:
+        return RowMapper.to_consolidated(
+            self._select_stock(self._get_run_id(), "consolidated")
+        )
+
+    def save_consolidated_stock(self, items: List[ConsolidatedStock]) -> None:
+        """Stores consolidated input stock for every branch of the run."""
+        run_id = self._get_run_id()
+        if not (run_id and items):
+            return
+        for branch in BRANCHES:
+            self._store.replace_stock_levels(
+                run_id, "consolidated", branch,
+                RowMapper.consolidated_rows(run_id, branch, items)
+            )
+
+    def load_stock_levels(self, branch: Branch) -> Dict[str, StockLevel]:
+        key = f"stock_levels_{branch.name}"
+        if not self._cache.has(key):
+            rows = self._select_stock(self._get_run_id(), "branch", branch.name)
+            if not rows:
+                return {}
+            days = self._get_current_duration()
+            self._cache.set(key, {
+                row["code"]: StockCalculator.calculate_stock_level(
+                    row["sales"], row["balance"], days
+                ) for row in rows
+            })
+        return self._cache.get(key)
+
+    def save_branch_stocks(self, branch: Branch, stocks: List[BranchStock]):
+        run_id = self._get_run_id()
+        if run_id:
+            self._store.replace_stock_levels(
+                run_id, "branch", branch.name,
+                RowMapper.branch_stock_rows(run_id, branch, stocks)
+            )
+
+    def load_transfers(self) -> List[Transfer]:
+        if not self._cache.has("step7"):
+            rows = self._store.select(
+                "SELECT * FROM transfers WHERE run_id = ? ORDER BY rowid",
+                (self._get_run_id(),)
+            )
+            if not rows:
+                return []
+            self._cache.set("step7", [RowMapper.to_transfer(r) for r in rows])
+        return self._cache.get("step7")
+
+    def save_transfers(self, transfers: List[Transfer]):
+        run_id = self._get_run_id()
+        if run_id:
+            self._store.replace_transfers(
+                run_id, RowMapper.transfer_rows(run_id, transfers)
+            )
+
+    def save_remaining_surplus(self, results: List[DistributionResult]):
+        run_id = self._get_run_id()
+        if run_id:
+            self._store.replace_surplus(
+                run_id, RowMapper.surplus_rows(run_id, results)
+            )
+
+    def load_remaining_surplus(self, branch: Branch) -> List[Dict]:
+        rows = self._store.select(
+            "SELECT code, product_name, quantity FROM surplus "
+            "WHERE run_id = ? AND branch = ?",
+            (self._get_run_id(), branch.name)
+        )
+        order = get_product_sort_index().order(
+            [row["product_name"] for row in rows]
+        )
+        return [
+            dict(rows[index], target_branch='administration',
+                 transfer_type='surplus')
+            for index in order
+        ]
+
+    def save_shortage_report(self, results: List[DistributionResult]):
+        pass
+
+    def save_split_transfers(self, transfers_list, excel_directory):
+        pass
+
+    def save_combined_transfers(
+        self, branch, merged_data_list, separate_data_list, timestamp_string
+    ):
+        pass
+
+    def save_scenario_comparison(self, summary_rows, product_rows):
+        pass
+
+    def list_outputs(self, category_name, branch_name_filter=None):
+        return []
+
+    def find_product_surplus(self, product_code: str) -> List[Dict]:
+        """Returns every branch still holding surplus of a product."""
+        return self._store.select(
+            "SELECT branch, quantity FROM surplus "
+            "WHERE run_id = ? AND code = ? ORDER BY quantity DESC",
+            (self._get_run_id(), str(product_code))
+        )
+
+    def find_product_transfers(self, product_code: str) -> List[Dict]:
+        """Returns every planned transfer of a product across branches."""
+        return self._store.select(
+            "SELECT from_branch, to_branch, quantity FROM transfers "
+            "WHERE run_id = ? AND code = ? ORDER BY rowid",
+            (self._get_run_id(), str(product_code))
+        )
+
+    def _select_stock(
+        self, run_id: Optional[str], source: str, branch: str = None
+    ) -> List[Dict]:
+        """Reads stock rows of a run, optionally for one branch."""
+        query = "SELECT * FROM stock_levels WHERE run_id = ? AND source = ?"
+        parameters = (run_id, source)
+        if branch:
+            query, parameters = query + " AND branch = ?", parameters + (branch,)
+        return self._store.select(
+            query + " ORDER BY position, rowid", parameters
+        )
+
+    def _latest_input_path(self) -> Optional[str]:
+        """Returns the latest renamed CSV, or None when there is none."""
+        from src.shared.utility.file_handler import get_latest_file
+        name = get_latest_file(self._input_dir, ".csv")
+        return os.path.join(self._input_dir, name) if name else None
+
+    def _get_run_id(self) -> Optional[str]:
+        """Identifies the run by the latest input CSV name and mtime."""
+        path = self._latest_input_path()
+        if not path:
+            return None
+        return f"{os.path.basename(path)}:{os.stat(path).st_mtime_ns}"
+
+    def _get_current_duration(self) -> int:
+        """Extracts total days from the latest renamed CSV file."""
+        from src.domain.services.validation.dates import (
+            get_sheet_duration_days
+        )
+        path = self._latest_input_path()
+        duration = get_sheet_duration_days(path) if path else 0
+        return duration if duration > 0 else 90
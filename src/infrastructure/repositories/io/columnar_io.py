@@ -0,0 +1,180 @@
+"""Optional Parquet/Feather copies of CSV outputs, read back when present.
+
+Each columnar file sits next to its CSV with the same stem, so readers keep
+discovering outputs by their CSV names and switch to the binary copy only
+when it exists, is not older than the CSV and pyarrow can be imported.
+Copies are recorded under their own manifest category, so output listings
+keep showing only CSV and Excel files.
+"""
+
+import importlib.util
+import os
+from typing import Optional
+
+from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.telemetry import file_span
+
+logger = get_logger(__name__)
+
+COLUMNAR_EXTENSIONS = {'parquet': '.parquet', 'feather': '.feather'}
+_warned = set()
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def columnar_format() -> Optional[str]:
+    """Configured columnar format, or None when off or pyarrow is missing."""
+    from src.shared.constants import COLUMNAR_OUTPUT_FORMAT
+    if not COLUMNAR_OUTPUT_FORMAT:
+        return None
+    if COLUMNAR_OUTPUT_FORMAT not in COLUMNAR_EXTENSIONS:
+        _warn_once(f"Unknown columnar format: {COLUMNAR_OUTPUT_FORMAT}")
+        return None
+    if not has_pyarrow():
+        _warn_once("pyarrow is not installed; writing CSV only")
+        return None
+    return COLUMNAR_OUTPUT_FORMAT
+
+
+def columnar_path(csv_path: str, file_format: str) -> str:
+    """Path of the columnar copy of a CSV file."""
+    stem = os.path.splitext(csv_path)[0]
+    return f"{stem}{COLUMNAR_EXTENSIONS[file_format]}"
+
+
+def write_columnar(dataframe, csv_path: str, **fields) -> None:
+    """Writes the configured columnar copy of a CSV output, if enabled.
+
+    Fields are the CSV's manifest fields; a ``category`` among them is
+    replaced by the shared 'columnar' category.
+    """
+    file_format = columnar_format()
+    if file_format is None:
+        return
+    from src.infrastructure.cache.output_ledger import (
+        frame_fingerprint, is_output_current, remember_output
+    )
+    from src.infrastructure.repositories.metadata.artifact_manifest import (
+        record_artifact
+    )
+    fields.pop('category', None)
+    path = columnar_path(csv_path, file_format)
+    fingerprint = frame_fingerprint(dataframe)
+    if is_output_current(path, fingerprint) and _is_fresh(path, csv_path):
+        return
+    try:
+        with file_span(path) as span:
+            _write_frame(dataframe.reset_index(drop=True), path, file_format)
+            span.record_rows(rows_out=len(dataframe))
+            record_artifact(path, 'columnar', rows=len(dataframe), **fields)
+    except Exception as error:
+        logger.warning(f"Skipped columnar copy {path}: {error}")
+        return
+    remember_output(path, fingerprint)
+
+
+def read_table(
+    csv_path: str, columns=None, dtype: Optional[dict] = None, **read_options
+):
+    """Reads the columnar copy of a CSV when current, else the CSV itself.
+
+    columns and dtype apply to both reads: only the named columns that
+    exist are parsed, and listed dtypes are enforced. Other options apply
+    to the CSV fallback only.
+    """
+    import pandas as pd
+    wanted = set(columns) if columns is not None else None
+    path = _current_columnar_copy(csv_path)
+    if path is not None:
+        try:
+            dataframe = _read_frame(path, wanted)
+            present = {
+                column: kind for column, kind in (dtype or {}).items()
+                if column in dataframe.columns
+            }
+            return dataframe.astype(present) if present else dataframe
+        except Exception as error:
+            logger.warning(f"Falling back to CSV for {csv_path}: {error}")
+    if wanted is not None:
+        header = pd.read_csv(
+            csv_path, encoding='utf-8-sig', nrows=0, **read_options
+        ).columns
+        read_options['usecols'] = [
+            column for column in header if column in wanted
+        ]
+    return pd.read_csv(
+        csv_path, encoding='utf-8-sig', dtype=dtype, **read_options
+    )
+
+
+def has_pyarrow() -> bool:
+    """True when pyarrow can be imported."""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _current_columnar_copy(csv_path: str) -> Optional[str]:
+    """First columnar sibling that is at least as new as the CSV."""
+    if not has_pyarrow():
+        return None
+    for file_format in COLUMNAR_EXTENSIONS:
+        path = columnar_path(csv_path, file_format)
+        if _is_fresh(path, csv_path):
+            return path
+    return None
+
+
+def _is_fresh(path: str, csv_path: str) -> bool:
+    """True when path exists and is not older than its CSV."""
+    if not os.path.exists(path):
+        return False
+    return (
+        not os.path.exists(csv_path)
+        or os.path.getmtime(path) >= os.path.getmtime(csv_path)
+    )
+
+
+def _write_frame(dataframe, path: str, file_format: str) -> None:
+    """Writes a DataFrame in the given columnar format."""
+    if file_format == 'parquet':
+        dataframe.to_parquet(path, index=False)
+    else:
+        dataframe.to_feather(path)
+
+
+def _read_frame(path: str, wanted=None):
+    """Reads a columnar file, optionally only the wanted columns it has."""
+    import pandas as pd
+    is_parquet = path.endswith(COLUMNAR_EXTENSIONS['parquet'])
+    columns = None
+    if wanted is not None:
+        columns = [
+            name for name in _schema_names(path, is_parquet)
+            if name in wanted
+        ]
+    if is_parquet:
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
+
+
+def _schema_names(path: str, is_parquet: bool) -> list:
+    """Column names stored in a columnar file, without reading its data."""
+    import pyarrow
+    if is_parquet:
+        import pyarrow.parquet
+        return pyarrow.parquet.read_schema(path).names
+    import pyarrow.ipc
+    with pyarrow.ipc.open_file(path) as reader:
+        return reader.schema.names
+
+
+def _warn_once(message: str) -> None:
+    """Logs a configuration warning once per process."""
+    if message not in _warned:
+        _warned.add(message)
+        logger.warning(message)
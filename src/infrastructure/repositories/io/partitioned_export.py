@@ -0,0 +1,61 @@
+"""Single-pass partitioning of export tables into per-file slices.
+
+Exporters write one file per (source, target, category) combination.
+Filtering the whole table with a boolean mask per combination costs
+O(groups x rows); here the table is grouped once, rows are ordered by
+(group, rank) with one sort, and every partition is a contiguous run of
+that order. Partitions come out in order of first appearance, as the
+dict-based grouping did, with rows inside each ordered by ``order_by``
+(ties keep their input order).
+"""
+
+from typing import Callable, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def partition_frame(
+    dataframe: pd.DataFrame,
+    keys: List[str],
+    order_by: Optional[str] = None,
+    columns: Optional[List[str]] = None
+) -> Iterator[Tuple[tuple, pd.DataFrame]]:
+    """Yields (key values, rows) for every distinct combination of keys."""
+    if dataframe.empty:
+        return
+    group_ids = dataframe.groupby(keys, sort=False).ngroup().to_numpy()
+    if order_by is None:
+        order = np.argsort(group_ids, kind='stable')
+    else:
+        order = np.lexsort((dataframe[order_by].to_numpy(), group_ids))
+    order = order[group_ids[order] >= 0]
+    if not len(order):
+        return
+    sorted_ids = group_ids[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    key_values = [dataframe[key].to_numpy() for key in keys]
+    view = dataframe if columns is None else dataframe[columns]
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        positions = order[start:end]
+        key = tuple(values[positions[0]] for values in key_values)
+        yield key, view.iloc[positions].reset_index(drop=True)
+
+
+def export_partitions(
+    dataframe: pd.DataFrame,
+    keys: List[str],
+    writer: Callable,
+    order_by: Optional[str] = None,
+    columns: Optional[List[str]] = None
+) -> int:
+    """Calls writer(*key values, rows) per partition; returns the count."""
+    count = 0
+    for key, partition in partition_frame(dataframe, keys, order_by, columns):
+        writer(*key, partition)
+        count += 1
+    return count
@@ -0,0 +1,116 @@
+"""SQLite tables for stock, transfers and surplus keyed by run and branch."""
+
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from typing import Dict, Iterable, List, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stock_levels (
+    run_id TEXT NOT NULL, source TEXT NOT NULL, branch TEXT NOT NULL,
+    code TEXT NOT NULL, product_name TEXT, position INTEGER,
+    sales REAL, balance REAL, avg_sales REAL, needed INTEGER, surplus INTEGER,
+    PRIMARY KEY (run_id, source, branch, code)
+);
+CREATE INDEX IF NOT EXISTS stock_levels_by_code
+    ON stock_levels (run_id, code);
+CREATE TABLE IF NOT EXISTS transfers (
+    run_id TEXT NOT NULL, from_branch TEXT NOT NULL, to_branch TEXT NOT NULL,
+    code TEXT NOT NULL, product_name TEXT, quantity INTEGER,
+    sender_balance REAL, receiver_balance REAL
+);
+CREATE INDEX IF NOT EXISTS transfers_by_branch
+    ON transfers (run_id, from_branch, to_branch);
+CREATE INDEX IF NOT EXISTS transfers_by_code ON transfers (run_id, code);
+CREATE TABLE IF NOT EXISTS surplus (
+    run_id TEXT NOT NULL, branch TEXT NOT NULL, code TEXT NOT NULL,
+    product_name TEXT, quantity INTEGER,
+    PRIMARY KEY (run_id, branch, code)
+);
+CREATE INDEX IF NOT EXISTS surplus_by_code ON surplus (run_id, code);
+"""
+
+STOCK_COLUMNS = (
+    "run_id, source, branch, code, product_name, position, "
+    "sales, balance, avg_sales, needed, surplus"
+)
+RUN_TABLES = ("stock_levels", "transfers", "surplus")
+TRANSFER_COLUMNS = (
+    "run_id, from_branch, to_branch, code, product_name, quantity, "
+    "sender_balance, receiver_balance"
+)
+
+
+class SqliteStore:
+    """Bulk writes and indexed lookups over a single SQLite file.
+
+    A connection is opened per operation so worker threads of the
+    consolidate step can read concurrently without sharing handles. Only
+    the latest run is kept: writing a run deletes every other run's rows.
+    """
+
+    def __init__(self, database_path: str):
+        self._database_path = database_path
+        self._schema_ready = False
+
+    def replace_stock_levels(
+        self, run_id: str, source: str, branch: str, rows: Iterable[tuple]
+    ) -> None:
+        """Replaces stock rows for one (run, source, branch) slice."""
+        self._replace(
+            run_id,
+            "DELETE FROM stock_levels WHERE run_id = ? AND source = ? "
+            "AND branch = ?", (run_id, source, branch),
+            f"INSERT INTO stock_levels ({STOCK_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+
+    def replace_transfers(self, run_id: str, rows: Iterable[tuple]) -> None:
+        """Replaces every transfer row of a run."""
+        self._replace(
+            run_id, "DELETE FROM transfers WHERE run_id = ?", (run_id,),
+            f"INSERT INTO transfers ({TRANSFER_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+
+    def replace_surplus(self, run_id: str, rows: Iterable[tuple]) -> None:
+        """Replaces every remaining-surplus row of a run."""
+        self._replace(
+            run_id, "DELETE FROM surplus WHERE run_id = ?", (run_id,),
+            "INSERT INTO surplus (run_id, branch, code, product_name, quantity)"
+            " VALUES (?, ?, ?, ?, ?)", rows
+        )
+
+    def select(self, query: str, parameters: Tuple = ()) -> List[Dict]:
+        """Runs a read query and returns rows as dictionaries."""
+        with self._connection() as connection:
+            connection.row_factory = sqlite3.Row
+            cursor = connection.execute(query, parameters)
+            return [dict(row) for row in cursor.fetchall()]
+
+    def _replace(
+        self, run_id, delete_sql, delete_args, insert_sql, rows
+    ) -> None:
+        """Replaces a slice and drops older runs in one transaction."""
+        with self._connection() as connection:
+            for table in RUN_TABLES:
+                connection.execute(
+                    f"DELETE FROM {table} WHERE run_id != ?", (run_id,)
+                )
+            connection.execute(delete_sql, delete_args)
+            connection.executemany(insert_sql, rows)
+
+    @contextmanager
+    def _connection(self):
+        """Yields a committed-on-success connection with the schema applied."""
+        directory = os.path.dirname(self._database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(self._database_path):
+            self._schema_ready = False
+        with closing(sqlite3.connect(self._database_path)) as connection:
+            if not self._schema_ready:
+                connection.executescript(SCHEMA)
+                self._schema_ready = True
+            with connection:
+                yield connection
@@ -1,15 +1,28 @@
 """Specialized component for reading stock data from disk."""
 
+from __future__ import annotations
+
 import os
-import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from src.domain.models.entities import Product, StockLevel, ConsolidatedStock
 from src.infrastructure.repositories.mappers.mappers import StockMapper
+from src.infrastructure.repositories.mappers.product_extractor import (
+    CODE_KEYS, NAME_KEYS
+)
+from src.domain.services.product_ordering import get_product_sort_index
 from src.domain.services.validation.dates import extract_dates_from_header
+from src.infrastructure.repositories.io.columnar_io import read_table
 from src.shared.utility.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+STOCK_LEVEL_DTYPES = {
+    'code': str, 'كود': str, 'sales': 'float64', 'balance': 'float64'
+}
+_CODE_KEYS = {key.strip().lower() for key in CODE_KEYS}
+_PRODUCT_KEYS = _CODE_KEYS | {key.strip().lower() for key in NAME_KEYS}
+_METRIC_COLUMNS = set(StockMapper.metric_columns())
+
 
 class StockReader:
     """Handles loading of stock-related data from CSV files."""
@@ -17,27 +30,48 @@ class StockReader:
     def __init__(self, analytics_directory: str):
         self._analytics_directory = analytics_directory
 
-    def load_consolidated_stock(self, csv_path: str) -> List[ConsolidatedStock]:
-        """Loads and maps consolidated stock from a CSV file."""
+    def load_consolidated_stock(
+        self, csv_path: str, codes: Optional[Set[str]] = None
+    ) -> List[ConsolidatedStock]:
+        """Loads and maps consolidated stock, optionally only some codes."""
         if not csv_path or not os.path.exists(csv_path):
             return []
             
         try:
-            dataframe, days = self._read_csv_and_extract_days(csv_path)
-            dataframe.columns = [
-                column.strip().replace('\ufeff', '') 
-                for column in dataframe.columns
-            ]
-            
+            dataframe, days = self._read_normalized_csv(csv_path)
+            self._register_product_names(dataframe)
+            if codes is not None:
+                dataframe = self._filter_codes(dataframe, codes)
             return self._map_dataframe_to_entities(dataframe, days)
         except Exception as error:
             logger.error(f"Error loading stock from {csv_path}: {error}")
             return []
 
+    def load_row_fingerprints(self, csv_path: str) -> Dict[str, str]:
+        """Maps each product code to a hash of its input row and period.
+
+        Returns {} when codes repeat, since rows then cannot be told apart.
+        """
+        if not csv_path or not os.path.exists(csv_path):
+            return {}
+        import pandas as pd
+        dataframe, days = self._read_normalized_csv(csv_path)
+        codes = self._valid_codes(dataframe)
+        if codes is None or codes.duplicated().any():
+            return {}
+        hashes = pd.util.hash_pandas_object(
+            dataframe.loc[codes.index], index=False
+        )
+        return {
+            code: f"{days}:{value:016x}"
+            for code, value in zip(codes, hashes.to_numpy())
+        }
+
     def load_stock_levels(
-        self, branch_name: str, days: int = 90
+        self, branch_name: str, days: int = 90,
+        codes: Optional[Set[str]] = None
     ) -> Dict[str, StockLevel]:
-        """Reads branch-specific stock levels from disk."""
+        """Reads branch-specific stock levels, optionally only some codes."""
         path = os.path.join(
             self._analytics_directory, 
             branch_name, 
@@ -47,14 +81,70 @@ class StockReader:
             return {}
             
         try:
-            dataframe = pd.read_csv(path, encoding='utf-8-sig')
+            dataframe = read_table(
+                path, columns=list(STOCK_LEVEL_DTYPES), dtype=STOCK_LEVEL_DTYPES
+            )
+            if codes is not None and 'code' in dataframe.columns:
+                dataframe = dataframe[
+                    dataframe['code'].astype(str).isin(codes)
+                ]
             return self._parse_stocks_dataframe(dataframe, days)
         except Exception as error:
             logger.error(f"Error loading levels for {branch_name}: {error}")
             return {}
 
+    def _read_normalized_csv(self, path: str) -> tuple[pd.DataFrame, int]:
+        """Reads the normalized CSV with cleaned column names."""
+        dataframe, days = self._read_csv_and_extract_days(path)
+        dataframe.columns = [
+            column.strip().replace('\ufeff', '')
+            for column in dataframe.columns
+        ]
+        return dataframe, days
+
+    def _register_product_names(self, dataframe: pd.DataFrame) -> None:
+        """Ranks the whole catalog once for every export of this run."""
+        name_column = self._find_column(dataframe, NAME_KEYS)
+        if name_column is not None:
+            get_product_sort_index().register(
+                dataframe[name_column].astype(str).str.strip().tolist()
+            )
+
+    def _valid_codes(self, dataframe: pd.DataFrame) -> Optional[pd.Series]:
+        """Codes of rows ProductExtractor accepts, or None if unknown."""
+        code_column = self._find_column(dataframe, CODE_KEYS)
+        name_column = self._find_column(dataframe, NAME_KEYS)
+        if code_column is None or name_column is None:
+            return None
+        codes = dataframe[code_column].astype(str).str.strip()
+        names = dataframe[name_column].astype(str).str.strip()
+        valid = ~codes.isin(['', 'nan']) & ~names.isin(['', 'nan'])
+        return codes[valid]
+
+    def _filter_codes(self, dataframe: pd.DataFrame, codes: Set[str]):
+        """Keeps only rows whose product code is in codes."""
+        code_column = self._find_column(dataframe, CODE_KEYS)
+        if code_column is None:
+            return dataframe
+        return dataframe[
+            dataframe[code_column].astype(str).str.strip().isin(codes)
+        ]
+
+    @staticmethod
+    def _find_column(dataframe: pd.DataFrame, keys: List[str]):
+        """Returns the first column matching keys, as ProductExtractor does."""
+        for key in keys:
+            if key in dataframe.columns:
+                return key
+        normalized_keys = [key.strip().lower() for key in keys]
+        for column in dataframe.columns:
+            if str(column).strip().lower() in normalized_keys:
+                return column
+        return None
+
     def _read_csv_and_extract_days(self, path: str) -> tuple[pd.DataFrame, int]:
         """Reads CSV and extracts total days from date header."""
+        import pandas as pd
         from src.domain.services.validation.dates import (
             extract_dates_from_header, calculate_days_between
         )
@@ -76,7 +166,17 @@ class StockReader:
             if first_column.startswith('Unnamed') or 'الفترة من' in first_column:
                 skip = 1
 
-        dataframe = pd.read_csv(path, skiprows=skip, encoding='utf-8-sig')
+        header = pd.read_csv(
+            path, skiprows=skip, encoding='utf-8-sig', nrows=0
+        ).columns
+        dataframe = pd.read_csv(
+            path, skiprows=skip, encoding='utf-8-sig',
+            usecols=[column for column in header if _is_input_column(column)],
+            dtype={
+                column: str for column in header
+                if _clean_column(column).lower() in _CODE_KEYS
+            }
+        )
         return dataframe, days
 
     def _map_dataframe_to_entities(
@@ -106,3 +206,14 @@ class StockReader:
                     row, days
                 )
         return stocks
+
+
+def _clean_column(column) -> str:
+    """Header name as the readers compare it."""
+    return str(column).strip().replace('\ufeff', '')
+
+
+def _is_input_column(column) -> bool:
+    """True for the code, name and branch metric columns of the input."""
+    name = _clean_column(column)
+    return name in _METRIC_COLUMNS or name.lower() in _PRODUCT_KEYS
@@ -4,6 +4,11 @@ import os
 from typing import List
 from src.domain.models.entities import Branch, BranchStock
 from src.infrastructure.repositories.mappers.mappers import StockMapper
+from src.shared.utility.telemetry import file_span
+from src.infrastructure.repositories.metadata.artifact_manifest import (
+    record_artifact
+)
+from src.infrastructure.repositories.io.columnar_io import write_columnar
 
 
 class StockWriter:
@@ -21,4 +26,10 @@ class StockWriter:
         os.makedirs(directory, exist_ok=True)
         filename = f"main_analysis_{branch.name}.csv"
         path = os.path.join(directory, filename)
-        dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+        with file_span(path) as span:
+            dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+            span.record_rows(rows_in=len(stocks), rows_out=len(dataframe))
+            record_artifact(
+                path, 'analytics', branch.name, rows=len(dataframe)
+            )
+        write_columnar(dataframe, path, source=branch.name)
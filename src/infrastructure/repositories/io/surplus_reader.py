@@ -1,12 +1,16 @@
 """Specialized component for reading surplus data from disk."""
 
 import os
-import pandas as pd
 from typing import List, Dict
+from src.infrastructure.repositories.io.columnar_io import read_table
 from src.shared.utility.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+SURPLUS_DTYPES = {
+    'code': str, 'product_name': str, 'remaining_surplus': 'float32'
+}
+
 
 class SurplusReader:
     """Handles loading of surplus reports for inventory management."""
@@ -38,7 +42,9 @@ class SurplusReader:
     def _parse_surplus_csv(self, path: str) -> List[Dict]:
         """Parses a surplus CSV into a list of dictionaries for the UI."""
         try:
-            dataframe = pd.read_csv(path, encoding='utf-8-sig')
+            dataframe = read_table(
+                path, columns=list(SURPLUS_DTYPES), dtype=SURPLUS_DTYPES
+            )
             results = []
             for _, row in dataframe.iterrows():
                 results.append({
@@ -1,14 +1,21 @@
 """Specialized component for reading transfer data from disk."""
 
+from __future__ import annotations
+
 import os
-import pandas as pd
 from typing import List
-from src.domain.models.entities import Product, Branch
+from src.domain.models.flyweights import intern_branch, intern_product
 from src.domain.models.distribution import Transfer
+from src.infrastructure.repositories.io.columnar_io import read_table
 from src.shared.utility.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+TRANSFER_DTYPES = {
+    'code': str, 'product_name': str, 'quantity_to_transfer': 'float32',
+    'sender_balance': 'float64', 'receiver_balance': 'float64'
+}
+
 
 class TransferReader:
     """Handles discovery and parsing of transfer-related CSV files."""
@@ -49,7 +56,9 @@ class TransferReader:
         target_branch = name_parts[1].split('_')[0]
         
         try:
-            dataframe = pd.read_csv(path, encoding='utf-8-sig')
+            dataframe = read_table(
+                path, columns=list(TRANSFER_DTYPES), dtype=TRANSFER_DTYPES
+            )
             return self._map_rows_to_transfers(
                 dataframe, source_branch, target_branch
             )
@@ -65,14 +74,12 @@ class TransferReader:
     ) -> List[Transfer]:
         """Maps dataframe rows to Transfer domain objects."""
         results = []
+        from_branch, to_branch = intern_branch(source), intern_branch(target)
         for _, row in dataframe.iterrows():
             results.append(Transfer(
-                product=Product(
-                    code=str(row['code']), 
-                    name=row['product_name']
-                ),
-                from_branch=Branch(name=source),
-                to_branch=Branch(name=target),
+                product=intern_product(str(row['code']), row['product_name']),
+                from_branch=from_branch,
+                to_branch=to_branch,
                 quantity=int(row['quantity_to_transfer']),
                 sender_balance=float(row.get('sender_balance', 0.0)),
                 receiver_balance=float(row.get('receiver_balance', 0.0))
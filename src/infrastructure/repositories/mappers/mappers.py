@@ -1,6 +1,7 @@
 """Mapper for converting between domain models and data structures."""
 
-import pandas as pd
+from __future__ import annotations
+
 from typing import Dict, List, Optional
 from src.domain.models.entities import (
     StockLevel, ConsolidatedStock, BranchStock
@@ -52,9 +53,19 @@ class StockMapper:
             days_covered=days
         )
 
+    @staticmethod
+    def metric_columns() -> List[str]:
+        """Every column name _calculate_branch_stock may read."""
+        return [
+            f"{branch}{suffix}" if "_" in suffix else f"{suffix}{branch}"
+            for branch in BRANCHES
+            for suffix in ("_sales", " مبيعات", "_balance", " رصيد")
+        ]
+
     @staticmethod
     def _find_metric(row: pd.Series, branch: str, suffixes: List[str]) -> float:
         """Finds a specific numeric metric for a branch in the row."""
+        import pandas as pd
         for suffix in suffixes:
             key = f"{branch}{suffix}" if "_" in suffix else f"{suffix}{branch}"
             if key in row:
@@ -77,6 +88,7 @@ class StockMapper:
     @staticmethod
     def to_branch_dataframe(stocks: List[BranchStock]) -> pd.DataFrame:
         """Converts a list of BranchStock to a saving-ready DataFrame."""
+        import pandas as pd
         records = []
         for branch_stock in stocks:
             records.append({
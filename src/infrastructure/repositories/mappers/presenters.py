@@ -1,81 +1,54 @@
-"""Presenter for transforming domain reports into dataframes."""
+"""Presenter for splitting consolidated records into export payloads."""
 
 import pandas as pd
 from typing import List, Dict
-from src.domain.models.distribution import ConsolidatedLogisticsReport
+from src.infrastructure.repositories.io.partitioned_export import (
+    partition_frame
+)
 
 
 class LogisticsPresenter:
     """Transforms domain entities into payloads for the repository."""
 
-    def prepare_payloads(
-        self, report: ConsolidatedLogisticsReport
+    def prepare_table_payloads(
+        self, dataframe: pd.DataFrame
     ) -> tuple[List[Dict], List[Dict]]:
-        """Main entry point for generating merged and separate payloads."""
-        if not report.has_records():
+        """Merged and separate payloads from a records table."""
+        if dataframe.empty:
             return [], []
 
-        dataframe = self._to_dataframe(report)
         merged_payloads = self._create_merged_payloads(dataframe)
         separate_payloads = self._create_separate_payloads(dataframe)
         
         return merged_payloads, separate_payloads
 
-    def _to_dataframe(
-        self, 
-        report: ConsolidatedLogisticsReport
-    ) -> pd.DataFrame:
-        """Converts domain records into a single pandas DataFrame."""
-        rows = []
-        for record in report.records:
-            rows.append({
-                'code': record.product.code,
-                'product_name': record.product.name,
-                'quantity_to_transfer': record.quantity,
-                'target_branch': record.target_branch,
-                'transfer_type': record.transfer_type,
-                'sender_balance': record.sender_balance,
-                'receiver_balance': record.receiver_balance,
-                'product_category': record.category or 'other'
-            })
-        return pd.DataFrame(rows)
-
     def _create_merged_payloads(self, dataframe: pd.DataFrame) -> List[Dict]:
         """Creates category-grouped payloads."""
-        payloads = []
-        for category in dataframe['product_category'].unique():
-            is_category = dataframe['product_category'] == category
-            category_df = dataframe[is_category].copy()
-            payloads.append({
-                'category': category,
-                'dataframe': self._standardize_df(category_df)
-            })
-        return payloads
+        return [
+            {'category': category, 'dataframe': partition}
+            for (category,), partition in partition_frame(
+                dataframe, ['product_category'], order_by='sort_rank',
+                columns=self._present_columns(dataframe)
+            )
+        ]
 
     def _create_separate_payloads(self, dataframe: pd.DataFrame) -> List[Dict]:
         """Creates target-and-category-grouped payloads."""
-        payloads = []
-        for target in dataframe['target_branch'].unique():
-            target_df = dataframe[dataframe['target_branch'] == target]
-            for category in target_df['product_category'].unique():
-                category_df = target_df[
-                    target_df['product_category'] == category
-                ].copy()
-                payloads.append({
-                    'target': target, 'category': category,
-                    'dataframe': self._standardize_df(category_df)
-                })
-        return payloads
+        return [
+            {'target': target, 'category': category, 'dataframe': partition}
+            for (target, category), partition in partition_frame(
+                dataframe, ['target_branch', 'product_category'],
+                order_by='sort_rank',
+                columns=self._present_columns(dataframe)
+            )
+        ]
 
-    def _standardize_df(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        """Standardizes columns and sorts by product name."""
+    @staticmethod
+    def _present_columns(dataframe: pd.DataFrame) -> List[str]:
+        """Exported columns, in standard order, that the table carries."""
         column_order = [
             'code', 'product_name', 'quantity_to_transfer', 
             'target_branch', 'transfer_type', 
             'sender_balance', 'receiver_balance'
         ]
-        present_cols = [c for c in column_order if c in dataframe.columns]
-        sorted_df = dataframe[present_cols].sort_values(
-            'product_name', key=lambda x: x.str.lower()
-        )
-        return sorted_df
+        return [c for c in column_order if c in dataframe.columns]
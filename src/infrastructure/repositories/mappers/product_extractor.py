@@ -1,8 +1,13 @@
 """Service for extracting product information from raw data."""
 
+from __future__ import annotations
+
 from typing import List, Optional
-import pandas as pd
 from src.domain.models.entities import Product
+from src.domain.models.flyweights import intern_product
+
+CODE_KEYS = ['code', 'كود', 'كود الصنف', 'item code', 'item_code']
+NAME_KEYS = ['product_name', 'إسم الصنف', 'اسم الصنف', 'item name']
 
 
 class ProductExtractor:
@@ -11,16 +16,13 @@ class ProductExtractor:
     @staticmethod
     def extract(row: pd.Series) -> Optional[Product]:
         """Extracts validated product information from a data series."""
-        code_keys = ['code', 'كود', 'كود الصنف', 'item code', 'item_code']
-        name_keys = ['product_name', 'إسم الصنف', 'اسم الصنف', 'item name']
-        
-        item_code = str(ProductExtractor._lookup(row, code_keys)).strip()
-        item_name = str(ProductExtractor._lookup(row, name_keys)).strip()
+        item_code = str(ProductExtractor._lookup(row, CODE_KEYS)).strip()
+        item_name = str(ProductExtractor._lookup(row, NAME_KEYS)).strip()
 
         if not item_code or item_code == 'nan' or \
            not item_name or item_name == 'nan':
             return None
-        return Product(code=item_code, name=item_name)
+        return intern_product(item_code, item_name)
 
     @staticmethod
     def _lookup(row: pd.Series, keys: List[str]) -> str:
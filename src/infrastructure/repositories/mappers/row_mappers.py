@@ -0,0 +1,101 @@
+"""Conversions between domain entities and SQLite row tuples."""
+
+from typing import Dict, Iterable, List
+from src.domain.models.entities import (
+    Branch, StockLevel, ConsolidatedStock, BranchStock
+)
+from src.domain.models.distribution import Transfer, DistributionResult
+from src.domain.models.flyweights import intern_branch, intern_product
+
+
+class RowMapper:
+    """Builds insert tuples and rebuilds entities from selected rows."""
+
+    @staticmethod
+    def consolidated_rows(
+        run_id: str, branch: str, items: List[ConsolidatedStock]
+    ) -> Iterable[tuple]:
+        """Yields one stock row per product for a single branch."""
+        for position, item in enumerate(items):
+            yield RowMapper._stock_row(
+                run_id, "consolidated", branch, position,
+                item.product, item.branch_stocks[branch]
+            )
+
+    @staticmethod
+    def branch_stock_rows(
+        run_id: str, branch: Branch, stocks: List[BranchStock]
+    ) -> Iterable[tuple]:
+        """Yields one stock row per saved branch stock."""
+        for position, item in enumerate(stocks):
+            yield RowMapper._stock_row(
+                run_id, "branch", branch.name, position,
+                item.product, item.stock
+            )
+
+    @staticmethod
+    def transfer_rows(run_id: str, transfers: List[Transfer]) -> Iterable[tuple]:
+        """Yields one row per transfer."""
+        for item in transfers:
+            yield (
+                run_id, item.from_branch.name, item.to_branch.name,
+                item.product.code, item.product.name, int(item.quantity),
+                float(item.sender_balance), float(item.receiver_balance)
+            )
+
+    @staticmethod
+    def surplus_rows(
+        run_id: str, results: List[DistributionResult]
+    ) -> Iterable[tuple]:
+        """Yields one row per positive remaining branch surplus."""
+        for result in results:
+            for branch, quantity in result.remaining_branch_surplus.items():
+                if quantity > 0:
+                    yield (
+                        run_id, branch, result.product.code,
+                        result.product.name, int(quantity)
+                    )
+
+    @staticmethod
+    def to_stock_level(row: Dict) -> StockLevel:
+        """Rebuilds a stock level from a selected row."""
+        return StockLevel(
+            needed=row["needed"], surplus=row["surplus"],
+            balance=row["balance"], avg_sales=row["avg_sales"],
+            sales=row["sales"]
+        )
+
+    @staticmethod
+    def to_consolidated(rows: List[Dict]) -> List[ConsolidatedStock]:
+        """Groups consolidated rows by product, keeping input order."""
+        grouped: Dict[str, tuple] = {}
+        for row in rows:
+            product, levels = grouped.setdefault(
+                row["code"], (intern_product(row["code"], row["product_name"]), {})
+            )
+            levels[row["branch"]] = RowMapper.to_stock_level(row)
+        return [
+            ConsolidatedStock(product=product, branch_stocks=levels)
+            for product, levels in grouped.values()
+        ]
+
+    @staticmethod
+    def to_transfer(row: Dict) -> Transfer:
+        """Rebuilds a transfer from a selected row."""
+        return Transfer(
+            product=intern_product(row["code"], row["product_name"]),
+            from_branch=intern_branch(row["from_branch"]),
+            to_branch=intern_branch(row["to_branch"]),
+            quantity=row["quantity"],
+            sender_balance=row["sender_balance"],
+            receiver_balance=row["receiver_balance"]
+        )
+
+    @staticmethod
+    def _stock_row(run_id, source, branch, position, product, stock) -> tuple:
+        """Flattens a product stock level into a stock_levels row."""
+        return (
+            run_id, source, branch, product.code, product.name, position,
+            float(stock.sales), float(stock.balance), float(stock.avg_sales),
+            int(stock.needed), int(stock.surplus)
+        )
@@ -2,7 +2,9 @@
 
 import os
 from typing import List, Dict, Optional
-from src.infrastructure.repositories.metadata.output_manager import list_artifacts
+from src.infrastructure.repositories.metadata.output_manager import (
+    list_manifest_artifacts
+)
 
 
 class ArtifactLister:
@@ -19,15 +21,15 @@ class ArtifactLister:
         category_name: str, 
         branch_filter: Optional[str] = None
     ) -> List[Dict]:
-        """Lists available output artifacts for a specific category."""
+        """Lists artifacts on disk, enriched from the artifact manifest."""
         mapping = self._get_category_mapping()
         if category_name not in mapping:
             return []
             
         config = mapping[category_name]
-        return list_artifacts(
-            category_name, 
-            config['base_directory'], 
+        return list_manifest_artifacts(
+            category_name,
+            config['base_directory'],
             config['search_patterns'],
             branch_filter
         )
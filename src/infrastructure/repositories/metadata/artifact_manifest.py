@@ -0,0 +1,168 @@
+"""Append-only manifest of written artifacts with an in-memory index.
+
+Persistence modules append one JSON line per file they write, so output
+discovery can read categories, branches and product categories from the
+record instead of parsing folder names. The manifest lives in the cache
+directory so it survives the output wipe; records of files that are gone
+are pruned after each archive. Each record carries the file's size,
+mtime and SHA-256 so listings never have to stat or reopen the file.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.shared.config import paths
+from src.shared.utility.telemetry import get_current_run
+
+_lock = threading.Lock()
+_index = {'path': None, 'stamp': None, 'by_category': {}}
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def record_artifact(
+    path: str, category: str, source: Optional[str] = None,
+    target: Optional[str] = None, product_category: Optional[str] = None,
+    rows: Optional[int] = None
+) -> None:
+    """Appends a record for a file that was just written."""
+    run = get_current_run()
+    status = os.stat(path)
+    record = {
+        'run_id': run.run_id if run else None,
+        'path': os.path.abspath(path),
+        'category': category,
+        'source': source,
+        'target': target,
+        'product_category': product_category,
+        'rows': rows,
+        'bytes': status.st_size,
+        'mtime_ns': status.st_mtime_ns,
+        'hash': compute_file_hash(path),
+        'written_at': datetime.now().isoformat(timespec='seconds')
+    }
+    _append_line(json.dumps(record, ensure_ascii=False))
+
+
+def query_artifacts(
+    category: str, source: Optional[str] = None
+) -> List[Dict]:
+    """Returns the latest record per path for a category and branch."""
+    with _lock:
+        by_source = _load_index().get(category, {})
+        if source is None:
+            groups = list(by_source.values())
+        else:
+            groups = [by_source.get(source, {})]
+        return [dict(record) for group in groups for record in group.values()]
+
+
+def load_manifest(run_id: Optional[str] = None) -> List[Dict]:
+    """Reads every manifest line, optionally limited to one run."""
+    records = _read_records(get_manifest_path())
+    if run_id is None:
+        return records
+    return [record for record in records if record.get('run_id') == run_id]
+
+
+def artifact_hash(record: Dict) -> Optional[str]:
+    """Recorded SHA-256 of a file, or None if it changed since recording."""
+    try:
+        status = os.stat(record['path'])
+    except OSError:
+        return None
+    if (status.st_size, status.st_mtime_ns) != (
+        record.get('bytes'), record.get('mtime_ns')
+    ):
+        return None
+    return record.get('hash')
+
+
+def prune_manifest() -> int:
+    """Rewrites the manifest with the latest record of each existing file."""
+    manifest_path = get_manifest_path()
+    with _lock:
+        latest = {
+            record['path']: record
+            for record in _read_records(manifest_path)
+        }
+        kept = [r for r in latest.values() if os.path.exists(r['path'])]
+        if not os.path.exists(manifest_path):
+            return 0
+        temporary = manifest_path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            for record in kept:
+                file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        os.replace(temporary, manifest_path)
+        return len(kept)
+
+
+def get_manifest_path() -> str:
+    """Returns the manifest location, read at call time."""
+    return paths.ARTIFACT_MANIFEST_PATH
+
+
+def compute_file_hash(path: str) -> str:
+    """Returns the SHA-256 digest of a file's bytes."""
+    with open(path, 'rb') as file:
+        return hashlib.file_digest(file, 'sha256').hexdigest()
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _append_line(line: str) -> None:
+    """Appends a line under the module lock."""
+    manifest_path = get_manifest_path()
+    with _lock:
+        os.makedirs(os.path.dirname(manifest_path) or '.', exist_ok=True)
+        with open(manifest_path, 'a', encoding='utf-8') as file:
+            file.write(line + '\n')
+
+
+def _load_index() -> Dict:
+    """Rebuilds the category index when the manifest file changed."""
+    manifest_path = get_manifest_path()
+    try:
+        status = os.stat(manifest_path)
+        stamp = (status.st_size, status.st_mtime_ns)
+    except OSError:
+        stamp = None
+    if _index['path'] != manifest_path or _index['stamp'] != stamp:
+        _index.update(
+            path=manifest_path, stamp=stamp,
+            by_category=_build_index(_read_records(manifest_path))
+        )
+    return _index['by_category']
+
+
+def _build_index(records: List[Dict]) -> Dict:
+    """Groups records by category, then source, keeping the latest path."""
+    by_category = {}
+    for record in records:
+        by_source = by_category.setdefault(record['category'], {})
+        for group in by_source.values():
+            group.pop(record['path'], None)
+        by_source.setdefault(record['source'], {})[record['path']] = record
+    return by_category
+
+
+def _read_records(manifest_path: str) -> List[Dict]:
+    """Parses manifest lines, skipping partially written ones."""
+    if not os.path.exists(manifest_path):
+        return []
+    records = []
+    with open(manifest_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
@@ -1,7 +1,7 @@
 """Logic for creating and enriching artifact metadata."""
 
 import os
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 
 def create_artifact_metadata(
@@ -10,15 +10,22 @@ def create_artifact_metadata(
     category: str, 
     branch: str, 
     folder: str,
-    root_dir: str = ""
+    root_dir: str = "",
+    status: Optional[Tuple[int, float]] = None
 ) -> Dict:
-    """Creates the base metadata dictionary with relative path support."""
+    """Creates the base metadata dictionary with relative path support.
+
+    ``status`` is a known (size, mtime) pair; the file is only stat'ed
+    when it is missing.
+    """
     abspath = os.path.abspath(path)
+    if status is None:
+        status = (os.path.getsize(path), os.path.getmtime(path))
     metadata = {
         'name': name,
         'path': abspath,
-        'size': os.path.getsize(path),
-        'mtime': os.path.getmtime(path),
+        'size': status[0],
+        'mtime': status[1],
         'category': category,
         'branch': branch,
         'folder_name': folder
@@ -48,6 +55,28 @@ def enrich_separate_metadata(
         _extract_branch_category(metadata, stem)
 
 
+def create_manifest_metadata(
+    record: Dict,
+    category: str,
+    root_dir: str
+) -> Dict:
+    """Builds listing metadata from a manifest record without a stat."""
+    path = record['path']
+    folder = os.path.basename(os.path.dirname(path))
+    metadata = create_artifact_metadata(
+        os.path.basename(path), path, category, record['source'],
+        folder, root_dir, (record['bytes'], record['mtime_ns'] / 1e9)
+    )
+    if category == 'separate':
+        metadata['source_folder'] = os.path.basename(
+            os.path.dirname(os.path.dirname(path))
+        )
+        metadata['target_folder'] = folder
+        metadata['target_branch'] = record['target']
+        metadata['product_category'] = record['product_category']
+    return metadata
+
+
 def _extract_branch_category(metadata: Dict, stem: str) -> None:
     """Extracts target branch and product category from file stem."""
     parts = stem.split('_')
@@ -4,45 +4,151 @@ import os
 import re
 from typing import List, Dict, Optional
 from src.infrastructure.repositories.metadata.artifact_metadata import (
-    create_artifact_metadata, enrich_separate_metadata
+    create_artifact_metadata, enrich_separate_metadata,
+    create_manifest_metadata
+)
+from src.infrastructure.repositories.metadata.artifact_manifest import (
+    query_artifacts
+)
+from src.infrastructure.cache.directory_index import (
+    DirectoryIndexCache, read_directory_mtime
 )
 def list_artifacts(
     category_name: str, base_directory: str, 
     patterns: Dict[str, str], branch_filter: Optional[str] = None
 ) -> List[Dict]:
-    """Lists available output artifacts for a given category."""
+    """Lists output artifacts, reusing the index while directories are unchanged."""
+    cache = DirectoryIndexCache()
+    key = (
+        category_name, os.path.abspath(base_directory),
+        tuple(sorted(patterns.items())), branch_filter
+    )
+    cached = cache.lookup(key)
+    if cached is not None:
+        return cached
+    signature = {}
+    results = _walk_artifacts(
+        category_name, base_directory, patterns, branch_filter, signature
+    )
+    cache.store(key, results, signature)
+    return results
+def list_manifest_artifacts(
+    category_name: str, base_directory: str,
+    patterns: Dict[str, str], branch_filter: Optional[str] = None
+) -> List[Dict]:
+    """Lists artifacts from the manifest, walking only stale trees.
+
+    Recorded files are described from their records without touching the
+    files. The directories holding them are stat'ed once each: a directory
+    modified after the newest record beneath it gained or lost entries the
+    manifest never saw, so the cached tree walk decides what exists and
+    the records only enrich it. Trees without records are always walked.
+    """
+    roots = [
+        os.path.abspath(directory) for directory in (
+            _resolve_format_dir(base_directory, file_format)
+            for file_format in ['csv', 'excel']
+        ) if directory
+    ]
+    category_records = _records_under(query_artifacts(category_name), roots)
+    records = [
+        (record, root) for record, root in category_records
+        if branch_filter is None or record['source'] == branch_filter
+    ]
+    if not records or _has_unrecorded_entries(category_records, roots):
+        return _merge_walk(
+            category_name, base_directory, patterns, branch_filter, records
+        )
+    return [
+        create_manifest_metadata(record, category_name, root)
+        for record, root in records
+    ]
+def _has_unrecorded_entries(records, roots) -> bool:
+    """Checks whether any recorded directory changed after its records."""
+    newest = {}
+    for record, root in records:
+        directory = os.path.dirname(record['path'])
+        while True:
+            newest[directory] = max(
+                newest.get(directory, 0), record['mtime_ns']
+            )
+            if directory == root or len(directory) <= len(root):
+                break
+            directory = os.path.dirname(directory)
+    for directory, recorded_mtime in newest.items():
+        mtime = read_directory_mtime(directory)
+        if mtime is None or mtime > recorded_mtime:
+            return True
+    return False
+def _merge_walk(category_name, base_directory, patterns, branch_filter, records) -> List[Dict]:
+    """Lists the walked tree, describing recorded files from the manifest."""
+    walked = list_artifacts(
+        category_name, base_directory, patterns, branch_filter
+    )
+    recorded = {record['path']: (record, root) for record, root in records}
+    merged = []
+    for item in walked:
+        match = recorded.pop(os.path.abspath(item['path']), None)
+        merged.append(dict(
+            create_manifest_metadata(match[0], category_name, match[1]),
+            size=item['size'], mtime=item['mtime']
+        ) if match else item)
+    merged.extend(
+        create_manifest_metadata(record, category_name, root)
+        for record, root in recorded.values()
+        if os.path.exists(record['path'])
+    )
+    return merged
+def _records_under(records, roots) -> List[tuple]:
+    """Pairs each record with the format directory that contains it."""
+    matching = []
+    for record in records:
+        for root in roots:
+            if record['path'].startswith(root + os.sep):
+                matching.append((record, root))
+                break
+    return matching
+def _walk_artifacts(category_name, base_directory, patterns, branch_filter, signature) -> List[Dict]:
+    """Walks the output tree, recording every directory it lists."""
     results = []
+    signature[base_directory] = read_directory_mtime(base_directory)
     for file_format in ['csv', 'excel']:
+        candidate = os.path.join(base_directory, file_format)
+        signature[candidate] = read_directory_mtime(candidate)
         fmt_dir = _resolve_format_dir(base_directory, file_format)
         if not fmt_dir:
             continue
         prefix = patterns.get(file_format, '')
         pattern = f"{prefix}{branch_filter}" if branch_filter else prefix
         if category_name in ['shortage', 'sales_analysis']:
-            _collect_recursive(fmt_dir, category_name, None, results, fmt_dir)
+            _collect_recursive(fmt_dir, category_name, None, results, fmt_dir, signature)
         else:
             _scan_directory(
-                fmt_dir, category_name, branch_filter, pattern, results, fmt_dir
+                fmt_dir, category_name, branch_filter, pattern, results, fmt_dir, signature
             )
     return results
+def _list_directory(path, signature) -> List[str]:
+    """Lists a directory and records its mtime for cache validation."""
+    signature[path] = read_directory_mtime(path)
+    return os.listdir(path)
 def _resolve_format_dir(base, file_format) -> Optional[str]:
     """Resolves the directory for a specific file format."""
     directory = os.path.join(base, file_format)
     if os.path.exists(directory):
         return directory
     return base if base.endswith(file_format) and os.path.exists(base) else None
-def _scan_directory(dir_path, category, filter_val, pattern, results, root_dir) -> None:
+def _scan_directory(dir_path, category, filter_val, pattern, results, root_dir, signature) -> None:
     """Scans a directory for matching artifact subdirectories."""
-    for item in os.listdir(dir_path):
+    for item in _list_directory(dir_path, signature):
         item_path = os.path.join(dir_path, item)
         if not os.path.isdir(item_path):
             continue
         if _is_match(category, filter_val, item, pattern):
             if category == 'separate':
-                _scan_separate(item_path, category, filter_val, item, results, root_dir)
+                _scan_separate(item_path, category, filter_val, item, results, root_dir, signature)
             else:
                 branch = _extract_meta(category, filter_val, item)
-                _collect_recursive(item_path, category, branch, results, root_dir)
+                _collect_recursive(item_path, category, branch, results, root_dir, signature)
 def _is_match(category, branch_filter, item, pattern) -> bool:
     """Checks if a directory item matches the search pattern."""
     if pattern in item:
@@ -64,22 +170,22 @@ def _extract_meta(category, filter_val, item) -> str:
         name = match.group(1).replace('excel_from_', '').replace('from_', '')
         return name.split('_to_')[0]
     return item.split('from_')[1].split('_to_')[0] if 'from_' in item else item
-def _scan_separate(path, category, filter_val, item, results, root_dir) -> None:
+def _scan_separate(path, category, filter_val, item, results, root_dir, signature) -> None:
     """Specialized scan for separate transfers."""
-    for target in os.listdir(path):
+    for target in _list_directory(path, signature):
         target_path = os.path.join(path, target)
         if os.path.isdir(target_path) and target.startswith('to_'):
             branch = filter_val or _extract_meta(category, filter_val, item)
-            _collect_recursive(target_path, category, branch, results, root_dir)
-def _collect_recursive(search_dir, category, branch, results, root_dir) -> None:
+            _collect_recursive(target_path, category, branch, results, root_dir, signature)
+def _collect_recursive(search_dir, category, branch, results, root_dir, signature) -> None:
     """Recursively collects files and applies metadata enrichment."""
     if not os.path.exists(search_dir):
         return
     folder = os.path.basename(search_dir)
-    for item in os.listdir(search_dir):
+    for item in _list_directory(search_dir, signature):
         path = os.path.join(search_dir, item)
         if os.path.isdir(path):
-            _collect_recursive(path, category, branch, results, root_dir)
+            _collect_recursive(path, category, branch, results, root_dir, signature)
         elif item.endswith(('.csv', '.xlsx')):
             meta = create_artifact_metadata(
                 item, path, category, branch, folder, root_dir
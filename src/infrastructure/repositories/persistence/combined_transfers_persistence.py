@@ -5,6 +5,11 @@ import pandas as pd
 from typing import List, Dict
 from src.domain.models.entities import Branch
 from src.infrastructure.excel.formatter import save_formatted_excel
+from src.shared.utility.telemetry import file_span
+from src.infrastructure.repositories.metadata.artifact_manifest import (
+    record_artifact
+)
+from src.infrastructure.repositories.io.columnar_io import write_columnar
 
 
 def save_step11_combined_transfers(
@@ -33,16 +38,16 @@ def _persist_merged_outputs(branch, items, timestamp, base_dir) -> None:
         category, dataframe = entry['category'], entry['dataframe']
         os.makedirs(csv_dir, exist_ok=True)
         filename_csv = f"{branch.name}_combined_{category}.csv"
-        dataframe.to_csv(
-            os.path.join(csv_dir, filename_csv), 
-            index=False, 
-            encoding='utf-8-sig'
+        _write_csv(
+            dataframe, os.path.join(csv_dir, filename_csv),
+            category='merged', source=branch.name, product_category=category
         )
         
         os.makedirs(excel_dir, exist_ok=True)
         filename_excel = f"{branch.name}_combined_{category}.xlsx"
-        save_formatted_excel(
-            dataframe, os.path.join(excel_dir, filename_excel)
+        _write_excel(
+            dataframe, os.path.join(excel_dir, filename_excel),
+            category='merged', source=branch.name, product_category=category
         )
 
 
@@ -71,10 +76,9 @@ def _save_individual_target(
     csv_filename = (
         f"transfer_from_{source}_to_{target}_{category}_{timestamp}.csv"
     )
-    dataframe.to_csv(
-        os.path.join(csv_dir, csv_filename), 
-        index=False, 
-        encoding='utf-8-sig'
+    _write_csv(
+        dataframe, os.path.join(csv_dir, csv_filename), category='separate',
+        source=source, target=target, product_category=category
     )
     
     excel_dir = os.path.join(excel_root, f"to_{target}")
@@ -82,4 +86,25 @@ def _save_individual_target(
     excel_filename = (
         f"transfer_from_{source}_to_{target}_{category}_{timestamp}.xlsx"
     )
-    save_formatted_excel(dataframe, os.path.join(excel_dir, excel_filename))
+    _write_excel(
+        dataframe, os.path.join(excel_dir, excel_filename),
+        category='separate', source=source, target=target,
+        product_category=category
+    )
+
+
+def _write_csv(dataframe: pd.DataFrame, path: str, **fields) -> None:
+    """Writes a combined CSV and records it in the artifact manifest."""
+    with file_span(path) as span:
+        dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+        span.record_rows(rows_out=len(dataframe))
+        record_artifact(path, rows=len(dataframe), **fields)
+    write_columnar(dataframe, path, **fields)
+
+
+def _write_excel(dataframe: pd.DataFrame, path: str, **fields) -> None:
+    """Writes a formatted combined workbook and records it in the manifest."""
+    with file_span(path) as span:
+        save_formatted_excel(dataframe, path)
+        span.record_rows(rows_out=len(dataframe))
+        record_artifact(path, rows=len(dataframe), **fields)
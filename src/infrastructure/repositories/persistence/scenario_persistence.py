@@ -0,0 +1,34 @@
+"""Persistence logic for what-if scenario comparisons."""
+
+import os
+import pandas as pd
+from datetime import datetime
+from typing import List, Dict
+from src.shared.utility.telemetry import file_span
+from src.infrastructure.repositories.metadata.artifact_manifest import (
+    record_artifact
+)
+
+
+def save_scenario_comparison(
+    summary_rows: List[Dict], product_rows: List[Dict], base_dir: str
+) -> None:
+    """Saves the per-scenario summary and the per-product side-by-side."""
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    os.makedirs(base_dir, exist_ok=True)
+    _write_csv(
+        pd.DataFrame(summary_rows),
+        os.path.join(base_dir, f"scenario_summary_{stamp}.csv")
+    )
+    _write_csv(
+        pd.DataFrame(product_rows),
+        os.path.join(base_dir, f"scenario_products_{stamp}.csv")
+    )
+
+
+def _write_csv(dataframe: pd.DataFrame, path: str) -> None:
+    """Writes a scenario CSV and records it in the artifact manifest."""
+    with file_span(path) as span:
+        dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+        span.record_rows(rows_out=len(dataframe))
+        record_artifact(path, 'scenarios', rows=len(dataframe))
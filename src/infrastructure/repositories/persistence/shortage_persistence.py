@@ -10,6 +10,14 @@ from src.domain.services.classification.product_classifier import (
 )
 from src.presentation.gui.utils.translations import BRANCH_NAMES, COLUMNS
 from src.shared.constants import BRANCHES
+from src.shared.utility.telemetry import file_span
+from src.infrastructure.repositories.metadata.artifact_manifest import (
+    record_artifact
+)
+from src.infrastructure.cache.output_ledger import (
+    frame_fingerprint, is_output_current, remember_output
+)
+from src.infrastructure.repositories.io.columnar_io import write_columnar
 
 
 def save_shortage_reports(
@@ -66,16 +74,17 @@ def _persist_category_shortage(category, date, items, base_dir):
     csv_dir = os.path.join(base_dir, "csv")
     os.makedirs(csv_dir, exist_ok=True)
     csv_filename = f"total_shortage_{category}_{date}.csv"
-    dataframe.to_csv(
-        os.path.join(csv_dir, csv_filename), index=False, encoding='utf-8-sig'
+    _write_csv(
+        dataframe, os.path.join(csv_dir, csv_filename),
+        product_category=category
     )
     
     excel_dir = os.path.join(base_dir, "excel")
     os.makedirs(excel_dir, exist_ok=True)
     excel_filename = f"total_shortage_{category}_{date}.xlsx"
-    dataframe.to_excel(
-        os.path.join(excel_dir, excel_filename), 
-        index=False
+    _write_excel(
+        dataframe, os.path.join(excel_dir, excel_filename),
+        product_category=category
     )
 
 
@@ -87,9 +96,33 @@ def _persist_total_shortage_report(date, items, base_dir):
     
     filename = f"shortage_report_total_{date}.csv"
     csv_path = os.path.join(base_dir, "csv", filename)
-    dataframe.to_csv(csv_path, index=False, encoding='utf-8-sig')
+    _write_csv(dataframe, csv_path)
     
     excel_path = os.path.join(
         base_dir, "excel", f"shortage_report_total_{date}.xlsx"
     )
-    dataframe.to_excel(excel_path, index=False)
+    _write_excel(dataframe, excel_path)
+
+
+def _write_csv(dataframe: pd.DataFrame, path: str, **fields) -> None:
+    """Writes a shortage CSV and records it in the artifact manifest."""
+    fingerprint = frame_fingerprint(dataframe)
+    if not is_output_current(path, fingerprint):
+        with file_span(path) as span:
+            dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+            span.record_rows(rows_out=len(dataframe))
+            record_artifact(path, 'shortage', rows=len(dataframe), **fields)
+        remember_output(path, fingerprint)
+    write_columnar(dataframe, path, **fields)
+
+
+def _write_excel(dataframe: pd.DataFrame, path: str, **fields) -> None:
+    """Writes a shortage Excel file and records it in the manifest."""
+    fingerprint = frame_fingerprint(dataframe)
+    if is_output_current(path, fingerprint):
+        return
+    with file_span(path) as span:
+        dataframe.to_excel(path, index=False)
+        span.record_rows(rows_out=len(dataframe))
+        record_artifact(path, 'shortage', rows=len(dataframe), **fields)
+    remember_output(path, fingerprint)
@@ -3,11 +3,25 @@
 import os
 import pandas as pd
 from datetime import datetime
-from typing import List, Dict
+from typing import List
 from src.domain.models.distribution import DistributionResult
 from src.domain.services.classification.product_classifier import (
     classify_product_type
 )
+from src.domain.services.product_ordering import get_product_sort_index
+from src.shared.utility.telemetry import file_span
+from src.infrastructure.repositories.metadata.artifact_manifest import (
+    record_artifact
+)
+from src.infrastructure.cache.output_ledger import (
+    frame_fingerprint, is_output_current, remember_output
+)
+from src.infrastructure.repositories.io.columnar_io import write_columnar
+from src.infrastructure.repositories.io.partitioned_export import (
+    export_partitions
+)
+
+SURPLUS_COLUMNS = ['code', 'product_name', 'remaining_surplus']
 
 
 def save_surplus_reports(
@@ -16,75 +30,93 @@ def save_surplus_reports(
 ) -> None:
     """Saves surplus reports split by branch and category."""
     today = datetime.now().strftime("%Y%m%d")
-    grouped = _group_surplus_by_branch_category(results)
-    
-    for branch, categories in grouped.items():
-        all_items = []
-        for category, items in categories.items():
-            all_items.extend(items)
-            _persist_category_surplus(branch, category, today, items, base_dir)
-        
-        if all_items:
-            _persist_total_branch_surplus(branch, today, all_items, base_dir)
+    dataframe = _surplus_frame(results)
+    export_partitions(
+        dataframe, ['branch', 'category'],
+        lambda branch, category, items: _persist_category_surplus(
+            branch, category, today, items, base_dir
+        ),
+        order_by='sort_rank', columns=SURPLUS_COLUMNS
+    )
+    export_partitions(
+        dataframe, ['branch'],
+        lambda branch, items: _persist_total_branch_surplus(
+            branch, today, items, base_dir
+        ),
+        order_by='sort_rank', columns=SURPLUS_COLUMNS
+    )
 
 
-def _group_surplus_by_branch_category(
-    results: List[DistributionResult]
-) -> Dict:
-    """Groups surplus data by branch and then by category."""
-    grouped = {}
+def _surplus_frame(results: List[DistributionResult]) -> pd.DataFrame:
+    """One row per product and branch with remaining surplus."""
+    rows = []
     for result in results:
-        category = classify_product_type(result.product.name)
         for branch, surplus in result.remaining_branch_surplus.items():
-            if surplus <= 0:
-                continue
-            if branch not in grouped:
-                grouped[branch] = {}
-            if category not in grouped[branch]:
-                grouped[branch][category] = []
-            
-            grouped[branch][category].append({
-                'code': result.product.code,
-                'product_name': result.product.name,
-                'remaining_surplus': surplus
-            })
-    return grouped
+            if surplus > 0:
+                rows.append((
+                    result.product.code, result.product.name, surplus, branch
+                ))
+    dataframe = pd.DataFrame(
+        rows, columns=[*SURPLUS_COLUMNS, 'branch']
+    )
+    names = dataframe['product_name'].tolist()
+    categories = {name: classify_product_type(name) for name in set(names)}
+    dataframe['category'] = [categories[name] for name in names]
+    dataframe['sort_rank'] = get_product_sort_index().ranks(names)
+    return dataframe
 
 
-def _persist_category_surplus(branch, category, date, items, base_dir):
+def _persist_category_surplus(branch, category, date, dataframe, base_dir):
     """Saves surplus CSV and Excel for a specific branch/category."""
-    dataframe = pd.DataFrame(items).sort_values(
-        'product_name', key=lambda col: col.str.lower()
-    )
-    
     path_csv = os.path.join(base_dir, "csv", branch)
     os.makedirs(path_csv, exist_ok=True)
     filename_csv = f"remaining_surplus_{branch}_{category}_{date}.csv"
-    dataframe.to_csv(
-        os.path.join(path_csv, filename_csv), index=False, encoding='utf-8-sig'
+    _write_csv(
+        dataframe, os.path.join(path_csv, filename_csv),
+        source=branch, product_category=category
     )
     
     path_excel = os.path.join(base_dir, "excel", branch)
     os.makedirs(path_excel, exist_ok=True)
     filename_excel = f"remaining_surplus_{branch}_{category}_{date}.xlsx"
-    dataframe.to_excel(
-        os.path.join(path_excel, filename_excel), 
-        index=False
+    _write_excel(
+        dataframe, os.path.join(path_excel, filename_excel),
+        source=branch, product_category=category
     )
 
 
-def _persist_total_branch_surplus(branch, date, items, base_dir):
+def _persist_total_branch_surplus(branch, date, dataframe, base_dir):
     """Saves a consolidated surplus file for an entire branch."""
-    dataframe = pd.DataFrame(items).sort_values(
-        'product_name', key=lambda col: col.str.lower()
-    )
-    
     csv_dir = os.path.join(base_dir, "csv", branch)
     csv_filename = f"remaining_surplus_{branch}_total_{date}.csv"
     csv_path = os.path.join(csv_dir, csv_filename)
-    dataframe.to_csv(csv_path, index=False, encoding='utf-8-sig')
+    _write_csv(dataframe, csv_path, source=branch)
     
     excel_folder = os.path.join(base_dir, "excel", branch)
     excel_filename = f"remaining_surplus_{branch}_total_{date}.xlsx"
     excel_path = os.path.join(excel_folder, excel_filename)
-    dataframe.to_excel(excel_path, index=False)
+    _write_excel(dataframe, excel_path, source=branch)
+
+
+def _write_csv(dataframe: pd.DataFrame, path: str, **fields) -> None:
+    """Writes a surplus CSV and records it in the artifact manifest."""
+    fingerprint = frame_fingerprint(dataframe)
+    if not is_output_current(path, fingerprint):
+        with file_span(path) as span:
+            dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+            span.record_rows(rows_out=len(dataframe))
+            record_artifact(path, 'surplus', rows=len(dataframe), **fields)
+        remember_output(path, fingerprint)
+    write_columnar(dataframe, path, **fields)
+
+
+def _write_excel(dataframe: pd.DataFrame, path: str, **fields) -> None:
+    """Writes a surplus Excel file and records it in the manifest."""
+    fingerprint = frame_fingerprint(dataframe)
+    if is_output_current(path, fingerprint):
+        return
+    with file_span(path) as span:
+        dataframe.to_excel(path, index=False)
+        span.record_rows(rows_out=len(dataframe))
+        record_artifact(path, 'surplus', rows=len(dataframe), **fields)
+    remember_output(path, fingerprint)
@@ -2,36 +2,72 @@
 
 import os
 import pandas as pd
-from typing import List, Dict
+from typing import List
 from src.domain.models.distribution import Transfer
 from src.domain.services.classification.product_classifier import (
     classify_product_type
 )
+from src.domain.services.product_ordering import get_product_sort_index
 from src.infrastructure.excel.formatter import save_formatted_excel
+from src.shared.utility.telemetry import file_span
+from src.infrastructure.repositories.metadata.artifact_manifest import (
+    record_artifact
+)
+from src.infrastructure.cache.output_ledger import (
+    frame_fingerprint, is_output_current, remember_output
+)
+from src.infrastructure.repositories.io.columnar_io import write_columnar
+from src.infrastructure.repositories.io.partitioned_export import (
+    export_partitions
+)
+
+TRANSFER_COLUMNS = [
+    'code', 'product_name', 'quantity_to_transfer', 'target_branch',
+    'sender_balance', 'receiver_balance'
+]
 
 
 def save_step7_transfers(transfers: List[Transfer], output_dir: str) -> None:
     """Saves transfers grouped by source branch (Step 7)."""
     if not transfers:
         return
-    branch_pairs = _group_transfers_by_pair(transfers)
     os.makedirs(output_dir, exist_ok=True)
-    for (source, target), pair_items in branch_pairs.items():
-        dataframe = _prepare_transfer_dataframe(pair_items, target)
+
+    def write_pair(source, target, dataframe):
         spec = f"transfers_from_{source}_to_other_branches"
         specific_dir = os.path.join(output_dir, spec)
         os.makedirs(specific_dir, exist_ok=True)
         path = os.path.join(specific_dir, f"{source}_to_{target}.csv")
+        _write_pair_csv(dataframe, path, source, target)
+
+    export_partitions(
+        _transfers_frame(transfers), ['source', 'target_branch'], write_pair,
+        order_by='sort_rank', columns=TRANSFER_COLUMNS
+    )
+
+
+def _write_pair_csv(dataframe, path, source, target) -> None:
+    """Writes a step 7 pair file unless it already holds this content."""
+    fingerprint = frame_fingerprint(dataframe)
+    if is_output_current(path, fingerprint):
+        write_columnar(dataframe, path, source=source, target=target)
+        return
+    with file_span(path) as span:
         dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+        span.record_rows(rows_out=len(dataframe))
+        record_artifact(
+            path, 'transfers', source, target, rows=len(dataframe)
+        )
+    remember_output(path, fingerprint)
+    write_columnar(dataframe, path, source=source, target=target)
 
 
 def save_step8_split_transfers(
     transfers: List[Transfer], output_dir: str, excel_dir: str, timestamp: str
 ) -> None:
     """Saves transfers split by product category (Step 8)."""
-    groups = _group_transfers_by_category(transfers)
-    for (source, target, category), items in groups.items():
-        dataframe = _prepare_transfer_dataframe(items, target)
+
+    def write_split(source, target, category, dataframe):
         _save_split_csv(
             source, target, category, timestamp, dataframe, output_dir
         )
@@ -39,47 +75,34 @@ def save_step8_split_transfers(
             source, target, category, timestamp, dataframe, excel_dir
         )
 
-
-def _group_transfers_by_pair(transfers: List[Transfer]) -> Dict:
-    """Groups transfers into (source, target) pairs."""
-    pairs = {}
-    for transfer in transfers:
-        key = (transfer.from_branch.name, transfer.to_branch.name)
-        if key not in pairs:
-            pairs[key] = []
-        pairs[key].append(transfer)
-    return pairs
-
-
-def _group_transfers_by_category(transfers: List[Transfer]) -> Dict:
-    """Groups transfers by source, target, and category."""
-    groups = {}
-    for transfer in transfers:
-        category = classify_product_type(transfer.product.name)
-        key = (transfer.from_branch.name, transfer.to_branch.name, category)
-        if key not in groups:
-            groups[key] = []
-        groups[key].append(transfer)
-    return groups
+    export_partitions(
+        _transfers_frame(transfers, with_category=True),
+        ['source', 'target_branch', 'category'], write_split,
+        order_by='sort_rank', columns=TRANSFER_COLUMNS
+    )
 
 
-def _prepare_transfer_dataframe(
-    transfers: List[Transfer], target_name: str
+def _transfers_frame(
+    transfers: List[Transfer], with_category: bool = False
 ) -> pd.DataFrame:
-    """Converts a list of transfers to a sorted DataFrame."""
-    records = []
-    for transfer in transfers:
-        records.append({
-            'code': transfer.product.code,
-            'product_name': transfer.product.name,
-            'quantity_to_transfer': transfer.quantity,
-            'target_branch': target_name,
-            'sender_balance': transfer.sender_balance,
-            'receiver_balance': transfer.receiver_balance
-        })
-    return pd.DataFrame(records).sort_values(
-        'product_name', key=lambda col: col.str.lower()
-    )
+    """One table of all transfers with their source and name rank."""
+    names = [transfer.product.name for transfer in transfers]
+    dataframe = pd.DataFrame({
+        'code': [transfer.product.code for transfer in transfers],
+        'product_name': names,
+        'quantity_to_transfer': [transfer.quantity for transfer in transfers],
+        'target_branch': [transfer.to_branch.name for transfer in transfers],
+        'sender_balance': [transfer.sender_balance for transfer in transfers],
+        'receiver_balance': [
+            transfer.receiver_balance for transfer in transfers
+        ],
+        'source': [transfer.from_branch.name for transfer in transfers],
+        'sort_rank': get_product_sort_index().ranks(names)
+    })
+    if with_category:
+        categories = {name: classify_product_type(name) for name in set(names)}
+        dataframe['category'] = [categories[name] for name in names]
+    return dataframe
 
 
 def _save_split_csv(source, target, category, timestamp, dataframe, base_dir):
@@ -91,7 +114,16 @@ def _save_split_csv(source, target, category, timestamp, dataframe, base_dir):
     os.makedirs(directory, exist_ok=True)
     filename = f"{source}_to_{target}_{timestamp}_{category}.csv"
     path = os.path.join(directory, filename)
-    dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+    with file_span(path) as span:
+        dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+        span.record_rows(rows_out=len(dataframe))
+        record_artifact(
+            path, 'transfers', source, target, category, len(dataframe)
+        )
+    write_columnar(
+        dataframe, path, source=source, target=target,
+        product_category=category
+    )
 
 
 def _save_split_excel(
@@ -103,5 +135,12 @@ def _save_split_excel(
         f"{source}_to_{target}"
     )
     os.makedirs(directory, exist_ok=True)
-    filename = f"{source}_to_{target}_{timestamp}_{category}.xlsx"
-    save_formatted_excel(dataframe, os.path.join(directory, filename))
+    path = os.path.join(
+        directory, f"{source}_to_{target}_{timestamp}_{category}.xlsx"
+    )
+    with file_span(path) as span:
+        save_formatted_excel(dataframe, path)
+        span.record_rows(rows_out=len(dataframe))
+        record_artifact(
+            path, 'transfers', source, target, category, len(dataframe)
+        )
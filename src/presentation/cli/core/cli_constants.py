@@ -5,6 +5,7 @@ from src.application.pipeline.steps import AVAILABLE_STEPS
 SEPARATOR = "=" * 50
 EXIT_CHOICE = "0"
 ALL_STEPS_CHOICE_OFFSET = len(AVAILABLE_STEPS) + 1
+SCENARIO_CHOICE = str(ALL_STEPS_CHOICE_OFFSET + 1)
 
 WELCOME_MESSAGE = f"""
 {SEPARATOR}
@@ -16,4 +17,5 @@ MENU_OPTIONS = [
     (str(i + 1), step.name) for i, step in enumerate(AVAILABLE_STEPS)
 ]
 MENU_OPTIONS.append((str(ALL_STEPS_CHOICE_OFFSET), "Run All Steps"))
+MENU_OPTIONS.append((SCENARIO_CHOICE, "Run Scenario Sweep"))
 MENU_OPTIONS.append((EXIT_CHOICE, "Exit"))
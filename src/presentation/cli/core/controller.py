@@ -1,11 +1,14 @@
 """Menu control and choice handling"""
 
 from src.application.pipeline.steps import AVAILABLE_STEPS
-from src.presentation.cli.core.cli_constants import EXIT_CHOICE, ALL_STEPS_CHOICE_OFFSET
+from src.presentation.cli.core.cli_constants import (
+    EXIT_CHOICE, ALL_STEPS_CHOICE_OFFSET, SCENARIO_CHOICE
+)
 from src.presentation.cli.executors import (
     execute_step, 
     execute_all_steps, 
-    execute_step_with_dependencies
+    execute_step_with_dependencies,
+    execute_scenario_sweep
 )
 from src.shared.utility.logging_utils import get_logger
 
@@ -22,6 +25,11 @@ def is_all_steps_choice(choice: str) -> bool:
     return choice == str(ALL_STEPS_CHOICE_OFFSET)
 
 
+def is_scenario_choice(choice: str) -> bool:
+    """Check if user chose the what-if scenario sweep."""
+    return choice == SCENARIO_CHOICE
+
+
 def is_valid_step_choice(choice: str) -> bool:
     """Check if choice is a valid step ID."""
     return choice in [s.id for s in AVAILABLE_STEPS]
@@ -31,6 +39,8 @@ def _execute_choice(choice: str) -> None:
     """Execute the appropriate action based on user choice."""
     if is_all_steps_choice(choice):
         execute_all_steps()
+    elif is_scenario_choice(choice):
+        execute_scenario_sweep()
     elif is_valid_step_choice(choice):
         execute_step_with_dependencies(choice)
     else:
@@ -4,10 +4,14 @@ from src.presentation.cli.executors.step_executor import (
     execute_step, 
     execute_step_with_dependencies
 )
-from src.presentation.cli.executors.batch_executor import execute_all_steps
+from src.presentation.cli.executors.batch_executor import (
+    execute_all_steps,
+    execute_scenario_sweep
+)
 
 __all__ = [
     'execute_step', 
     'execute_step_with_dependencies', 
-    'execute_all_steps'
+    'execute_all_steps',
+    'execute_scenario_sweep'
 ]
@@ -26,6 +26,14 @@ def execute_all_steps() -> bool:
     return _run_steps_with_mode(use_latest)
 
 
+def execute_scenario_sweep() -> bool:
+    """Compare the configured what-if scenarios on the current data."""
+    from src.application.pipeline.steps import get_manager
+    logger.info("Running scenario sweep...")
+    logger.info(SEPARATOR)
+    return get_manager().run_service("scenarios")
+
+
 # =============================================================================
 # LOGGING HELPERS
 # =============================================================================
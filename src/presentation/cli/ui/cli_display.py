@@ -6,6 +6,7 @@ from src.presentation.cli.core.cli_constants import (
     WELCOME_MESSAGE,
     SEPARATOR,
     ALL_STEPS_CHOICE_OFFSET,
+    SCENARIO_CHOICE,
     EXIT_CHOICE
 )
 from src.shared.utility.logging_utils import get_logger
@@ -31,6 +32,7 @@ def display_menu() -> None:
     
     msg = (
         f"\n  {ALL_STEPS_CHOICE_OFFSET}. Execute all steps\n"
+        f"  {SCENARIO_CHOICE}. Run what-if scenario sweep\n"
         f"  {EXIT_CHOICE}. Exit\n"
         + SEPARATOR
     )
@@ -1,4 +1,5 @@
 """File display UI components."""
+from functools import partial
 import streamlit as st
 from src.presentation.gui.services.file_service import (
     read_file_content,
@@ -42,15 +43,13 @@ def render_download_all_button(
     add_separator: bool = True,
     key: str = None
 ) -> None:
-    """Render download all button for a list of files."""
+    """Render download all button; the ZIP is built only when clicked."""
     if not files:
         return
     
-    zip_data = create_zip_archive(files)
-    
     st.download_button(
         label=label_template.format(count=len(files)),
-        data=zip_data,
+        data=lambda bundle_files=list(files): create_zip_archive(bundle_files),
         file_name=zip_name,
         mime="application/zip",
         use_container_width=True,
@@ -82,16 +81,23 @@ def _render_download_button(
     file_ext: str, 
     key_prefix: str
 ) -> None:
-    """Render the individual file download button."""
-    with open(file_info['path'], 'rb') as file_handle:
-        file_data = file_handle.read()
-    
+    """Render the individual file download button; bytes load on click.
+
+    Deferred ``data`` callables need Streamlit 1.50 or newer and must take
+    no arguments, so the path is bound with partial.
+    """
     key = f"{key_prefix}_{file_info['name']}_{file_ext}"
     
     st.download_button(
         label="⬇️ تحميل",
-        data=file_data,
+        data=partial(_read_file_bytes, file_info['path']),
         file_name=file_info['name'],
         mime="application/octet-stream",
         key=key
     )
+
+
+def _read_file_bytes(path: str) -> bytes:
+    """Read a file's bytes when its download is requested."""
+    with open(path, 'rb') as file_handle:
+        return file_handle.read()
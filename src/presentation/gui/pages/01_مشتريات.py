@@ -20,7 +20,8 @@ from src.presentation.gui.views.purchases import (
     execute_step_ui,
     run_all_steps_ui,
     render_nav_button,
-    render_results_navigation
+    render_results_navigation,
+    render_profiling_toggle
 )
 
 
@@ -46,6 +47,9 @@ st.markdown("---")
 start_file_management_ui()
 st.markdown("---")
 
+# Profiling
+render_profiling_toggle()
+
 # Steps
 st.subheader("الادوات المتاحة حاليا")
 steps = get_all_steps()
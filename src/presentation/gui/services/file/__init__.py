@@ -1,6 +1,6 @@
 """File Service package."""
 from src.presentation.gui.services.file.file_service_reader import read_file_content
-from .writer import create_zip_archive, save_uploaded_file
+from .writer import create_zip_archive, build_zip_bundle, save_uploaded_file
 from .lister import (
     list_output_files, 
     list_files_by_mtime, 
@@ -21,6 +21,7 @@ from .helpers import format_file_size
 __all__ = [
     'read_file_content',
     'create_zip_archive',
+    'build_zip_bundle',
     'save_uploaded_file',
     'list_output_files',
     'list_files_by_mtime',
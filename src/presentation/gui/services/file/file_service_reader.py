@@ -1,39 +1,12 @@
 """File reading logic."""
-import pandas as pd
 from typing import Optional
+from src.presentation.gui.services.file.preview import read_preview
+
+# pandas is imported inside the preview readers so pages load without it.
 
 def read_file_content(
-    file_path: str, 
+    file_path: str,
     max_rows: int = 100
-) -> Optional[pd.DataFrame]:
-    """Read file content as DataFrame."""
-    try:
-        if file_path.endswith('.csv'):
-            return _read_csv_file(file_path, max_rows)
-        elif file_path.endswith('.xlsx'):
-            return pd.read_excel(file_path, nrows=max_rows)
-        return None
-    except Exception:
-        return None
-
-def _read_csv_file(
-    file_path: str, 
-    max_rows: int
-) -> Optional[pd.DataFrame]:
-    """Read CSV file with date header detection."""
-    from src.domain.services.validation import (
-        extract_dates_from_header
-    )
-    
-    with open(file_path, 'r', encoding='utf-8-sig') as file_handle:
-        first_line = file_handle.readline().strip()
-    
-    start_date, end_date = extract_dates_from_header(first_line)
-    
-    skip_rows = 1 if (start_date and end_date) else 0
-    return pd.read_csv(
-        file_path, 
-        skiprows=skip_rows, 
-        encoding='utf-8-sig', 
-        nrows=max_rows
-    )
+) -> Optional["pd.DataFrame"]:
+    """Read the first rows of a CSV or XLSX file as a DataFrame."""
+    return read_preview(file_path, max_rows)
@@ -0,0 +1,113 @@
+"""Head previews for CSV and XLSX files, memoized by path and mtime."""
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+PREVIEW_CACHE_SIZE = 64
+CSV_PROFILE_CACHE_SIZE = 512
+
+_lock = threading.Lock()
+_previews: "OrderedDict[tuple, object]" = OrderedDict()
+_csv_profiles: "OrderedDict[tuple, int]" = OrderedDict()
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def read_preview(
+    file_path: str,
+    max_rows: int = 100
+) -> Optional["pd.DataFrame"]:
+    """Returns the first rows of a CSV or XLSX file, or None."""
+    if not file_path.endswith(('.csv', '.xlsx')):
+        return None
+    try:
+        key = (file_path, os.stat(file_path).st_mtime_ns, max_rows)
+        cached = _get_cached(_previews, key)
+        if cached is None:
+            cached = _load_preview(file_path, key[1], max_rows)
+            _put_cached(_previews, key, cached, PREVIEW_CACHE_SIZE)
+        return cached.copy()
+    except Exception:
+        return None
+
+
+def get_csv_skiprows(file_path: str, mtime_ns: int) -> int:
+    """Returns 1 when a CSV starts with a date-range title line."""
+    key = (file_path, mtime_ns)
+    skiprows = _get_cached(_csv_profiles, key)
+    if skiprows is None:
+        from src.domain.services.validation import extract_dates_from_header
+        with open(file_path, 'r', encoding='utf-8-sig') as file_handle:
+            first_line = file_handle.readline().strip()
+        start_date, end_date = extract_dates_from_header(first_line)
+        skiprows = 1 if (start_date and end_date) else 0
+        _put_cached(_csv_profiles, key, skiprows, CSV_PROFILE_CACHE_SIZE)
+    return skiprows
+
+
+def clear_preview_cache() -> None:
+    """Forgets every memoized preview and CSV profile."""
+    with _lock:
+        _previews.clear()
+        _csv_profiles.clear()
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _load_preview(file_path: str, mtime_ns: int, max_rows: int):
+    """Reads a head preview without parsing the rest of the file."""
+    import pandas as pd
+    if file_path.endswith('.csv'):
+        return pd.read_csv(
+            file_path,
+            skiprows=get_csv_skiprows(file_path, mtime_ns),
+            encoding='utf-8-sig',
+            nrows=max_rows
+        )
+    return _read_xlsx_head(file_path, max_rows)
+
+
+def _read_xlsx_head(file_path: str, max_rows: int):
+    """Streams the first sheet with openpyxl and stops after max_rows.
+
+    Rows go through pandas' TextParser, as in ``read_excel``, so the
+    preview infers the same dtypes as a full read.
+    """
+    from openpyxl import load_workbook
+    from pandas.io.parsers import TextParser
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(
+            max_row=max_rows + 1, values_only=True
+        )
+        data = [list(row) for row in rows]
+    finally:
+        workbook.close()
+    if not data or all(value is None for value in data[0]):
+        import pandas as pd
+        return pd.DataFrame()
+    with TextParser(data, header=0) as parser:
+        return parser.read()
+
+
+def _get_cached(cache: OrderedDict, key: tuple):
+    """Returns a memoized entry and marks it recently used."""
+    with _lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    return None
+
+
+def _put_cached(cache: OrderedDict, key: tuple, value, limit: int) -> None:
+    """Stores an entry, evicting the least recently used ones."""
+    with _lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
@@ -1,25 +1,41 @@
 """File writing logic."""
+import hashlib
 import os
+import tempfile
 import zipfile
-import io
-from typing import List, Dict
+from typing import BinaryIO, List, Dict, Tuple
+from src.shared.config import paths
 from .helpers import format_file_size
 
+# Formats that are already compressed containers gain nothing from DEFLATE.
+STORED_EXTENSIONS = ('.xlsx', '.zip', '.png', '.jpg', '.jpeg')
+CSV_COMPRESSION_LEVEL = 1
+BUNDLE_CACHE_LIMIT = 20
+
+
 def create_zip_archive(
     files: List[Dict]
-) -> bytes:
-    """Create ZIP archive from file list."""
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(
-        zip_buffer, 
-        'w', 
-        zipfile.ZIP_DEFLATED
-    ) as zip_handle:
-        _write_files_to_zip(zip_handle, files)
-    
-    zip_buffer.seek(0)
-    return zip_buffer.read()
+) -> BinaryIO:
+    """Open the cached ZIP bundle of a file list for streaming."""
+    return open(build_zip_bundle(files), 'rb')
+
+
+def build_zip_bundle(files: List[Dict]) -> str:
+    """Returns an on-disk ZIP keyed by the files' paths and mtimes."""
+    entries = _collect_entries(files)
+    cache_dir = paths.DOWNLOAD_CACHE_DIR
+    bundle_path = os.path.join(cache_dir, f"{_bundle_key(entries)}.zip")
+    if os.path.exists(bundle_path):
+        os.utime(bundle_path)
+        return bundle_path
+    os.makedirs(cache_dir, exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(dir=cache_dir, suffix='.part')
+    with os.fdopen(descriptor, 'wb') as handle:
+        with zipfile.ZipFile(handle, 'w') as zip_handle:
+            _write_files_to_zip(zip_handle, entries)
+    os.replace(temporary_path, bundle_path)
+    _prune_bundles(cache_dir)
+    return bundle_path
 
 def save_uploaded_file(
     file_buffer: bytes,
@@ -35,8 +51,9 @@ def save_uploaded_file(
         
     return file_path
 
-def _write_files_to_zip(zip_handle, files: List[Dict]) -> None:
-    """Write files to ZIP archive."""
+def _collect_entries(files: List[Dict]) -> List[Tuple[str, str]]:
+    """Resolves (path, archive name) pairs for files that exist."""
+    entries = []
     for file_info in files:
         file_path = (
             file_info.get("path") or 
@@ -51,4 +68,40 @@ def _write_files_to_zip(zip_handle, files: List[Dict]) -> None:
         )
         
         if file_path and os.path.exists(file_path):
-            zip_handle.write(file_path, file_name)
+            entries.append((file_path, file_name))
+    return entries
+
+def _bundle_key(entries: List[Tuple[str, str]]) -> str:
+    """Hashes archive names, absolute paths, mtimes and sizes."""
+    digest = hashlib.sha256()
+    for file_path, file_name in entries:
+        status = os.stat(file_path)
+        digest.update(
+            f"{file_name}\0{os.path.abspath(file_path)}\0"
+            f"{status.st_mtime_ns}\0{status.st_size}\n".encode('utf-8')
+        )
+    return digest.hexdigest()[:32]
+
+def _write_files_to_zip(zip_handle, entries: List[Tuple[str, str]]) -> None:
+    """Stores compressed formats as-is and deflates text quickly."""
+    for file_path, file_name in entries:
+        if file_path.lower().endswith(STORED_EXTENSIONS):
+            zip_handle.write(file_path, file_name, zipfile.ZIP_STORED)
+        else:
+            zip_handle.write(
+                file_path, file_name, zipfile.ZIP_DEFLATED,
+                CSV_COMPRESSION_LEVEL
+            )
+
+def _prune_bundles(cache_dir: str) -> None:
+    """Keeps only the most recently used bundles."""
+    bundles = sorted(
+        (os.path.join(cache_dir, name) for name in os.listdir(cache_dir)
+         if name.endswith('.zip')),
+        key=os.path.getmtime, reverse=True
+    )
+    for stale_path in bundles[BUNDLE_CACHE_LIMIT:]:
+        try:
+            os.remove(stale_path)
+        except OSError:
+            pass
@@ -2,6 +2,7 @@
 from src.presentation.gui.services.file import (
     read_file_content,
     create_zip_archive,
+    build_zip_bundle,
     save_uploaded_file,
     list_output_files,
     list_files_by_mtime,
@@ -18,6 +19,7 @@ from src.presentation.gui.services.file import (
 __all__ = [
     'read_file_content',
     'create_zip_archive',
+    'build_zip_bundle',
     'save_uploaded_file',
     'list_output_files',
     'list_files_by_mtime',
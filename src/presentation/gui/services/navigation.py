@@ -23,5 +23,6 @@ def get_navigation_config():
             st.Page("pages/04_تسويق.py", title="قسم التسويق", icon="📈"),
             st.Page("pages/05_اتش_ار.py", title="قسم اتش ار", icon="👥"),
             st.Page("pages/11_تحليل_المبيعات.py", title="تحليل المبيعات", icon="🔍"),
+            st.Page("pages/12_التشخيص.py", title="تشخيص الأداء", icon="🩺"),
         ]
     }
@@ -42,7 +42,7 @@ def run_single_step(step_id: str) -> Tuple[bool, str]:
 def get_repository() -> Any:
     """Get a pre-configured repository instance for the GUI."""
     from src.application.factories.repository_factory import RepositoryFactory
-    return RepositoryFactory.create_pandas_repository()
+    return RepositoryFactory.create_repository()
 
 
 def _find_step_by_id(step_id: str) -> Any:
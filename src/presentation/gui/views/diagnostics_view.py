@@ -0,0 +1,75 @@
+"""Diagnostics view: per-run telemetry span explorer."""
+
+import os
+import pandas as pd
+import streamlit as st
+
+from src.shared.utility.telemetry import (
+    list_runs, load_run, flatten_spans
+)
+
+SPAN_COLUMNS = [
+    "path", "kind", "wall_seconds", "cpu_seconds", "memory_peak_bytes",
+    "rows_in", "rows_out", "files_written", "bytes_written"
+]
+
+
+def render_diagnostics() -> None:
+    """Renders the telemetry diagnostics page."""
+    st.title("🩺 تشخيص الأداء")
+    run_files = list_runs()
+    if not run_files:
+        st.info("لا توجد بيانات قياس أداء بعد. قم بتشغيل أي أداة أولاً.")
+        return
+
+    selected = st.selectbox(
+        "اختر التشغيل", run_files, format_func=os.path.basename
+    )
+    rows = flatten_spans(load_run(selected).get("spans", []))
+    if not rows:
+        st.warning("هذا التشغيل لا يحتوي على قياسات.")
+        return
+    spans = pd.DataFrame(rows)
+    _render_service_summary(spans)
+    _render_span_tree(spans)
+    _render_slowest_files(spans)
+
+
+def _render_service_summary(spans: pd.DataFrame) -> None:
+    """Shows totals per service with headline metrics."""
+    services = spans[spans["kind"] == "service"]
+    columns = st.columns(3)
+    columns[0].metric("الوقت الكلي (ث)", f"{services['wall_seconds'].sum():.2f}")
+    columns[1].metric("الملفات المكتوبة", int(services["files_written"].sum()))
+    columns[2].metric(
+        "الحجم المكتوب (MB)", f"{services['bytes_written'].sum() / 1e6:.1f}"
+    )
+    st.subheader("الخدمات")
+    st.bar_chart(services.set_index("name")["wall_seconds"])
+
+
+def _render_span_tree(spans: pd.DataFrame) -> None:
+    """Shows every span indented by depth."""
+    st.subheader("شجرة القياسات")
+    tree = spans.copy()
+    tree["path"] = [
+        "    " * depth + name
+        for depth, name in zip(tree["depth"], tree["name"])
+    ]
+    st.dataframe(
+        tree[[c for c in SPAN_COLUMNS if c in tree.columns]],
+        use_container_width=True, hide_index=True
+    )
+
+
+def _render_slowest_files(spans: pd.DataFrame, limit: int = 20) -> None:
+    """Lists the slowest individual file writes."""
+    files = spans[spans["kind"] == "file"]
+    if files.empty:
+        return
+    st.subheader("أبطأ الملفات")
+    slowest = files.nlargest(limit, "wall_seconds")
+    st.dataframe(
+        slowest[["path", "wall_seconds", "rows_out", "bytes_written"]],
+        use_container_width=True, hide_index=True
+    )
@@ -5,6 +5,7 @@ from .purchases_execution import (
     execute_step_ui, run_all_steps_ui
 )
 from .navigation import render_nav_button, render_results_navigation
+from .profiling import render_profiling_toggle
 
 __all__ = [
     'show_metrics',
@@ -12,5 +13,6 @@ __all__ = [
     'execute_step_ui',
     'run_all_steps_ui',
     'render_nav_button',
-    'render_results_navigation'
+    'render_results_navigation',
+    'render_profiling_toggle'
 ]
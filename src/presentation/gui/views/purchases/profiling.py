@@ -0,0 +1,27 @@
+"""Purchases view profiling toggle."""
+import streamlit as st
+from src.shared.utility.profiling import (
+    start_profile_session, use_profile_session, get_session_directory
+)
+
+PROFILE_OPTIONS = {"بدون": None, "المعالج (CPU)": "cpu", "الذاكرة": "mem"}
+
+
+def render_profiling_toggle() -> None:
+    """Let the user opt in to cProfile/tracemalloc for the next runs."""
+    with st.expander("🩺 قياس الأداء المتقدم", expanded=False):
+        label = st.radio(
+            "وضع التحليل",
+            list(PROFILE_OPTIONS),
+            key="profile_mode",
+            horizontal=True
+        )
+        mode = PROFILE_OPTIONS[label]
+        session = st.session_state.get("profile_session")
+        if mode != (session.mode if session else None):
+            session = start_profile_session(mode)
+            st.session_state["profile_session"] = session
+        use_profile_session(session)
+        directory = get_session_directory()
+        if directory:
+            st.caption(f"سيتم حفظ التقارير في: {directory}")
@@ -20,4 +20,22 @@ TRANSFERS_EXCEL_DIR = os.path.join(TRANSFERS_ROOT_DIR, "excel")
 SURPLUS_DIR = os.path.join(OUTPUT_DIR, "remaining_surplus")
 SHORTAGE_DIR = os.path.join(OUTPUT_DIR, "shortage")
 COMBINED_DIR = os.path.join(OUTPUT_DIR, "combined_transfers")
+SCENARIO_DIR = os.path.join(OUTPUT_DIR, "scenarios")
 ARCHIVE_DIR = os.path.join(DATA_DIR, "archive")
+ARCHIVE_STORE_DIR = os.path.join(ARCHIVE_DIR, "store")
+
+# Persistent state (outside the archived and cleared output tree)
+DATABASE_DIR = os.path.join(DATA_DIR, "db")
+REPOSITORY_DATABASE_PATH = os.path.join(DATABASE_DIR, "distribution.sqlite")
+
+# Caches
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+DOWNLOAD_CACHE_DIR = os.path.join(CACHE_DIR, "downloads")
+DISTRIBUTION_STATE_PATH = os.path.join(CACHE_DIR, "distribution_state.pkl")
+OUTPUT_LEDGER_PATH = os.path.join(CACHE_DIR, "output_ledger.jsonl")
+ARTIFACT_MANIFEST_PATH = os.path.join(CACHE_DIR, "artifact_manifest.jsonl")
+
+# Diagnostics
+LOGS_DIR = os.path.join(DATA_DIR, "logs")
+TELEMETRY_DIR = os.path.join(LOGS_DIR, "telemetry")
+PROFILES_DIR = os.path.join(LOGS_DIR, "profiles")
@@ -25,6 +25,50 @@ MAX_BALANCE_FOR_NEED_THRESHOLD = 30
 MIN_COVERAGE_FOR_SMALL_NEED_SUPPRESSION = 15
 MIN_NEED_THRESHOLD = 10
 
+# What-if sweeps: each preset overrides Scenario fields (coverage_days,
+# weights, max_balance, min_coverage_for_suppression, min_need,
+# consumption_factor). Batches are evaluated in one stacked NumPy pass.
+SCENARIO_PRESETS = [
+    {"name": "baseline"},
+    {"name": "coverage_30", "coverage_days": 30},
+    {"name": "half_consumption", "consumption_factor": 0.5},
+]
+SCENARIO_BATCH_SIZE = 8
+SCENARIO_WORKERS = 1
+
+# Incremental distribution: rerun DistributionEngine only for products whose
+# normalized input row changed since the last run and rewrite only output
+# files whose content changed (state kept under data/cache)
+INCREMENTAL_DISTRIBUTION = True
+
+# Transfer solver used by OptimizeTransfers: "greedy" fills each need from
+# the largest surplus first; "min_cost_flow" gives every need the same
+# quantity but picks sources minimizing the summed pair costs below.
+# Pair costs are per unit, keyed by (source, target); unlisted pairs use
+# the default. Flow products are solved in batches of this size.
+TRANSFER_SOLVER = "greedy"
+TRANSFER_PAIR_COSTS: Dict[tuple, float] = {}
+DEFAULT_TRANSFER_PAIR_COST = 1.0
+FLOW_SOLVER_BATCH_SIZE = 2048
+
+# Columnar copies of step 6-11 CSV outputs: None (off), "parquet" or
+# "feather". Needs pyarrow; readers prefer a copy that is current.
+COLUMNAR_OUTPUT_FORMAT = None
+
+# Repository backend used by the pipeline: "pandas" (CSV trees) or "sqlite"
+REPOSITORY_BACKEND = "pandas"
+
+# Archiving: "stream" (default) zips data/output in one pass and swaps the
+# tree out; "store" (opt-in) keeps content-addressed blobs plus one manifest
+# per run, so disk use grows only with changed files, and runs come back
+# through restore_archive / export_archive_zip; "copy" keeps the legacy
+# copytree + zip layout. Workers > 1 prefetch file reads (stream mode only).
+ARCHIVE_MODE = "stream"
+ARCHIVE_READ_WORKERS = 1
+
+# Telemetry: record tracemalloc peaks per span (slows runs several-fold)
+TELEMETRY_TRACE_MEMORY = False
+
 # Product Types/Categories
 PRODUCT_CATEGORIES = [
     "tablets_and_capsules",
@@ -6,10 +6,30 @@ from src.shared.utility.archiver.manager import (
 )
 from src.shared.utility.archiver.zip_ops import create_zip_archive
 from src.shared.utility.archiver.cleanup import clear_output_directory
+from src.shared.utility.archiver.stream_ops import (
+    archive_output_streaming,
+    swap_out_directory,
+    remove_retired_directories,
+)
+from src.shared.utility.archiver.archive_store import (
+    store_output,
+    list_stored_archives,
+    load_archive_manifest,
+    restore_archive,
+    export_archive_zip,
+)
 
 __all__ = [
     'archive_output_directory',
     'archive_all_output',
     'create_zip_archive',
     'clear_output_directory',
+    'archive_output_streaming',
+    'swap_out_directory',
+    'remove_retired_directories',
+    'store_output',
+    'list_stored_archives',
+    'load_archive_manifest',
+    'restore_archive',
+    'export_archive_zip',
 ]
@@ -0,0 +1,128 @@
+"""Deduplicated archive store: per-archive manifests referencing blobs."""
+
+import json
+import os
+import shutil
+import zipfile
+from datetime import datetime
+from typing import List, Optional
+from src.shared.utility.logging_utils import get_logger
+from src.shared.utility.archiver.blob_store import (
+    hash_file, put_blob, open_blob
+)
+
+logger = get_logger(__name__)
+
+BLOB_DIRECTORY = "blobs"
+MANIFEST_DIRECTORY = "manifests"
+
+
+def store_output(
+    output_directory: str, store_dir: str = "data/archive/store"
+) -> dict:
+    """Archives output by storing only blobs that are not stored yet."""
+    if not os.path.exists(output_directory):
+        raise ValueError(f"Output directory not found: {output_directory}")
+    archive_id = f"archive_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+    blob_dir = os.path.join(store_dir, BLOB_DIRECTORY)
+    files, added_bytes, new_blobs = [], 0, 0
+    for file_path, relative in _walk_files(output_directory):
+        digest = hash_file(file_path)
+        stored = put_blob(blob_dir, digest, file_path)
+        added_bytes, new_blobs = added_bytes + stored, new_blobs + bool(stored)
+        files.append({
+            'path': relative, 'hash': digest,
+            'size': os.path.getsize(file_path),
+            'mtime': os.path.getmtime(file_path)
+        })
+    manifest_path = _write_manifest(store_dir, archive_id, files)
+    logger.info(
+        "Stored %s files (%s new blobs, %s bytes added) as %s",
+        len(files), new_blobs, added_bytes, archive_id
+    )
+    return {
+        'archive_id': archive_id, 'manifest': manifest_path,
+        'file_count': len(files), 'new_blobs': new_blobs,
+        'added_bytes': added_bytes
+    }
+
+
+def list_stored_archives(store_dir: str = "data/archive/store") -> List[str]:
+    """Returns stored archive ids, newest first."""
+    directory = os.path.join(store_dir, MANIFEST_DIRECTORY)
+    if not os.path.isdir(directory):
+        return []
+    names = [name[:-5] for name in os.listdir(directory) if name.endswith('.json')]
+    return sorted(names, reverse=True)
+
+
+def load_archive_manifest(
+    archive_id: str, store_dir: str = "data/archive/store"
+) -> dict:
+    """Reads the manifest of one stored archive."""
+    path = os.path.join(store_dir, MANIFEST_DIRECTORY, f"{archive_id}.json")
+    with open(path, 'r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def restore_archive(
+    archive_id: str, destination: str,
+    store_dir: str = "data/archive/store", prefix: Optional[str] = None
+) -> int:
+    """Restores one archive (optionally a sub-path) and returns file count."""
+    blob_dir = os.path.join(store_dir, BLOB_DIRECTORY)
+    restored = 0
+    for entry in _select_entries(archive_id, store_dir, prefix):
+        target = os.path.join(destination, entry['path'])
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open_blob(blob_dir, entry['hash']) as source, \
+                open(target, 'wb') as handle:
+            shutil.copyfileobj(source, handle)
+        os.utime(target, (entry['mtime'], entry['mtime']))
+        restored += 1
+    return restored
+
+
+def export_archive_zip(
+    archive_id: str, zip_path: str, store_dir: str = "data/archive/store"
+) -> str:
+    """Rebuilds a plain ZIP of a stored archive for sharing."""
+    blob_dir = os.path.join(store_dir, BLOB_DIRECTORY)
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for entry in _select_entries(archive_id, store_dir, None):
+            with open_blob(blob_dir, entry['hash']) as source, \
+                    archive.open(entry['path'], 'w') as member:
+                shutil.copyfileobj(source, member)
+    return zip_path
+
+
+def _select_entries(archive_id, store_dir, prefix) -> List[dict]:
+    """Returns manifest entries, limited to a path prefix when given."""
+    files = load_archive_manifest(archive_id, store_dir)['files']
+    if not prefix:
+        return files
+    return [entry for entry in files if entry['path'].startswith(prefix)]
+
+
+def _walk_files(output_directory: str):
+    """Yields (path, path relative to the output root) for every file."""
+    for root, _, files in os.walk(output_directory):
+        for filename in files:
+            file_path = os.path.join(root, filename)
+            yield file_path, os.path.relpath(
+                file_path, output_directory
+            ).replace(os.sep, '/')
+
+
+def _write_manifest(store_dir: str, archive_id: str, files: list) -> str:
+    """Writes an archive manifest atomically."""
+    directory = os.path.join(store_dir, MANIFEST_DIRECTORY)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{archive_id}.json")
+    with open(f"{path}.part", 'w', encoding='utf-8') as handle:
+        json.dump(
+            {'archive_id': archive_id, 'created_at': datetime.now().isoformat(),
+             'files': files}, handle, ensure_ascii=False, indent=1
+        )
+    os.replace(f"{path}.part", path)
+    return path
@@ -0,0 +1,80 @@
+"""Content-addressed blob storage for archived output files."""
+
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+import zipfile
+from typing import Optional
+
+# Containers that are already compressed are stored as-is.
+RAW_EXTENSIONS = (
+    '.xlsx', '.zip', '.sqlite', '.png', '.jpg', '.parquet', '.feather'
+)
+CHUNK_SIZE = 1024 * 1024
+# openpyxl stamps the save time here and in every zip entry header.
+WORKBOOK_VOLATILE_PARTS = ('docProps/core.xml',)
+
+
+def hash_file(path: str) -> str:
+    """Returns the SHA-256 digest of a file, workbooks by content only."""
+    if path.lower().endswith('.xlsx'):
+        try:
+            return _hash_workbook(path)
+        except zipfile.BadZipFile:
+            pass
+    with open(path, 'rb') as handle:
+        return hashlib.file_digest(handle, 'sha256').hexdigest()
+
+
+def find_blob(blob_dir: str, digest: str) -> Optional[str]:
+    """Returns the stored blob path for a digest, compressed or raw."""
+    base = os.path.join(blob_dir, digest[:2], digest)
+    for candidate in (f"{base}.gz", base):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def put_blob(blob_dir: str, digest: str, source_path: str) -> int:
+    """Stores a file under its digest; returns bytes added (0 if present)."""
+    if find_blob(blob_dir, digest):
+        return 0
+    directory = os.path.join(blob_dir, digest[:2])
+    os.makedirs(directory, exist_ok=True)
+    compress = not source_path.lower().endswith(RAW_EXTENSIONS)
+    target = os.path.join(directory, f"{digest}.gz" if compress else digest)
+    descriptor, partial = tempfile.mkstemp(dir=directory, suffix='.part')
+    with os.fdopen(descriptor, 'wb') as raw_handle, \
+            open(source_path, 'rb') as source:
+        if compress:
+            with gzip.GzipFile(fileobj=raw_handle, mode='wb', mtime=0) as zipped:
+                shutil.copyfileobj(source, zipped, CHUNK_SIZE)
+        else:
+            shutil.copyfileobj(source, raw_handle, CHUNK_SIZE)
+    os.replace(partial, target)
+    return os.path.getsize(target)
+
+
+def open_blob(blob_dir: str, digest: str):
+    """Opens a stored blob for reading its original bytes."""
+    path = find_blob(blob_dir, digest)
+    if path is None:
+        raise FileNotFoundError(f"Archive blob missing: {digest}")
+    return gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')
+
+
+def _hash_workbook(path: str) -> str:
+    """Hashes a workbook's parts, ignoring save timestamps."""
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(path) as archive:
+        for name in sorted(archive.namelist()):
+            if name in WORKBOOK_VOLATILE_PARTS:
+                continue
+            digest.update(name.encode('utf-8') + b'\0')
+            with archive.open(name) as part:
+                for chunk in iter(lambda: part.read(CHUNK_SIZE), b''):
+                    digest.update(chunk)
+            digest.update(b'\0')
+    return digest.hexdigest()
@@ -0,0 +1,130 @@
+"""Single-pass archiving: stream output into a zip, then swap the tree out."""
+
+import glob
+import os
+import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterator, List, Tuple
+from src.shared.utility.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Workbooks are zip containers already; deflating them again costs CPU only.
+STORED_EXTENSIONS = ('.xlsx', '.zip')
+COMPRESSION_LEVEL = 6
+
+
+def archive_output_streaming(
+    output_directory: str,
+    archive_base_dir: str = "data/archive",
+    workers: int = 1
+) -> dict:
+    """Zips every output file in one walk without an intermediate copy."""
+    if not os.path.exists(output_directory):
+        raise ValueError(f"Output directory not found: {output_directory}")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    os.makedirs(archive_base_dir, exist_ok=True)
+    zip_path = os.path.join(archive_base_dir, f"archive_{timestamp}.zip")
+    entries, directory_count = _collect_entries(output_directory)
+    logger.info("Streaming %s files into %s...", len(entries), zip_path)
+    partial_path = f"{zip_path}.part"
+    with zipfile.ZipFile(partial_path, 'w') as zip_handle:
+        if workers > 1:
+            _write_prefetched(zip_handle, entries, workers)
+        else:
+            for file_path, arcname in entries:
+                zip_handle.write(file_path, arcname, *_compression(file_path))
+    os.replace(partial_path, zip_path)
+    return {
+        'archive_dir': archive_base_dir,
+        'file_count': len(entries),
+        'dir_count': directory_count,
+        'zip_file': zip_path
+    }
+
+
+def swap_out_directory(output_directory: str) -> bool:
+    """Renames the tree aside, recreates it empty, then deletes the old one."""
+    if not os.path.exists(output_directory):
+        return True
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    retired = f"{output_directory.rstrip(os.sep)}.retired_{stamp}"
+    try:
+        os.rename(output_directory, retired)
+    except OSError as error:
+        logger.warning("Could not rename %s: %s", output_directory, error)
+        return False
+    os.makedirs(output_directory, exist_ok=True)
+    _remove_retired(retired)
+    return True
+
+
+def remove_retired_directories(output_directory: str) -> int:
+    """Deletes retired copies a previous swap could not remove."""
+    pattern = f"{glob.escape(output_directory.rstrip(os.sep))}.retired_*"
+    stale = [path for path in glob.glob(pattern) if os.path.isdir(path)]
+    return sum(_remove_retired(path) for path in stale)
+
+
+def _remove_retired(retired: str) -> bool:
+    """Deletes a retired tree, logging it for the next archive if it stays."""
+    try:
+        shutil.rmtree(retired)
+        return True
+    except OSError as error:
+        logger.warning(
+            "Could not delete %s, will retry on next archive: %s",
+            retired, error
+        )
+        return False
+
+
+def _collect_entries(output_directory: str) -> Tuple[List[tuple], int]:
+    """Walks the tree once, returning (path, arcname) pairs and a dir count."""
+    root_name = os.path.basename(output_directory.rstrip(os.sep))
+    entries, directory_count = [], 0
+    for root, directories, files in os.walk(output_directory):
+        directory_count += len(directories)
+        for filename in files:
+            file_path = os.path.join(root, filename)
+            relative = os.path.relpath(file_path, output_directory)
+            entries.append((file_path, os.path.join(root_name, relative)))
+    return entries, directory_count
+
+
+def _compression(file_path: str) -> tuple:
+    """Returns (compress_type, compresslevel) for a file."""
+    if file_path.lower().endswith(STORED_EXTENSIONS):
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, COMPRESSION_LEVEL
+
+
+def _write_prefetched(zip_handle, entries: List[tuple], workers: int) -> None:
+    """Reads files on worker threads while the writer thread compresses."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for (file_path, arcname), data in zip(
+            entries, _read_window(executor, entries, workers * 2)
+        ):
+            compress_type, level = _compression(file_path)
+            info = zipfile.ZipInfo.from_file(file_path, arcname)
+            info.compress_type = compress_type
+            zip_handle.writestr(info, data, compresslevel=level)
+
+
+def _read_window(executor, entries, window: int) -> Iterator[bytes]:
+    """Yields file contents in order with a bounded number of reads ahead."""
+    pending = []
+    for file_path, _ in entries:
+        pending.append(executor.submit(_read_bytes, file_path))
+        if len(pending) > window:
+            yield pending.pop(0).result()
+    for future in pending:
+        yield future.result()
+
+
+def _read_bytes(path: str) -> bytes:
+    """Reads a whole file."""
+    with open(path, 'rb') as handle:
+        return handle.read()
@@ -0,0 +1,159 @@
+"""Opt-in cProfile / tracemalloc hooks around pipeline services."""
+
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.shared.config import paths
+from src.shared.utility.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+PROFILE_MODES = ("cpu", "mem")
+TOP_ENTRIES = 40
+
+
+@dataclass
+class ProfileSession:
+    """One user's profiling mode, report folder and service counter."""
+    mode: str
+    name: str
+    counter: int = 0
+    active: bool = False
+
+
+# Each caller context (one Streamlit session, one CLI run) has its own mode.
+_current_session: ContextVar[Optional[ProfileSession]] = ContextVar(
+    "profile_session", default=None
+)
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def start_profile_session(mode: Optional[str]) -> Optional[ProfileSession]:
+    """Creates a session for 'cpu' or 'mem', or None when disabled."""
+    if mode is not None and mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode: {mode}")
+    if mode is None:
+        return None
+    return ProfileSession(mode, datetime.now().strftime("%Y%m%d_%H%M%S"))
+
+
+def use_profile_session(session: Optional[ProfileSession]) -> None:
+    """Makes session the one profile_block uses in the calling context."""
+    _current_session.set(session)
+
+
+def set_profile_mode(mode: Optional[str]) -> Optional[ProfileSession]:
+    """Enables 'cpu' or 'mem' profiling for the calling context, or None."""
+    current = _current_session.get()
+    if mode == (current.mode if current else None):
+        return current
+    session = start_profile_session(mode)
+    use_profile_session(session)
+    return session
+
+
+def get_profile_mode() -> Optional[str]:
+    """Returns the active profile mode, or None when disabled."""
+    session = _current_session.get()
+    return session.mode if session else None
+
+
+def get_session_directory() -> Optional[str]:
+    """Returns the report directory of the current profiling session."""
+    session = _current_session.get()
+    if session is None:
+        return None
+    return os.path.join(paths.PROFILES_DIR, session.name)
+
+
+@contextmanager
+def profile_block(name: str):
+    """Profiles the block when a mode is enabled; a no-op otherwise."""
+    session = _current_session.get()
+    if session is None or session.active:
+        yield
+        return
+    session.active = True
+    session.counter += 1
+    prefix = os.path.join(
+        get_session_directory(), f"{session.counter:02d}_{name}"
+    )
+    try:
+        if session.mode == "cpu":
+            with _cpu_profile(prefix):
+                yield
+        else:
+            with _memory_profile(prefix):
+                yield
+    finally:
+        session.active = False
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+@contextmanager
+def _cpu_profile(prefix: str):
+    """Runs cProfile and writes a .prof dump plus a text summary."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        os.makedirs(os.path.dirname(prefix), exist_ok=True)
+        profiler.dump_stats(f"{prefix}.prof")
+        buffer = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buffer)
+        stats.sort_stats("cumulative").print_stats(TOP_ENTRIES)
+        _write_text(f"{prefix}_cpu.txt", buffer.getvalue())
+
+
+@contextmanager
+def _memory_profile(prefix: str):
+    """Traces allocations and writes the top allocation sites."""
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start(10)
+    before = tracemalloc.take_snapshot()
+    try:
+        yield
+    finally:
+        after = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        if started_here:
+            tracemalloc.stop()
+        os.makedirs(os.path.dirname(prefix), exist_ok=True)
+        _write_text(f"{prefix}_mem.txt", _format_allocations(
+            after.compare_to(before, "lineno"), peak
+        ))
+
+
+def _format_allocations(differences: list, peak: int) -> str:
+    """Formats the largest allocation differences as a report."""
+    lines = [f"Peak traced memory: {peak / 1e6:.1f} MB", ""]
+    lines.extend(str(entry) for entry in differences[:TOP_ENTRIES])
+    return "\n".join(lines) + "\n"
+
+
+def _write_text(path: str, content: str) -> None:
+    """Writes a profiling report and logs where it went."""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(content)
+    logger.info("Profile report written: %s", path)
@@ -0,0 +1,37 @@
+"""Performance telemetry: service timers and hierarchical spans."""
+
+from src.shared.utility.telemetry.timer import (
+    execution_timer, TelemetryTracker
+)
+from src.shared.utility.telemetry.spans import (
+    Span,
+    TelemetryRun,
+    start_run,
+    finish_run,
+    get_current_run,
+    bind_run,
+    telemetry_span,
+    file_span,
+    current_span,
+)
+from src.shared.utility.telemetry.span_store import (
+    save_run, list_runs, load_run, flatten_spans
+)
+
+__all__ = [
+    'execution_timer',
+    'TelemetryTracker',
+    'Span',
+    'TelemetryRun',
+    'start_run',
+    'finish_run',
+    'get_current_run',
+    'bind_run',
+    'telemetry_span',
+    'file_span',
+    'current_span',
+    'save_run',
+    'list_runs',
+    'load_run',
+    'flatten_spans',
+]
@@ -0,0 +1,56 @@
+"""JSON persistence for telemetry runs."""
+
+import json
+import os
+from typing import List
+
+from src.shared.config import paths
+from src.shared.utility.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def save_run(run, directory: str = None) -> str:
+    """Writes one run's span tree to ``<directory>/<run_id>.json``."""
+    directory = directory or paths.TELEMETRY_DIR
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{run.run_id}.json")
+    try:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(run.to_dict(), file, indent=2, ensure_ascii=False)
+    except OSError as error:
+        logger.warning("Could not save telemetry run %s: %s", path, error)
+    return path
+
+
+def list_runs(directory: str = None) -> List[str]:
+    """Returns stored run files, newest first."""
+    directory = directory or paths.TELEMETRY_DIR
+    if not os.path.isdir(directory):
+        return []
+    files = [
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.endswith(".json")
+    ]
+    return sorted(files, key=os.path.getmtime, reverse=True)
+
+
+def load_run(path: str) -> dict:
+    """Reads a stored run as a dictionary."""
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def flatten_spans(spans: List[dict], depth: int = 0, path: str = "") -> list:
+    """Flattens a span tree into rows with depth and a slash-joined path."""
+    rows = []
+    for span in spans:
+        span_path = f"{path}/{span['name']}" if path else span["name"]
+        row = {
+            key: value for key, value in span.items()
+            if key not in ("children", "attributes")
+        }
+        row.update(depth=depth, path=span_path)
+        rows.append(row)
+        rows.extend(flatten_spans(span.get("children", []), depth + 1, span_path))
+    return rows
@@ -0,0 +1,250 @@
+"""Hierarchical telemetry spans: service -> phase -> file."""
+
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional
+
+
+# =============================================================================
+# MODELS
+# =============================================================================
+
+@dataclass
+class Span:
+    """A timed unit of work with resource counters and nested children."""
+    name: str
+    kind: str = "phase"
+    started_at: str = ""
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    memory_peak_bytes: int = 0
+    rows_in: int = 0
+    rows_out: int = 0
+    files_written: int = 0
+    bytes_written: int = 0
+    attributes: dict = field(default_factory=dict)
+    children: List["Span"] = field(default_factory=list)
+    _peak_seen: int = field(default=0, repr=False, compare=False)
+
+    def record_rows(self, rows_in: int = 0, rows_out: int = 0) -> None:
+        """Adds processed row counts to this span."""
+        self.rows_in += int(rows_in)
+        self.rows_out += int(rows_out)
+
+    def record_file(self, path: str) -> None:
+        """Counts a written file and its size against this span."""
+        if path and os.path.exists(path):
+            self.files_written += 1
+            self.bytes_written += os.path.getsize(path)
+
+    def to_dict(self) -> dict:
+        """Serializes the span tree into plain JSON-compatible types."""
+        data = {
+            key: value for key, value in self.__dict__.items()
+            if key != "children" and not key.startswith("_")
+        }
+        data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+@dataclass
+class TelemetryRun:
+    """All root spans collected during one pipeline run."""
+    run_id: str
+    started_at: str
+    trace_memory: bool = False
+    owns_tracemalloc: bool = False
+    spans: List[Span] = field(default_factory=list)
+    active_service: Optional[Span] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def to_dict(self) -> dict:
+        """Serializes the run with its span trees."""
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at,
+            "trace_memory": self.trace_memory,
+            "spans": [span.to_dict() for span in self.spans]
+        }
+
+
+# =============================================================================
+# RUN LIFECYCLE
+# =============================================================================
+
+# Each caller context (one Streamlit session, one CLI run) sees its own run.
+_current_run: ContextVar[Optional[TelemetryRun]] = ContextVar(
+    "telemetry_run", default=None
+)
+_thread_state = threading.local()
+
+
+def start_run(trace_memory: bool = False) -> TelemetryRun:
+    """Begins collecting spans for a new run in the calling context."""
+    run_id = datetime.now().strftime("run_%Y%m%d_%H%M%S_%f")
+    run = TelemetryRun(
+        run_id, datetime.now().isoformat(timespec="seconds"), trace_memory
+    )
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        run.owns_tracemalloc = True
+    _current_run.set(run)
+    return run
+
+
+def finish_run() -> Optional[TelemetryRun]:
+    """Stops collecting and returns the finished run."""
+    run = _current_run.get()
+    _current_run.set(None)
+    if run and run.owns_tracemalloc:
+        tracemalloc.stop()
+    return run
+
+
+def get_current_run() -> Optional[TelemetryRun]:
+    """Returns the run collecting spans in the calling context, if any."""
+    return _current_run.get()
+
+
+def bind_run(function: Callable) -> Callable:
+    """Wraps function so worker threads report to the caller's run.
+
+    New threads start with an empty context, so work handed to a pool
+    must carry the run along explicitly.
+    """
+    run = _current_run.get()
+
+    def bound(*args, **kwargs):
+        token = _current_run.set(run)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _current_run.reset(token)
+    return bound
+
+
+# =============================================================================
+# SPANS
+# =============================================================================
+
+@contextmanager
+def telemetry_span(name: str, kind: str = "phase", **attributes):
+    """Measures a block and attaches it to the enclosing span.
+
+    Worker threads without an open span attach to the active service.
+    Memory peaks are process-wide, so concurrent spans share them.
+    """
+    span = Span(
+        name, kind, datetime.now().isoformat(timespec="seconds"),
+        attributes=attributes
+    )
+    run = _current_run.get()
+    if run is None:
+        yield span
+        return
+    parent = _attach(run, span)
+    yield from _measure(run, span, parent)
+
+
+@contextmanager
+def file_span(path: str, **attributes):
+    """Measures writing one file and records its size on exit."""
+    with telemetry_span(
+        os.path.basename(path), kind="file", path=path, **attributes
+    ) as span:
+        yield span
+    if _current_run.get() is not None:
+        span.record_file(path)
+        _propagate_file_counters(span)
+
+
+def current_span() -> Optional[Span]:
+    """Returns the innermost open span of the calling thread."""
+    stack = _get_stack()
+    if stack:
+        return stack[-1]
+    run = _current_run.get()
+    return run.active_service if run else None
+
+
+# =============================================================================
+# PRIVATE HELPERS
+# =============================================================================
+
+def _get_stack() -> list:
+    """Returns the span stack of the calling thread."""
+    if not hasattr(_thread_state, "stack"):
+        _thread_state.stack = []
+    return _thread_state.stack
+
+
+def _attach(run: TelemetryRun, span: Span) -> Optional[Span]:
+    """Links a span to its parent, or to the run as a root span."""
+    parent = current_span()
+    with run.lock:
+        if parent is None:
+            run.spans.append(span)
+        else:
+            parent.children.append(span)
+    if span.kind == "service":
+        run.active_service = span
+    return parent
+
+
+def _measure(run: TelemetryRun, span: Span, parent: Optional[Span]):
+    """Times the span body and restores thread state afterwards."""
+    stack = _get_stack()
+    stack.append(span)
+    cpu_clock = time.process_time if span.kind == "service" else (
+        time.thread_time
+    )
+    memory_start = _memory_checkpoint(run, parent)
+    wall_start, cpu_start = time.perf_counter(), cpu_clock()
+    try:
+        yield span
+    finally:
+        span.wall_seconds = round(time.perf_counter() - wall_start, 6)
+        span.cpu_seconds = round(cpu_clock() - cpu_start, 6)
+        _close_memory(run, span, parent, memory_start)
+        stack.pop()
+        if span.kind == "service" and run.active_service is span:
+            run.active_service = None
+
+
+def _memory_checkpoint(run: TelemetryRun, parent: Optional[Span]) -> int:
+    """Saves the parent's peak so far and starts a fresh peak window."""
+    if not (run.trace_memory and tracemalloc.is_tracing()):
+        return 0
+    current, peak = tracemalloc.get_traced_memory()
+    if parent is not None:
+        parent._peak_seen = max(parent._peak_seen, peak)
+    tracemalloc.reset_peak()
+    return current
+
+
+def _close_memory(run, span: Span, parent, memory_start: int) -> None:
+    """Stores the span's peak and hands it on to the parent."""
+    if not (run.trace_memory and tracemalloc.is_tracing()):
+        return
+    peak = max(tracemalloc.get_traced_memory()[1], span._peak_seen)
+    span.memory_peak_bytes = max(0, peak - memory_start)
+    if parent is not None:
+        parent._peak_seen = max(parent._peak_seen, peak)
+
+
+def _propagate_file_counters(span: Span) -> None:
+    """Adds a finished file's counters to every open ancestor span."""
+    ancestors = list(_get_stack())
+    run = _current_run.get()
+    service = run.active_service if run else None
+    if service is not None and service not in ancestors:
+        ancestors.insert(0, service)
+    for ancestor in ancestors:
+        ancestor.files_written += span.files_written
+        ancestor.bytes_written += span.bytes_written
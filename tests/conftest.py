@@ -97,3 +97,22 @@ def sample_analysis():
             'end': '01/12/2024'
         }
     }
+
+
+@pytest.fixture(autouse=True)
+def isolated_telemetry_directory(tmp_path, monkeypatch):
+    """Keep telemetry runs, manifests and caches out of the work tree."""
+    from src.shared.config import paths
+    monkeypatch.setattr(paths, "TELEMETRY_DIR", str(tmp_path / "telemetry"))
+    monkeypatch.setattr(
+        paths, "ARTIFACT_MANIFEST_PATH", str(tmp_path / "manifest.jsonl")
+    )
+    monkeypatch.setattr(
+        paths, "DOWNLOAD_CACHE_DIR", str(tmp_path / "downloads")
+    )
+    monkeypatch.setattr(
+        paths, "DISTRIBUTION_STATE_PATH", str(tmp_path / "state.pkl")
+    )
+    monkeypatch.setattr(
+        paths, "OUTPUT_LEDGER_PATH", str(tmp_path / "ledger.jsonl")
+    )
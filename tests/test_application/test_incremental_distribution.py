@@ -0,0 +1,91 @@
+"""Tests for incremental re-distribution in OptimizeTransfers."""
+
+import pytest
+from unittest.mock import MagicMock
+from src.application.use_cases.optimize_transfers import OptimizeTransfers
+from src.domain.models.entities import Branch, Product, StockLevel
+from src.infrastructure.cache.distribution_state import DistributionStateStore
+
+
+class TestIncrementalDistribution:
+
+    @pytest.fixture
+    def mock_repo(self):
+        products = [Product("P1", "One"), Product("P2", "Two")]
+        stocks = {
+            "a": {"P1": StockLevel(10, 0, 1.0, 1.0),
+                  "P2": StockLevel(5, 0, 2.0, 1.0)},
+            "b": {"P1": StockLevel(0, 20, 40.0, 1.0),
+                  "P2": StockLevel(0, 3, 30.0, 1.0)}
+        }
+        repo = MagicMock()
+        repo.load_branches.return_value = [Branch("a"), Branch("b")]
+        repo.load_products.return_value = products
+        repo.load_stock_levels.side_effect = lambda b: stocks[b.name]
+        repo.load_products_by_code.side_effect = lambda codes: [
+            p for p in products if p.code in codes
+        ]
+        repo.load_stock_levels_by_code.side_effect = lambda b, codes: {
+            code: level for code, level in stocks[b.name].items()
+            if code in codes
+        }
+        repo.load_product_fingerprints.return_value = {"P1": "x", "P2": "y"}
+        return repo
+
+    @pytest.fixture
+    def state(self, tmp_path):
+        DistributionStateStore._memo.clear()
+        return DistributionStateStore(str(tmp_path / "state.pkl"))
+
+    def test_unchanged_rows_reuse_stored_results(self, mock_repo, state):
+        first = OptimizeTransfers(mock_repo, state=state).calculate()
+        mock_repo.load_products.reset_mock()
+
+        second = OptimizeTransfers(mock_repo, state=state).calculate()
+
+        assert [r.product.code for r in second] == ["P1", "P2"]
+        assert [r.transfers for r in second] == [r.transfers for r in first]
+        mock_repo.load_products.assert_not_called()
+        mock_repo.load_products_by_code.assert_not_called()
+
+    def test_only_changed_products_are_redistributed(self, mock_repo, state):
+        OptimizeTransfers(mock_repo, state=state).calculate()
+        mock_repo.load_product_fingerprints.return_value = {
+            "P1": "x", "P2": "changed"
+        }
+
+        results = OptimizeTransfers(mock_repo, state=state).calculate()
+
+        mock_repo.load_products_by_code.assert_called_once_with({"P2"})
+        assert [r.product.code for r in results] == ["P1", "P2"]
+        assert results[1].transfers[0].quantity == 3
+
+    def test_policy_change_discards_state(self, mock_repo, state, monkeypatch):
+        OptimizeTransfers(mock_repo, state=state).calculate()
+        monkeypatch.setattr(
+            "src.shared.constants.PRIORITY_WEIGHTS",
+            {"balance": 1.0, "needed": 0.0, "avg_sales": 0.0}
+        )
+        mock_repo.load_products.reset_mock()
+
+        OptimizeTransfers(mock_repo, state=state).calculate()
+
+        mock_repo.load_products.assert_called_once()
+
+    def test_code_change_discards_state(self, mock_repo, state, monkeypatch):
+        OptimizeTransfers(mock_repo, state=state).calculate()
+        monkeypatch.setattr(
+            "src.application.use_cases.optimize_transfers."
+            "_distribution_code_stamp", lambda: "edited"
+        )
+        mock_repo.load_products.reset_mock()
+
+        OptimizeTransfers(mock_repo, state=state).calculate()
+
+        mock_repo.load_products.assert_called_once()
+
+    def test_custom_engine_disables_state(self, mock_repo):
+        engine = MagicMock()
+        engine.distribute_product.return_value = MagicMock()
+        OptimizeTransfers(mock_repo, engine=engine).calculate()
+        mock_repo.load_product_fingerprints.assert_not_called()
@@ -0,0 +1,59 @@
+"""Tests for lazy pipeline service creation and cheap step imports."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.pipeline.service_registry import LazyServiceRegistry
+from src.application.pipeline.workflow import PipelineManager
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+class TestLazyServiceRegistry:
+    """Tests for on-demand service construction."""
+
+    def test_builds_service_on_first_access_only(self):
+        """Factories should run once, on first lookup."""
+        factory = MagicMock(return_value="service")
+        registry = LazyServiceRegistry({"ingest": factory})
+
+        assert "ingest" in registry
+        assert registry.names() == ["ingest"]
+        factory.assert_not_called()
+
+        assert registry["ingest"] == "service"
+        assert registry["ingest"] == "service"
+        factory.assert_called_once()
+
+    def test_unknown_service_raises_key_error(self):
+        """Unknown names should behave like a missing dictionary key."""
+        with pytest.raises(KeyError):
+            LazyServiceRegistry({})["missing"]
+
+
+class TestPipelineManagerLaziness:
+    """Tests that constructing a manager is cheap."""
+
+    def test_manager_defers_repository_creation(self):
+        """No repository should exist until a service needs one."""
+        manager = PipelineManager()
+        assert manager._repository is None
+        assert len(dict(manager._services)) == 0
+
+    def test_step_metadata_imports_without_pandas(self):
+        """Importing step metadata must not pull in pandas."""
+        probe = (
+            "import sys\n"
+            "from src.application.pipeline.steps import AVAILABLE_STEPS\n"
+            "assert len(AVAILABLE_STEPS) == 11\n"
+            "print('pandas' in sys.modules)\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", probe], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        )
+        assert completed.stdout.strip() == "False"
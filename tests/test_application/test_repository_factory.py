@@ -26,3 +26,17 @@ class TestRepositoryFactory:
         # they verify the factory passed different paths than the default output_dir)
         assert repo._input_dir is not None
         assert repo._output_dir is not None
+
+    def test_create_repository_selects_sqlite_backend(self):
+        """Should build the SQLite repository when asked by backend name."""
+        from src.infrastructure.repositories.base.composite_repository import (
+            CompositeDataRepository
+        )
+        repo = RepositoryFactory.create_repository("sqlite")
+        assert isinstance(repo, CompositeDataRepository)
+        assert isinstance(RepositoryFactory.create_repository(), PandasDataRepository)
+
+    def test_create_repository_rejects_unknown_backend(self):
+        """Should raise for an unsupported backend name."""
+        with pytest.raises(ValueError):
+            RepositoryFactory.create_repository("parquet")
@@ -0,0 +1,50 @@
+"""Tests for the SweepScenarios use case."""
+
+import pytest
+from unittest.mock import MagicMock
+from src.application.use_cases.sweep_scenarios import SweepScenarios
+from src.domain.models.entities import Branch, Product, StockLevel
+from src.domain.models.scenario import Scenario
+
+
+class TestSweepScenarios:
+
+    @pytest.fixture
+    def mock_repo(self):
+        repo = MagicMock()
+        repo.load_branches.return_value = [Branch("a"), Branch("b")]
+        repo.load_products.return_value = [
+            Product("P1", "Product 1"), Product("P2", "Product 2")
+        ]
+        stocks = {
+            "a": {"P1": StockLevel(0, 0, 0.0, 1.0)},
+            "b": {"P1": StockLevel(0, 0, 60.0, 0.5)}
+        }
+        repo.load_stock_levels.side_effect = lambda b: stocks[b.name]
+        return repo
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_execute_saves_side_by_side_comparison(
+        self, mock_repo, workers, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "src.application.use_cases.sweep_scenarios.SCENARIO_BATCH_SIZE", 1
+        )
+        scenarios = [
+            Scenario("base"), Scenario("long", coverage_days=25)
+        ]
+        use_case = SweepScenarios(mock_repo)
+
+        assert use_case.execute(scenarios=scenarios, workers=workers)
+
+        summary, products = mock_repo.save_scenario_comparison.call_args[0]
+        assert [row['scenario'] for row in summary] == ['base', 'long']
+        assert summary[0]['transferred_quantity'] == 20
+        assert summary[1]['transferred_quantity'] == 25
+        assert [row['code'] for row in products] == ['P1']
+        assert products[0]['long_surplus'] == 60 - 13 - 25
+        assert mock_repo.load_stock_levels.call_count == 2
+
+    def test_execute_returns_false_on_failure(self, mock_repo):
+        mock_repo.load_branches.side_effect = RuntimeError("boom")
+        assert SweepScenarios(mock_repo).execute() is False
@@ -0,0 +1,132 @@
+"""Tests for the synthetic generator and benchmark result comparison."""
+
+import os
+
+from openpyxl import load_workbook
+
+from benchmarks.engine_benchmarks import (
+    ReferenceDistributionEngine, build_items
+)
+from benchmarks.memory_benchmarks import reference_basic_quantities
+from benchmarks.synthetic_data import (
+    generate_renamed_csv, generate_rows, generate_workbook
+)
+from benchmarks.results import find_regressions
+from src.domain.services.calculations.quantity_calculator import (
+    calculate_basic_quantities
+)
+from src.domain.services.distribution_service import DistributionEngine
+from src.domain.services.priority_service import PriorityCalculator
+from src.domain.services.validation import extract_dates_from_header
+from src.infrastructure.repositories.io.stock_reader import StockReader
+from src.infrastructure.repositories.mappers.mappers import StockMapper
+from src.domain.services.validation.header_validator.header_validation_constants import (
+    get_required_headers
+)
+
+
+class TestSyntheticData:
+    """Tests for the deterministic workbook generator."""
+
+    def test_rows_are_deterministic(self):
+        """Same seed should always yield the same rows."""
+        assert generate_rows(20, seed=7) == generate_rows(20, seed=7)
+        assert generate_rows(20, seed=7) != generate_rows(20, seed=8)
+
+    def test_workbook_matches_real_layout(self, temp_directory):
+        """Workbook should carry the date title and all required headers."""
+        path = generate_workbook(
+            os.path.join(temp_directory, "synthetic.xlsx"), 15
+        )
+        rows = list(load_workbook(path, read_only=True).active.values)
+
+        start, end = extract_dates_from_header(rows[0][0])
+        assert start is not None and end is not None
+        assert set(get_required_headers()) <= set(rows[1])
+        assert len(rows) == 17
+
+    def test_branch_count_limits_columns(self):
+        """Fewer branches should produce fewer sales/balance columns."""
+        assert len(generate_rows(3, branch_count=2)[0]) == 7 + 4
+
+
+class TestFindRegressions:
+    """Tests for baseline comparison."""
+
+    def _report(self, seconds):
+        return {"sections": {"kernels": {"engine": {"wall_seconds": seconds}}}}
+
+    def test_flags_slowdown_above_threshold(self):
+        """Should flag timings slower than the threshold allows."""
+        regressions = find_regressions(
+            self._report(1.0), self._report(1.5), threshold=0.2
+        )
+        assert len(regressions) == 1
+        assert regressions[0]["name"] == "engine"
+
+    def test_ignores_small_or_missing_baselines(self):
+        """Should ignore slowdowns within threshold and new entries."""
+        assert find_regressions(self._report(1.0), self._report(1.1)) == []
+        assert find_regressions({}, self._report(5.0)) == []
+
+
+class TestEngineBenchmark:
+    """Tests for the heap engine against the re-sorting reference."""
+
+    def test_heap_engine_matches_reference(self):
+        """Heap engine should emit exactly the reference transfers."""
+        engine = DistributionEngine(PriorityCalculator())
+        reference = ReferenceDistributionEngine(PriorityCalculator())
+        for branch_count in (3, 25):
+            items = build_items(200, branch_count, seed=5)
+            assert engine.distribute_products(items) == [
+                reference.distribute_product(*item) for item in items
+            ]
+
+
+class TestReaderBenchmark:
+    """Tests for the projected consolidated sheet parse."""
+
+    def test_projection_keeps_what_the_mapper_reads(self, temp_directory):
+        """Projected rows should map to the same stocks as full rows."""
+        import pandas as pd
+        path = generate_renamed_csv(
+            os.path.join(temp_directory, 'renamed.csv'), 30, 6
+        )
+        reader = StockReader(temp_directory)
+        projected, days = reader._read_normalized_csv(path)
+        full = pd.read_csv(
+            path, skiprows=1, encoding='utf-8-sig', dtype={'code': str}
+        )
+
+        assert 'selling_price' not in projected.columns
+        assert projected['code'].iloc[0] == '000001'
+        assert [
+            StockMapper.to_consolidated_stock(row, days)
+            for _, row in projected.iterrows()
+        ] == [
+            StockMapper.to_consolidated_stock(row, days)
+            for _, row in full.iterrows()
+        ]
+
+
+class TestAllocationBenchmark:
+    """Tests for the array quantity chain against the pandas chain."""
+
+    def test_array_chain_matches_reference(self):
+        """Values and dtypes should match for float and integer balances."""
+        import numpy as np
+        import pandas as pd
+        generator = np.random.default_rng(7)
+        avg_sales = generator.choice([0.0, 0.05, 0.7, 0.75, 1.3, 4.0], 400)
+        for balance in (
+            generator.integers(0, 60, 400),
+            generator.integers(0, 120, 400) / 4.0
+        ):
+            branch_df = pd.DataFrame({
+                'avg_sales': avg_sales, 'balance': balance
+            })
+            pd.testing.assert_frame_equal(
+                calculate_basic_quantities(branch_df),
+                reference_basic_quantities(branch_df)
+            )
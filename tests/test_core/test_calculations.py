@@ -128,6 +128,19 @@ class TestCalculateBasicQuantities:
         # Row 1: balance=10, need=100-10=90. Cap=30-10=20. Result=20.
         assert result['needed_quantity'].iloc[1] == 20
 
+    @pytest.mark.parametrize("column", ['avg_sales', 'balance'])
+    @pytest.mark.parametrize("bad_value", [math.nan, math.inf])
+    def test_non_finite_input_raises(self, column, bad_value):
+        """Test that NaN or infinite inputs raise instead of casting"""
+        df = pd.DataFrame({
+            'avg_sales': [1.0, 2.0],
+            'balance': [5.0, 6.0]
+        })
+        df.loc[1, column] = bad_value
+
+        with pytest.raises(ValueError, match="finite"):
+            calculate_basic_quantities(df)
+
 
 class TestCalculateSurplusRemaining:
     """Tests for calculate_surplus_remaining function"""
@@ -0,0 +1,61 @@
+"""Tests for interned Product and Branch instances."""
+
+import pickle
+import pytest
+from src.domain.models.distribution import Transfer
+from src.domain.models.entities import Branch, Product, StockLevel
+from src.domain.models.flyweights import (
+    EntityRegistry, intern_branch, intern_product
+)
+from src.domain.services.model_factory import DomainModelFactory
+
+
+class TestEntityRegistry:
+    """Tests for the flyweight registry."""
+
+    def test_equal_values_share_one_instance(self):
+        registry = EntityRegistry()
+        first = registry.product("001", "Aspirin")
+        assert registry.product("001", "Aspirin") is first
+        assert registry.branch("star") is registry.branch("star")
+        assert registry.size() == (1, 1)
+
+    def test_same_code_with_other_name_stays_distinct(self):
+        registry = EntityRegistry()
+        renamed = registry.product("001", "Aspirin 100")
+        assert renamed != registry.product("001", "Aspirin")
+        assert renamed.name == "Aspirin 100"
+
+    def test_invalid_branch_is_not_registered(self):
+        registry = EntityRegistry()
+        with pytest.raises(ValueError):
+            registry.branch("")
+        assert registry.size() == (0, 0)
+
+    def test_unpickling_returns_shared_instances(self):
+        transfer = Transfer(
+            intern_product("9", "Zinc"), intern_branch("star"),
+            intern_branch("okba"), 2
+        )
+        restored = pickle.loads(pickle.dumps(transfer))
+
+        assert restored == transfer
+        assert restored.product is intern_product("9", "Zinc")
+        assert restored.from_branch is intern_branch("star")
+
+    def test_surplus_entries_share_products(self):
+        raw = [{'code': '5', 'product_name': 'Zinc', 'quantity': 3}] * 2
+        entries = DomainModelFactory.create_surplus_entries(
+            raw, Branch("star")
+        )
+        assert entries[0].product is entries[1].product
+
+
+class TestSlottedEntities:
+    """Domain models keep no per-instance __dict__."""
+
+    @pytest.mark.parametrize("instance", [
+        Product("1", "a"), Branch("star"), StockLevel(1, 0, 2.0, 0.5)
+    ])
+    def test_no_instance_dict(self, instance):
+        assert not hasattr(instance, '__dict__')
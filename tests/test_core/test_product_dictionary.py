@@ -0,0 +1,50 @@
+"""Tests for the run-scoped product id dictionary."""
+
+import threading
+import numpy as np
+from src.domain.models.product_dictionary import (
+    MISSING_ID, ProductDictionary, get_product_dictionary,
+    start_product_dictionary
+)
+
+
+class TestProductDictionary:
+    """Tests for dense product id assignment."""
+
+    def test_ids_are_dense_and_stable(self):
+        dictionary = ProductDictionary()
+        first = dictionary.encode(["b", "a", "b"])
+        second = dictionary.encode(["c", "a"])
+
+        assert first.dtype == np.int32
+        assert first.tolist() == [0, 1, 0]
+        assert second.tolist() == [2, 1]
+        assert len(dictionary) == 3
+
+    def test_lookup_does_not_assign(self):
+        dictionary = ProductDictionary()
+        dictionary.encode(["x"])
+
+        assert dictionary.lookup(["x", "y"]).tolist() == [0, MISSING_ID]
+        assert len(dictionary) == 1
+
+    def test_clear_restarts_ids(self):
+        dictionary = ProductDictionary()
+        dictionary.encode(["x", "y"])
+        dictionary.clear()
+
+        assert dictionary.encode(["y"]).tolist() == [0]
+
+    def test_run_start_does_not_touch_other_contexts(self):
+        dictionary = start_product_dictionary()
+        dictionary.encode(["x", "y"])
+        other = []
+        worker = threading.Thread(target=lambda: other.append(
+            start_product_dictionary().encode(["z"]).tolist()
+        ))
+        worker.start()
+        worker.join()
+
+        assert other == [[0]]
+        assert get_product_dictionary() is dictionary
+        assert dictionary.lookup(["x", "y"]).tolist() == [0, 1]
@@ -49,3 +49,29 @@ class TestPipelineManager:
         
         assert state.step_results["ingest"].is_success is True
         assert state.step_results["normalize"].is_success is True
+
+    def test_run_start_clears_run_caches(self, manager):
+        """Verify that a new run starts with empty process-wide lookups."""
+        from src.domain.models.flyweights import (
+            get_entity_registry, intern_branch
+        )
+        from src.domain.models.product_dictionary import (
+            get_product_dictionary
+        )
+        from src.domain.services.product_ordering import get_product_sort_index
+        get_product_sort_index().register(["Alpha"])
+        intern_branch("admin")
+        get_product_dictionary().encode(["1"])
+        seen = []
+        manager._is_data_present = MagicMock(return_value=True)
+        manager._services["ingest"] = MagicMock()
+        manager._services["ingest"].execute.side_effect = lambda **_: (
+            seen.append((
+                len(get_product_sort_index()._ranks),
+                get_entity_registry().size(),
+                len(get_product_dictionary())
+            )) or True
+        )
+
+        assert manager.run_service("ingest") is True
+        assert seen == [(0, (0, 0), 0)]
@@ -46,17 +46,36 @@ class TestFileDisplay:
     @patch('streamlit.markdown')
     @patch('src.presentation.gui.components.file_display.create_zip_archive', return_value=b"zipdata")
     def test_render_download_all_button(self, mock_zip, mock_md, mock_download):
-        """Test rendering the 'Download All' button"""
+        """Test rendering the 'Download All' button builds the ZIP on click"""
         files = [{'name': 'f1.csv'}, {'name': 'f2.csv'}]
         render_download_all_button(files, "all.zip")
         
         mock_download.assert_called_once()
         args, kwargs = mock_download.call_args
         assert kwargs['file_name'] == "all.zip"
-        assert kwargs['data'] == b"zipdata"
+        mock_zip.assert_not_called()
+        assert kwargs['data']() == b"zipdata"
+        mock_zip.assert_called_once_with(files)
 
     @patch('streamlit.download_button')
     def test_render_download_all_button_empty(self, mock_download):
         """Test 'Download All' button does nothing with empty list"""
         render_download_all_button([], "empty.zip")
         mock_download.assert_not_called()
+
+    @patch('streamlit.download_button')
+    def test_download_button_reads_file_only_on_click(self, mock_download, tmp_path):
+        """Test the single-file button defers reading bytes until clicked"""
+        from src.presentation.gui.components.file_display import (
+            _render_download_button
+        )
+        path = tmp_path / "a.csv"
+        path.write_bytes(b"a,b")
+        file_info = {'name': 'a.csv', 'path': str(path)}
+
+        with patch('builtins.open') as mock_file_open:
+            _render_download_button(file_info, ".csv", "k")
+            mock_file_open.assert_not_called()
+
+        args, kwargs = mock_download.call_args
+        assert kwargs['data']() == b"a,b"
@@ -148,14 +148,10 @@ class TestCreateDownloadZip:
         
         files = [{"path": str(test_file), "name": "test.csv"}]
         
-        zip_bytes = create_zip_archive(files)
-        
-        assert len(zip_bytes) > 0
-        
-        # Verify it's a valid zip
-        import io
-        with zipfile.ZipFile(io.BytesIO(zip_bytes), 'r') as zf:
-            assert "test.csv" in zf.namelist()
+        with create_zip_archive(files) as bundle:
+            # Verify it's a valid zip
+            with zipfile.ZipFile(bundle, 'r') as zf:
+                assert "test.csv" in zf.namelist()
     
     def test_create_zip_multiple_files(self, tmp_path):
         """Test creating zip with multiple files"""
@@ -169,11 +165,9 @@ class TestCreateDownloadZip:
             {"path": str(tmp_path / "file2.csv"), "name": "file2.csv"}
         ]
         
-        zip_bytes = create_zip_archive(files)
-        
-        import io
-        with zipfile.ZipFile(io.BytesIO(zip_bytes), 'r') as zf:
-            assert len(zf.namelist()) == 2
+        with create_zip_archive(files) as bundle:
+            with zipfile.ZipFile(bundle, 'r') as zf:
+                assert len(zf.namelist()) == 2
     
     def test_create_zip_skip_nonexistent(self, tmp_path):
         """Test that non-existent files are skipped"""
@@ -181,10 +175,93 @@ class TestCreateDownloadZip:
         
         files = [{"path": "/nonexistent/file.csv", "name": "missing.csv"}]
         
-        zip_bytes = create_zip_archive(files)
-        
-        # Should create empty zip
-        assert len(zip_bytes) > 0
+        with create_zip_archive(files) as bundle:
+            # Should create empty zip
+            assert len(bundle.read()) > 0
+
+
+class TestBuildZipBundle:
+    """Tests for the on-disk ZIP bundle cache"""
+
+    def test_bundle_reused_until_file_changes(self, tmp_path):
+        """Same paths and mtimes map to one cached bundle"""
+        from src.presentation.gui.services.file_service import build_zip_bundle
+
+        csv_file = tmp_path / "a.csv"
+        csv_file.write_text("a,b\n1,2")
+        files = [{"path": str(csv_file), "name": "a.csv"}]
+
+        first = build_zip_bundle(files)
+        assert build_zip_bundle(files) == first
+
+        later = csv_file.stat().st_mtime_ns + 10 ** 9
+        os.utime(csv_file, ns=(later, later))
+        assert build_zip_bundle(files) != first
+
+    def test_xlsx_stored_and_csv_deflated(self, tmp_path):
+        """Already-compressed workbooks are stored without recompression"""
+        from src.presentation.gui.services.file_service import build_zip_bundle
+
+        (tmp_path / "a.csv").write_text("x" * 1000)
+        (tmp_path / "b.xlsx").write_bytes(b"PK" + b"y" * 1000)
+        files = [
+            {"path": str(tmp_path / "a.csv"), "name": "a.csv"},
+            {"path": str(tmp_path / "b.xlsx"), "name": "b.xlsx"}
+        ]
+
+        with zipfile.ZipFile(build_zip_bundle(files)) as zf:
+            assert zf.getinfo("a.csv").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.getinfo("b.xlsx").compress_type == zipfile.ZIP_STORED
+
+
+class TestReadPreview:
+    """Tests for memoized CSV and XLSX head previews"""
+
+    def test_xlsx_head_matches_read_excel(self, tmp_path):
+        """Streaming preview matches pandas for the same rows"""
+        from src.presentation.gui.services.file.preview import read_preview
+
+        path = str(tmp_path / "book.xlsx")
+        pd.DataFrame({"code": ["001", "002", "003"], "qty": [1, 2, 3]}).to_excel(
+            path, index=False
+        )
+
+        pd.testing.assert_frame_equal(
+            read_preview(path, 2), pd.read_excel(path, nrows=2)
+        )
+
+    def test_preview_memoized_by_mtime(self, tmp_path):
+        """Unchanged files are served from memory, edits are re-read"""
+        from src.presentation.gui.services.file import preview
+
+        csv_file = tmp_path / "a.csv"
+        csv_file.write_text("code,qty\n1,2")
+        assert len(preview.read_preview(str(csv_file))) == 1
+
+        with patch.object(preview, "_load_preview") as mock_load:
+            preview.read_preview(str(csv_file))
+            mock_load.assert_not_called()
+
+        csv_file.write_text("code,qty\n1,2\n3,4")
+        later = csv_file.stat().st_mtime_ns + 10 ** 9
+        os.utime(csv_file, ns=(later, later))
+        assert len(preview.read_preview(str(csv_file))) == 2
+
+    def test_csv_profiles_are_bounded(self, tmp_path, monkeypatch):
+        """Only the most recently used CSV profiles are kept"""
+        from src.presentation.gui.services.file import preview
+
+        monkeypatch.setattr(preview, "CSV_PROFILE_CACHE_SIZE", 2)
+        preview.clear_preview_cache()
+        for name in ("a", "b", "c"):
+            csv_file = tmp_path / f"{name}.csv"
+            csv_file.write_text("code,qty\n1,2")
+            assert preview.get_csv_skiprows(str(csv_file), 1) == 0
+
+        assert [key[0] for key in preview._csv_profiles] == [
+            str(tmp_path / "b.csv"), str(tmp_path / "c.csv")
+        ]
+        preview.clear_preview_cache()
 
 
 class TestOrganizeFilesByBranch:
@@ -0,0 +1,130 @@
+"""Unit tests for the artifact manifest and manifest-backed listing."""
+
+import os
+import pytest
+from src.infrastructure.repositories.metadata import output_manager
+from src.infrastructure.repositories.metadata.artifact_lister import (
+    ArtifactLister
+)
+from src.infrastructure.repositories.metadata.artifact_manifest import (
+    artifact_hash, compute_file_hash, load_manifest, prune_manifest,
+    query_artifacts, record_artifact
+)
+
+
+SEPARATE_PATTERNS = {'csv': 'transfers_from_', 'excel': 'transfers_from_'}
+
+
+def _write_file(directory: str, name: str, content: str = 'x') -> str:
+    """Creates a file and returns its path."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    with open(path, 'w') as file:
+        file.write(content)
+    return path
+
+
+@pytest.fixture
+def separate_root(temp_directory):
+    """Creates a separate-transfers tree with one recorded file."""
+    root = os.path.join(temp_directory, 'separate')
+    directory = os.path.join(root, 'csv', 'transfers_from_admin_1', 'to_star')
+    path = _write_file(
+        directory, 'transfer_from_admin_to_star_tablets_and_capsules_1.csv'
+    )
+    record_artifact(
+        path, 'separate', 'admin', 'star', 'tablets_and_capsules', rows=1
+    )
+    return root
+
+
+class TestArtifactManifest:
+    """Tests for recording and querying manifest entries."""
+
+    def test_record_stores_size_and_hash(self, separate_root):
+        """Should store size, rows and the content hash of the file."""
+        record = load_manifest()[0]
+        assert record['bytes'] == 1
+        assert record['rows'] == 1
+        assert record['hash'] == compute_file_hash(record['path'])
+        assert artifact_hash(record) == record['hash']
+
+    def test_changed_file_has_no_recorded_hash(self, separate_root):
+        """Should not hash a file that changed after it was recorded."""
+        record = load_manifest()[0]
+        _write_file(os.path.dirname(record['path']),
+                    os.path.basename(record['path']), 'changed')
+        assert artifact_hash(record) is None
+
+    def test_prune_drops_missing_and_superseded_records(self, temp_directory):
+        """Should keep one record per file that still exists."""
+        kept = _write_file(temp_directory, 'kept.csv')
+        gone = _write_file(temp_directory, 'gone.csv')
+        record_artifact(kept, 'surplus', 'admin', rows=1)
+        record_artifact(kept, 'surplus', 'admin', rows=2)
+        record_artifact(gone, 'surplus', 'admin', rows=1)
+        os.remove(gone)
+
+        assert prune_manifest() == 1
+        assert [record['rows'] for record in load_manifest()] == [2]
+
+    def test_rewrite_keeps_latest_record(self, temp_directory):
+        """Should keep one entry per path with the newest fields."""
+        path = _write_file(temp_directory, 'a.csv')
+        record_artifact(path, 'surplus', 'admin', rows=1)
+        _write_file(temp_directory, 'a.csv', 'xyz')
+        record_artifact(path, 'surplus', 'admin', rows=3)
+        records = query_artifacts('surplus', 'admin')
+        assert [record['rows'] for record in records] == [3]
+
+    def test_listing_takes_fields_from_manifest(self, separate_root):
+        """Should describe recorded files with their manifest fields."""
+        listing = output_manager.list_manifest_artifacts(
+            'separate', separate_root, SEPARATE_PATTERNS, 'admin'
+        )
+        assert listing[0]['product_category'] == 'tablets_and_capsules'
+        assert listing[0]['target_branch'] == 'star'
+        assert listing[0]['relative_path'].startswith('transfers_from_admin_1')
+
+    def test_recorded_listing_skips_walk_and_file_stats(
+        self, separate_root, monkeypatch
+    ):
+        """Should answer from the manifest without listing or sizing files."""
+        def refuse(*args):
+            raise AssertionError('unexpected filesystem access')
+
+        monkeypatch.setattr(output_manager.os, 'listdir', refuse)
+        monkeypatch.setattr(output_manager.os.path, 'getsize', refuse)
+        listing = output_manager.list_manifest_artifacts(
+            'separate', separate_root, SEPARATE_PATTERNS, 'admin'
+        )
+        assert [item['size'] for item in listing] == [1]
+
+    def test_unrecorded_files_are_listed_with_recorded_ones(
+        self, separate_root
+    ):
+        """Should keep files on disk that the manifest never saw."""
+        directory = os.path.join(
+            separate_root, 'csv', 'transfers_from_admin_1', 'to_wardani'
+        )
+        _write_file(directory, 'transfer_from_admin_to_wardani_syrups_1.csv')
+        listing = output_manager.list_manifest_artifacts(
+            'separate', separate_root, SEPARATE_PATTERNS, 'admin'
+        )
+        assert sorted(item['target_branch'] for item in listing) == [
+            'star', 'wardani'
+        ]
+
+    def test_unknown_branch_returns_empty_list(self, separate_root):
+        """Should list nothing for a branch without files."""
+        assert output_manager.list_manifest_artifacts(
+            'separate', separate_root, SEPARATE_PATTERNS, 'wardani'
+        ) == []
+
+    def test_unrecorded_tree_is_walked(self, temp_directory):
+        """Should list trees that have no manifest records at all."""
+        _write_file(os.path.join(temp_directory, 'csv', 'admin'), 'a.csv')
+        lister = ArtifactLister(temp_directory, surplus_dir=temp_directory)
+        assert [item['name'] for item in lister.list_outputs('surplus')] == [
+            'a.csv'
+        ]
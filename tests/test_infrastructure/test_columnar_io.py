@@ -0,0 +1,97 @@
+"""Tests for optional columnar copies of CSV outputs."""
+
+import os
+import pandas as pd
+import pytest
+from src.infrastructure.cache import output_ledger
+from src.infrastructure.repositories.io import columnar_io
+from src.infrastructure.repositories.io.columnar_io import (
+    columnar_path, read_table, write_columnar
+)
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture(autouse=True)
+def fresh_ledger():
+    output_ledger._loaded.clear()
+    yield
+    output_ledger._loaded.clear()
+
+
+def _write_csv(directory, dataframe):
+    path = os.path.join(directory, 'a_to_b.csv')
+    dataframe.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
+
+class TestColumnarOutput:
+    """Tests for writing and preferring columnar copies."""
+
+    @pytest.mark.parametrize('file_format', ['parquet', 'feather'])
+    def test_copy_is_written_and_read_back(
+        self, temp_directory, monkeypatch, file_format
+    ):
+        monkeypatch.setattr(
+            'src.shared.constants.COLUMNAR_OUTPUT_FORMAT', file_format
+        )
+        dataframe = pd.DataFrame({'code': ['007'], 'quantity': [3]})
+        path = _write_csv(temp_directory, dataframe)
+        write_columnar(dataframe, path, source='a', target='b')
+
+        assert os.path.exists(columnar_path(path, file_format))
+        assert read_table(path)['code'].tolist() == ['007']
+
+    def test_disabled_by_default(self, temp_directory):
+        dataframe = pd.DataFrame({'code': ['1']})
+        path = _write_csv(temp_directory, dataframe)
+        write_columnar(dataframe, path)
+
+        assert os.listdir(temp_directory) == ['a_to_b.csv']
+
+    def test_stale_copy_falls_back_to_csv(self, temp_directory, monkeypatch):
+        monkeypatch.setattr(
+            'src.shared.constants.COLUMNAR_OUTPUT_FORMAT', 'parquet'
+        )
+        path = _write_csv(temp_directory, pd.DataFrame({'code': ['1']}))
+        write_columnar(pd.DataFrame({'code': ['1']}), path)
+        _write_csv(temp_directory, pd.DataFrame({'code': [2]}))
+        os.utime(path, (os.path.getmtime(path) + 5,) * 2)
+
+        assert read_table(path)['code'].tolist() == [2]
+
+    def test_missing_pyarrow_reads_csv(self, temp_directory, monkeypatch):
+        monkeypatch.setattr(
+            'src.shared.constants.COLUMNAR_OUTPUT_FORMAT', 'parquet'
+        )
+        path = _write_csv(temp_directory, pd.DataFrame({'code': [1]}))
+        write_columnar(pd.DataFrame({'code': ['copy']}), path)
+        monkeypatch.setattr(columnar_io, 'has_pyarrow', lambda: False)
+
+        assert read_table(path)['code'].tolist() == [1]
+        write_columnar(pd.DataFrame({'code': ['new']}), path)
+        assert pd.read_parquet(
+            columnar_path(path, 'parquet')
+        )['code'].tolist() == ['copy']
+
+    @pytest.mark.parametrize('file_format', [None, 'parquet', 'feather'])
+    def test_projection_applies_to_every_source(
+        self, temp_directory, monkeypatch, file_format
+    ):
+        monkeypatch.setattr(
+            'src.shared.constants.COLUMNAR_OUTPUT_FORMAT', file_format
+        )
+        dataframe = pd.DataFrame({
+            'code': ['007'], 'price': [9.5], 'quantity': [3]
+        })
+        path = _write_csv(temp_directory, dataframe)
+        write_columnar(dataframe, path)
+
+        result = read_table(
+            path, columns=['code', 'quantity', 'missing'],
+            dtype={'code': str, 'quantity': 'float32'}
+        )
+
+        assert list(result.columns) == ['code', 'quantity']
+        assert result['code'].tolist() == ['007']
+        assert result['quantity'].dtype == 'float32'
@@ -0,0 +1,68 @@
+"""Unit tests for the mtime-keyed artifact listing cache."""
+
+import os
+import pytest
+from src.infrastructure.cache.directory_index import DirectoryIndexCache
+from src.infrastructure.repositories.metadata import output_manager
+
+PATTERNS = {'csv': '', 'excel': ''}
+
+
+@pytest.fixture
+def surplus_tree(temp_directory):
+    """Creates a small surplus output tree with one CSV file."""
+    DirectoryIndexCache().invalidate()
+    branch_dir = os.path.join(temp_directory, 'csv', 'surplus_admin')
+    os.makedirs(branch_dir)
+    with open(os.path.join(branch_dir, 'a.csv'), 'w') as file:
+        file.write('x')
+    yield temp_directory
+    DirectoryIndexCache().invalidate()
+
+
+class TestDirectoryIndexCache:
+    """Tests for cached listing and invalidation."""
+
+    def test_unchanged_tree_skips_listdir(self, surplus_tree, monkeypatch):
+        """Should serve a repeated listing without listing directories."""
+        first = output_manager.list_artifacts('surplus', surplus_tree, PATTERNS)
+        calls = []
+        monkeypatch.setattr(
+            output_manager.os, 'listdir',
+            lambda path: calls.append(path) or []
+        )
+        second = output_manager.list_artifacts('surplus', surplus_tree, PATTERNS)
+        assert [item['name'] for item in second] == ['a.csv']
+        assert second == first
+        assert calls == []
+
+    def test_new_file_invalidates_entry(self, surplus_tree):
+        """Should notice files added to a nested directory."""
+        output_manager.list_artifacts('surplus', surplus_tree, PATTERNS)
+        branch_dir = os.path.join(surplus_tree, 'csv', 'surplus_admin')
+        new_path = os.path.join(branch_dir, 'b.csv')
+        with open(new_path, 'w') as file:
+            file.write('y')
+        os.utime(branch_dir, ns=(1, 1))
+        names = sorted(
+            item['name'] for item in
+            output_manager.list_artifacts('surplus', surplus_tree, PATTERNS)
+        )
+        assert names == ['a.csv', 'b.csv']
+
+    def test_invalidate_forces_rescan(self, surplus_tree):
+        """Should rebuild metadata after an explicit pipeline invalidation."""
+        output_manager.list_artifacts('surplus', surplus_tree, PATTERNS)
+        path = os.path.join(surplus_tree, 'csv', 'surplus_admin', 'a.csv')
+        with open(path, 'w') as file:
+            file.write('longer content')
+        DirectoryIndexCache().invalidate()
+        listing = output_manager.list_artifacts('surplus', surplus_tree, PATTERNS)
+        assert listing[0]['size'] == len('longer content')
+
+    def test_returned_items_are_copies(self, surplus_tree):
+        """Should not let callers mutate the cached entries."""
+        listing = output_manager.list_artifacts('surplus', surplus_tree, PATTERNS)
+        listing[0]['name'] = 'changed'
+        again = output_manager.list_artifacts('surplus', surplus_tree, PATTERNS)
+        assert again[0]['name'] == 'a.csv'
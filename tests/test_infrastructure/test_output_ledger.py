@@ -0,0 +1,102 @@
+"""Tests for the output ledger and row fingerprints."""
+
+import os
+import pandas as pd
+import pytest
+from src.infrastructure.cache import output_ledger
+from src.infrastructure.cache.output_ledger import (
+    frame_fingerprint, is_output_current, remember_output
+)
+from src.infrastructure.repositories.io.stock_reader import StockReader
+
+
+@pytest.fixture(autouse=True)
+def fresh_ledger():
+    output_ledger._loaded.clear()
+    yield
+    output_ledger._loaded.clear()
+
+
+class TestOutputLedger:
+    """Tests for skipping rewrites of unchanged outputs."""
+
+    def test_current_only_for_same_content_and_file(self, temp_directory):
+        path = os.path.join(temp_directory, 'a.csv')
+        dataframe = pd.DataFrame({'code': ['1'], 'qty': [3]})
+        dataframe.to_csv(path, index=False)
+        remember_output(path, frame_fingerprint(dataframe))
+
+        assert is_output_current(path, frame_fingerprint(dataframe))
+        changed = dataframe.assign(qty=[4])
+        assert not is_output_current(path, frame_fingerprint(changed))
+
+        with open(path, 'a') as handle:
+            handle.write('edited\n')
+        assert not is_output_current(path, frame_fingerprint(dataframe))
+
+    def test_missing_file_is_not_current(self, temp_directory):
+        path = os.path.join(temp_directory, 'a.csv')
+        dataframe = pd.DataFrame({'code': ['1']})
+        dataframe.to_csv(path, index=False)
+        remember_output(path, frame_fingerprint(dataframe))
+        os.remove(path)
+
+        assert not is_output_current(path, frame_fingerprint(dataframe))
+
+
+    def test_writes_append_and_reload_latest_entry(self, temp_directory):
+        path = os.path.join(temp_directory, 'a.csv')
+        dataframe = pd.DataFrame({'code': ['1']})
+        for _ in range(3):
+            dataframe.to_csv(path, index=False)
+            remember_output(path, frame_fingerprint(dataframe))
+        ledger_path = output_ledger._ledger_path()
+        with open(ledger_path) as handle:
+            assert len(handle.readlines()) == 3
+
+        output_ledger._loaded.clear()
+        assert is_output_current(path, frame_fingerprint(dataframe))
+        with open(ledger_path) as handle:
+            assert len(handle.readlines()) == 1
+
+
+class TestRowFingerprints:
+    """Tests for StockReader.load_row_fingerprints."""
+
+    def _write(self, temp_directory, rows):
+        path = os.path.join(temp_directory, 'renamed.csv')
+        pd.DataFrame(rows).to_csv(path, index=False, encoding='utf-8-sig')
+        return path
+
+    def test_changed_row_changes_only_its_fingerprint(self, temp_directory):
+        reader = StockReader(temp_directory)
+        rows = [
+            {'code': 'A', 'product_name': 'a', 'star_balance': 1},
+            {'code': 'B', 'product_name': 'b', 'star_balance': 2}
+        ]
+        before = reader.load_row_fingerprints(self._write(temp_directory, rows))
+        rows[1]['star_balance'] = 5
+        after = reader.load_row_fingerprints(self._write(temp_directory, rows))
+
+        assert list(before) == ['A', 'B']
+        assert before['A'] == after['A']
+        assert before['B'] != after['B']
+
+    def test_duplicate_codes_disable_fingerprints(self, temp_directory):
+        rows = [
+            {'code': 'A', 'product_name': 'a'},
+            {'code': 'A', 'product_name': 'b'}
+        ]
+        path = self._write(temp_directory, rows)
+        assert StockReader(temp_directory).load_row_fingerprints(path) == {}
+
+    def test_only_read_columns_shape_fingerprints(self, temp_directory):
+        reader = StockReader(temp_directory)
+        rows = [{'code': '007', 'product_name': 'a', 'star_balance': 1,
+                 'selling_price': 10}]
+        before = reader.load_row_fingerprints(self._write(temp_directory, rows))
+        rows[0]['selling_price'] = 12
+        after = reader.load_row_fingerprints(self._write(temp_directory, rows))
+
+        assert list(before) == ['007']
+        assert before == after
@@ -0,0 +1,47 @@
+"""Tests for single-pass export partitioning."""
+
+import pandas as pd
+from src.infrastructure.repositories.io.partitioned_export import (
+    export_partitions, partition_frame
+)
+
+
+def _table():
+    return pd.DataFrame({
+        'target': ['b', 'a', 'b', 'a', 'b'],
+        'category': ['x', 'x', 'y', 'x', 'x'],
+        'code': ['1', '2', '3', '4', '5'],
+        'rank': [3, 1, 0, 0, 1]
+    })
+
+
+class TestPartitionFrame:
+    """Tests for partition keys, order and row selection."""
+
+    def test_matches_mask_filtering(self):
+        table = _table()
+        partitions = dict(partition_frame(
+            table, ['target', 'category'], order_by='rank', columns=['code']
+        ))
+
+        for (target, category), rows in partitions.items():
+            mask = (table['target'] == target) & (table['category'] == category)
+            expected = table[mask].sort_values('rank', kind='stable')
+            assert rows['code'].tolist() == expected['code'].tolist()
+        assert list(partitions) == [('b', 'x'), ('a', 'x'), ('b', 'y')]
+
+    def test_keeps_input_order_without_rank(self):
+        rows = dict(partition_frame(_table(), ['category']))[('x',)]
+        assert rows['code'].tolist() == ['1', '2', '4', '5']
+
+    def test_export_hands_each_partition_to_writer(self):
+        written = []
+        count = export_partitions(
+            _table(), ['target'],
+            lambda target, rows: written.append((target, len(rows)))
+        )
+        assert count == 2
+        assert written == [('b', 3), ('a', 2)]
+
+    def test_empty_table_yields_nothing(self):
+        assert list(partition_frame(_table().iloc[:0], ['target'])) == []
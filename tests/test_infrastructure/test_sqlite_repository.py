@@ -0,0 +1,147 @@
+"""Unit tests for the SQLite-backed repository."""
+
+import os
+import pytest
+from src.domain.models.entities import Product, Branch, StockLevel, BranchStock
+from src.domain.models.distribution import Transfer, DistributionResult
+from src.infrastructure.cache.data_cache import DataSnapshotCache
+from src.infrastructure.repositories.base.composite_repository import (
+    CompositeDataRepository
+)
+from src.infrastructure.repositories.base.pandas_repository import (
+    PandasDataRepository
+)
+from src.infrastructure.repositories.base.sqlite_repository import (
+    SqliteDataRepository
+)
+
+
+@pytest.fixture
+def input_dir(temp_directory):
+    """Creates a run made of a single renamed input CSV."""
+    DataSnapshotCache().clear()
+    directory = os.path.join(temp_directory, 'renamed')
+    os.makedirs(directory)
+    with open(os.path.join(directory, 'stock.csv'), 'w') as file:
+        file.write('code,product_name\n')
+    yield directory
+    DataSnapshotCache().clear()
+
+
+@pytest.fixture
+def repository(temp_directory, input_dir):
+    """Creates a SQLite repository for the run."""
+    return SqliteDataRepository(
+        os.path.join(temp_directory, 'db', 'distribution.sqlite'), input_dir
+    )
+
+
+@pytest.fixture
+def composite(temp_directory, input_dir, repository):
+    """Pairs the SQLite repository with a file repository."""
+    files = PandasDataRepository(
+        input_dir, os.path.join(temp_directory, 'transfers'),
+        transfers_dir=os.path.join(temp_directory, 'transfers', 'csv'),
+        surplus_dir=os.path.join(temp_directory, 'surplus'),
+        shortage_dir=os.path.join(temp_directory, 'shortage'),
+        analytics_dir=os.path.join(temp_directory, 'analytics')
+    )
+    return CompositeDataRepository(repository, files)
+
+
+def _result(code: str, surplus: dict) -> DistributionResult:
+    """Builds a distribution result with remaining branch surplus."""
+    return DistributionResult(
+        product=Product(code, f"Product {code}"), transfers=[],
+        remaining_needed=0, remaining_surplus=sum(surplus.values()),
+        remaining_branch_surplus=surplus
+    )
+
+
+class TestSqliteDataRepository:
+    """Tests for SQLite persistence and indexed lookups."""
+
+    def test_transfers_round_trip(self, repository):
+        """Should load saved transfers from the database."""
+        transfer = Transfer(
+            Product('1', 'Alpha'), Branch('admin'), Branch('star'), 4, 9.0, 1.0
+        )
+        repository.save_transfers([transfer])
+        DataSnapshotCache().clear()
+        assert repository.load_transfers() == [transfer]
+
+    def test_transfers_load_in_insert_order(self, repository):
+        """Should keep the saved order of rows for the same product."""
+        transfers = [
+            Transfer(Product(code, name), Branch(source), Branch('star'),
+                     1, 5.0, 0.0)
+            for code, name, source in [
+                ('2', 'Beta', 'okba'), ('1', 'Alpha', 'admin'),
+                ('2', 'Beta', 'admin')
+            ]
+        ]
+        repository.save_transfers(transfers)
+        DataSnapshotCache().clear()
+        assert repository.load_transfers() == transfers
+
+    def test_new_run_deletes_older_runs(self, repository, input_dir):
+        """Should keep only the rows of the latest run."""
+        repository.save_remaining_surplus([_result('1', {'admin': 3})])
+        os.utime(os.path.join(input_dir, 'stock.csv'), ns=(1, 1))
+        repository.save_remaining_surplus([_result('2', {'admin': 5})])
+        rows = repository._store.select("SELECT run_id, code FROM surplus")
+        assert [row['code'] for row in rows] == ['2']
+
+    def test_surplus_lookup_by_product(self, repository):
+        """Should find every branch holding surplus of a product."""
+        repository.save_remaining_surplus([
+            _result('1', {'admin': 3, 'star': 7, 'okba': 0}),
+            _result('2', {'admin': 5})
+        ])
+        assert repository.find_product_surplus('1') == [
+            {'branch': 'star', 'quantity': 7},
+            {'branch': 'admin', 'quantity': 3}
+        ]
+        loaded = repository.load_remaining_surplus(Branch('admin'))
+        assert [row['code'] for row in loaded] == ['1', '2']
+        assert loaded[0]['transfer_type'] == 'surplus'
+
+    def test_branch_stock_levels_round_trip(self, repository):
+        """Should rebuild stock levels for a branch from stored rows."""
+        stock = StockLevel(needed=0, surplus=0, balance=12.0, avg_sales=0.0)
+        repository.save_branch_stocks(
+            Branch('admin'), [BranchStock(Product('1', 'Alpha'), stock)]
+        )
+        DataSnapshotCache().clear()
+        levels = repository.load_stock_levels(Branch('admin'))
+        assert levels['1'].balance == 12.0
+        assert levels['1'].surplus == 12
+
+    def test_empty_run_loads_nothing(self, repository):
+        """Should return empty results instead of reading files."""
+        assert repository.load_transfers() == []
+        assert repository.load_stock_levels(Branch('admin')) == {}
+        assert repository.load_remaining_surplus(Branch('admin')) == []
+
+
+class TestCompositeDataRepository:
+    """Tests for writing SQLite rows and export files together."""
+
+    def test_save_transfers_writes_tables_and_files(
+        self, composite, repository, temp_directory
+    ):
+        """Should store transfer rows and still write the CSV export."""
+        transfer = Transfer(
+            Product('1', 'Alpha'), Branch('admin'), Branch('star'), 4, 9.0, 1.0
+        )
+        composite.save_transfers([transfer])
+        DataSnapshotCache().clear()
+
+        assert repository.load_transfers() == [transfer]
+        exported = os.path.join(temp_directory, 'transfers', 'csv')
+        assert any(files for _, _, files in os.walk(exported))
+
+    def test_loads_fall_back_to_files(self, composite):
+        """Should read the file tree when the run has no rows."""
+        assert composite.load_transfers() == []
+        assert composite.load_remaining_surplus(Branch('admin')) == []
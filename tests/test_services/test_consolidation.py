@@ -15,7 +15,7 @@ def test_consolidation_engine_skips_administration_surplus():
         'administration': {'123': 10.0}
     })
 
-    report = engine.combine_data(
+    records = engine.combine_columns(
         branch=admin_branch,
         transfers=[],
         surplus_entries=surplus_entries,
@@ -23,7 +23,7 @@ def test_consolidation_engine_skips_administration_surplus():
     )
     
     # Should have 0 records because surplus is skipped for admin
-    assert len(report.records) == 0
+    assert len(records) == 0
 
 def test_consolidation_engine_includes_other_branch_surplus():
     """Verify that other branches DO send surplus to administration."""
@@ -39,7 +39,7 @@ def test_consolidation_engine_includes_other_branch_surplus():
         'administration': {'123': 5.0}
     })
 
-    report = engine.combine_data(
+    records = engine.combine_columns(
         branch=other_branch,
         transfers=[],
         surplus_entries=surplus_entries,
@@ -47,8 +47,113 @@ def test_consolidation_engine_includes_other_branch_surplus():
     )
     
     # Should have 1 record
-    assert len(report.records) == 1
-    assert report.records[0].target_branch == 'administration'
-    assert report.records[0].transfer_type == 'surplus'
-    assert report.records[0].sender_balance == 10.0
-    assert report.records[0].receiver_balance == 5.0
+    assert len(records) == 1
+    record = records.iloc[0]
+    assert record['target_branch'] == 'administration'
+    assert record['transfer_type'] == 'surplus'
+    assert record['sender_balance'] == 10.0
+    assert record['receiver_balance'] == 5.0
+
+def test_network_state_gather_matches_get_balance():
+    """Bulk gathers should read the same balances as single lookups."""
+    network_state = NetworkStockState(balances={
+        'asherin': {'1': 4.0, '2': 7.5},
+        'administration': {'2': 1.0}
+    })
+    codes = ['1', '2', 'missing', '2']
+    branches = ['administration', 'asherin', 'asherin', 'nowhere']
+
+    gathered = network_state.gather(
+        network_state.rows_of(codes), network_state.columns_of(branches)
+    )
+
+    assert gathered.tolist() == [
+        network_state.get_balance(branch, code)
+        for code, branch in zip(codes, branches)
+    ]
+    assert gathered.tolist() == [0.0, 7.5, 0.0, 0.0]
+
+def test_network_state_compares_by_balances():
+    """States should compare by content, whatever the input order."""
+    state = NetworkStockState(balances={
+        'asherin': {'1': 4.0, '2': 7.5}, 'administration': {'2': 1.0}
+    })
+    reordered = NetworkStockState(balances={
+        'administration': {'2': 1.0}, 'asherin': {'2': 7.5, '1': 4.0}
+    })
+    changed = NetworkStockState(balances={
+        'asherin': {'1': 4.0, '2': 7.0}, 'administration': {'2': 1.0}
+    })
+
+    assert state == reordered
+    assert state != changed
+    assert state != NetworkStockState(balances={'asherin': {'1': 4.0}})
+
+def test_network_state_rebuilds_balances():
+    """Balances should be required and readable back as a mapping."""
+    state = NetworkStockState(balances={
+        'asherin': {'1': 4.0}, 'administration': {'2': 1.0}
+    })
+
+    with pytest.raises(TypeError):
+        NetworkStockState()
+    assert not hasattr(state, 'balances')
+    assert state.to_balances() == {
+        'asherin': {'1': 4.0, '2': 0.0},
+        'administration': {'1': 0.0, '2': 1.0}
+    }
+
+def test_consolidation_engine_reads_transfer_balances():
+    """Normal transfer records should carry both ends' balances."""
+    from src.domain.models.distribution import Transfer
+    source, target = Branch(name='asherin'), Branch(name='okba')
+    product = Product(code='9', name='Zinc')
+    network_state = NetworkStockState(balances={
+        'asherin': {'9': 12.0}, 'okba': {'9': 2.0}
+    })
+
+    records = ConsolidationEngine().combine_columns(
+        branch=source,
+        transfers=[Transfer(product, source, target, 3)],
+        surplus_entries=[],
+        network_state=network_state
+    )
+
+    assert records.loc[0, 'sender_balance'] == 12.0
+    assert records.loc[0, 'receiver_balance'] == 2.0
+
+def test_combine_columns_builds_records_table():
+    """Transfers come before surplus, with categories and sort ranks."""
+    from src.domain.models.distribution import Transfer
+    from src.domain.services.product_ordering import get_product_sort_index
+    source, target = Branch(name='asherin'), Branch(name='okba')
+    tablets = Product(code='1', name='Panadol 500mg tab')
+    syrup = Product(code='2', name='Zinc syrup')
+    network_state = NetworkStockState(balances={
+        'asherin': {'1': 9.0, '2': 4.0}, 'okba': {'1': 1.0},
+        'administration': {'2': 3.0}
+    })
+    transfers = [Transfer(syrup, source, target, 2),
+                 Transfer(tablets, source, target, 5)]
+    surplus_entries = [SurplusEntry(product=tablets, quantity=4, branch=source)]
+    engine = ConsolidationEngine()
+
+    result = engine.combine_columns(
+        source, transfers, surplus_entries, network_state
+    )
+
+    assert result['code'].tolist() == ['2', '1', '1']
+    assert result['quantity_to_transfer'].tolist() == [2, 5, 4]
+    assert result['target_branch'].tolist() == ['okba', 'okba', 'administration']
+    assert result['transfer_type'].tolist() == ['normal', 'normal', 'surplus']
+    assert result['sender_balance'].tolist() == [4.0, 9.0, 9.0]
+    assert result['receiver_balance'].tolist() == [0.0, 1.0, 0.0]
+    assert result['product_category'].tolist()[1] == (
+        result['product_category'].tolist()[2]
+    )
+    assert result['sort_rank'].tolist() == get_product_sort_index().ranks(
+        result['product_name']
+    ).tolist()
+    assert engine.combine_columns(
+        Branch(name='administration'), [], surplus_entries, network_state
+    ).empty
@@ -0,0 +1,128 @@
+"""Tests for the min-cost-flow transfer solver."""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from benchmarks.engine_benchmarks import build_items, ring_pair_costs
+from src.application.use_cases.optimize_transfers import OptimizeTransfers
+from src.domain.models.entities import Branch, Product, StockLevel
+from src.domain.services.calculations.transport_calculator import (
+    solve_transport
+)
+from src.domain.services.distribution_service import DistributionEngine
+from src.domain.services.flow_distribution_service import (
+    FlowDistributionEngine
+)
+from src.domain.services.priority_service import PriorityCalculator
+
+
+def _received(result):
+    totals = {}
+    for transfer in result.transfers:
+        name = transfer.to_branch.name
+        totals[name] = totals.get(name, 0) + transfer.quantity
+    return totals
+
+
+def _cost(results, pair_costs):
+    return sum(
+        pair_costs[(t.from_branch.name, t.to_branch.name)] * t.quantity
+        for result in results for t in result.transfers
+    )
+
+
+class TestSolveTransport:
+    """Tests for the batched successive-shortest-path solver."""
+
+    def test_reroutes_earlier_flow_for_cheaper_total(self):
+        """Second sink should pull the first off its only cheap source."""
+        cost = np.array([
+            [np.inf, np.inf, 1.0, 2.0],
+            [np.inf, np.inf, 1.0, 9.0],
+            [np.inf, np.inf, np.inf, np.inf],
+            [np.inf, np.inf, np.inf, np.inf]
+        ])
+        flow = solve_transport(
+            np.array([[5, 5, 0, 0]]), np.array([[0, 0, 5, 5]]),
+            np.array([[2, 3, 0, 1]]), cost
+        )[0]
+
+        assert flow[0, 3] == 5 and flow[1, 2] == 5
+        assert flow.sum() == 10
+
+    def test_shortage_serves_priority_order(self):
+        """Scarce stock should go to sinks in the given order."""
+        cost = np.ones((3, 3))
+        np.fill_diagonal(cost, np.inf)
+        flow = solve_transport(
+            np.array([[4, 0, 0]]), np.array([[0, 3, 3]]),
+            np.array([[2, 1, 0]]), cost
+        )[0]
+
+        assert flow[0, 2] == 3 and flow[0, 1] == 1
+
+
+class TestFlowDistributionEngine:
+    """Tests for FlowDistributionEngine against the greedy engine."""
+
+    @pytest.mark.parametrize("branch_count", [3, 12])
+    def test_same_fills_at_lower_cost(self, branch_count):
+        """Every branch receives the greedy quantity for no more cost."""
+        items = build_items(300, branch_count, seed=11)
+        pair_costs = ring_pair_costs(branch_count)
+        greedy = DistributionEngine(PriorityCalculator()).distribute_products(
+            items
+        )
+        flow = FlowDistributionEngine(
+            PriorityCalculator(), pair_costs=pair_costs, batch_size=64
+        ).distribute_products(items)
+
+        for expected, actual in zip(greedy, flow):
+            assert _received(actual) == _received(expected)
+            assert actual.remaining_needed == expected.remaining_needed
+            assert actual.remaining_surplus == expected.remaining_surplus
+        assert _cost(flow, pair_costs) <= _cost(greedy, pair_costs)
+
+    def test_uniform_costs_keep_greedy_line_count(self):
+        """Equal-cost ties should not split needs across extra sources."""
+        items = build_items(300, 6, seed=11)
+        greedy = DistributionEngine(PriorityCalculator()).distribute_products(
+            items
+        )
+        flow = FlowDistributionEngine(
+            PriorityCalculator(), pair_costs={}, default_cost=1.0
+        ).distribute_products(items)
+
+        def lines(results):
+            return sum(len(result.transfers) for result in results)
+
+        assert lines(flow) <= lines(greedy)
+
+    def test_single_product_prefers_cheap_source(self):
+        """Should pick the cheaper sender even when it holds less stock."""
+        near, far, target = Branch("near"), Branch("far"), Branch("target")
+        engine = FlowDistributionEngine(
+            PriorityCalculator(), pair_costs={("far", "target"): 5.0}
+        )
+        result = engine.distribute_product(
+            Product("P1", "One"), [(target, StockLevel(4, 0, 0.0, 1.0))],
+            [(far, StockLevel(0, 20, 30.0, 1.0)),
+             (near, StockLevel(0, 4, 10.0, 1.0))]
+        )
+
+        assert [(t.from_branch, t.quantity) for t in result.transfers] == [
+            (near, 4)
+        ]
+        assert result.remaining_branch_surplus == {"far": 20, "near": 0}
+
+
+class TestSolverSelection:
+    """Tests for choosing the solver in OptimizeTransfers."""
+
+    def test_min_cost_flow_solver_is_selectable(self):
+        use_case = OptimizeTransfers(MagicMock(), solver="min_cost_flow")
+        assert isinstance(use_case._engine, FlowDistributionEngine)
+
+    def test_unknown_solver_is_rejected(self):
+        with pytest.raises(ValueError):
+            OptimizeTransfers(MagicMock(), solver="simplex")
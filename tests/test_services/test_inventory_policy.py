@@ -74,3 +74,14 @@ class TestInventoryPolicyVectorized:
         assert result_df.iloc[2]['needed_quantity'] == 5
         # Row 3: No suppression (Coverage 5, Need 5) -> 5
         assert result_df.iloc[3]['needed_quantity'] == 5
+
+    def test_array_rules_adjust_in_place(self):
+        """Integer balances should cap the given needed array in place."""
+        import numpy as np
+        needed = np.array([10, 5, 10, 5])
+        result = InventoryPolicy.apply_array_rules(
+            needed, np.array([30, 10, 25, 10]), np.array([20, 15, 20, 5])
+        )
+
+        assert result is needed
+        assert needed.tolist() == [0, 0, 5, 5]
@@ -0,0 +1,53 @@
+"""Tests for the shared product sort ranks."""
+
+import random
+import numpy as np
+import pandas as pd
+from src.domain.services.product_ordering import (
+    ProductSortIndex, sort_records_by_name
+)
+
+
+class TestProductSortIndex:
+    """Tests for ProductSortIndex ranks and ordering."""
+
+    def test_order_matches_lowercase_sort(self):
+        """Ranks should order names exactly like a stable str.lower sort."""
+        generator = random.Random(3)
+        names = [
+            ''.join(generator.choice('aAbBzZ é') for _ in range(4))
+            for _ in range(500)
+        ] + ['Panadol', 'panadol', 'PANADOL']
+        generator.shuffle(names)
+        expected = pd.Series(names).sort_values(
+            key=lambda column: column.str.lower(), kind='stable'
+        ).index.tolist()
+
+        assert ProductSortIndex().order(names).tolist() == expected
+
+    def test_new_names_rerank_consistently(self):
+        """Registering more names should keep existing relative order."""
+        index = ProductSortIndex()
+        index.register(['b', 'd'])
+        index.register(['C', 'a'])
+
+        assert index.ranks(['a', 'b', 'C', 'd']).tolist() == [0, 1, 2, 3]
+
+    def test_missing_names_sort_last(self):
+        """Non-string names should follow every ranked name."""
+        index = ProductSortIndex()
+        assert index.order(['b', np.nan, 'A']).tolist() == [2, 0, 1]
+
+
+class TestSortRecordsByName:
+    """Tests for ordering row dicts by the shared ranks."""
+
+    def test_sorts_records_by_name(self):
+        records = [
+            {'code': '1', 'product_name': 'beta'},
+            {'code': '2', 'product_name': 'Alpha'},
+            {'code': '3', 'product_name': 'gamma'}
+        ]
+        result = sort_records_by_name(records)
+
+        assert [record['code'] for record in result] == ['2', '1', '3']
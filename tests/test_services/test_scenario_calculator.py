@@ -0,0 +1,89 @@
+"""Tests for batched what-if scenario evaluation."""
+
+import numpy as np
+import pytest
+from src.domain.models.entities import Branch, Product
+from src.domain.models.scenario import Scenario
+from src.domain.services.calculations.scenario_calculator import (
+    evaluate_scenarios
+)
+from src.domain.services.distribution_service import DistributionEngine
+from src.domain.services.inventory.stock_calculator import StockCalculator
+from src.domain.services.priority_service import PriorityCalculator
+
+
+@pytest.fixture
+def network():
+    """Random stock levels for 300 products over 5 branches."""
+    generator = np.random.default_rng(7)
+    sales = generator.poisson(30, size=(300, 5)).astype(float)
+    balance = generator.integers(0, 60, size=(300, 5)).astype(float)
+    balance[generator.random(balance.shape) < 0.3] += 0.5
+    return [
+        [
+            StockCalculator.calculate_stock_level(sale, held, 90)
+            for sale, held in zip(sales_row, balance_row)
+        ]
+        for sales_row, balance_row in zip(sales, balance)
+    ]
+
+
+def _matrices(network):
+    avg_sales = np.array([[stock.avg_sales for stock in row] for row in network])
+    balance = np.array([[stock.balance for stock in row] for row in network])
+    return avg_sales, balance
+
+
+class TestEvaluateScenarios:
+    """Tests for evaluate_scenarios."""
+
+    def test_baseline_matches_distribution_engine(self, network):
+        """Should reproduce the engine's per-product totals exactly."""
+        engine = DistributionEngine(PriorityCalculator())
+        branches = [Branch(f"b{index}") for index in range(5)]
+        expected = []
+        for index, row in enumerate(network):
+            pairs = list(zip(branches, row))
+            result = engine.distribute_product(
+                Product(str(index), "x"),
+                [pair for pair in pairs if pair[1].needed > 0],
+                [pair for pair in pairs
+                 if pair[1].needed <= 0 and pair[1].surplus > 0]
+            )
+            expected.append((
+                sum(transfer.quantity for transfer in result.transfers),
+                len(result.transfers), result.remaining_needed,
+                result.remaining_surplus
+            ))
+        outcome = evaluate_scenarios(*_matrices(network), [Scenario("base")])[0]
+
+        actual = list(zip(
+            outcome.transferred, outcome.transfer_lines,
+            outcome.shortage, outcome.remaining_surplus
+        ))
+        assert actual == expected
+
+    def test_batch_matches_individual_runs(self, network):
+        """Stacking scenarios should not change any scenario's outcome."""
+        scenarios = [
+            Scenario("base"), Scenario("long", coverage_days=30),
+            Scenario("half", consumption_factor=0.5),
+            Scenario("needs", weights={
+                "balance": 0.1, "needed": 0.8, "avg_sales": 0.1
+            }, max_balance=45, min_need=5)
+        ]
+        batched = evaluate_scenarios(*_matrices(network), scenarios)
+        for scenario, outcome in zip(scenarios, batched):
+            single = evaluate_scenarios(*_matrices(network), [scenario])[0]
+            assert np.array_equal(single.transferred, outcome.transferred)
+            assert np.array_equal(single.shortage, outcome.shortage)
+
+    def test_longer_coverage_raises_demand(self, network):
+        """More coverage days should move more stock than half consumption."""
+        base, long, half = evaluate_scenarios(*_matrices(network), [
+            Scenario("base"), Scenario("long", coverage_days=30),
+            Scenario("half", consumption_factor=0.5)
+        ])
+        assert long.transferred.sum() > base.transferred.sum()
+        assert half.transferred.sum() < base.transferred.sum()
+        assert half.remaining_surplus.sum() > base.remaining_surplus.sum()
@@ -0,0 +1,95 @@
+"""Unit tests for the content-addressed archive store."""
+
+import os
+import zipfile
+import time
+import pandas as pd
+import pytest
+from src.infrastructure.excel.formatter import save_formatted_excel
+from src.shared.utility.archiver import (
+    store_output, list_stored_archives, load_archive_manifest,
+    restore_archive, export_archive_zip
+)
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as file:
+        file.write(content)
+
+
+@pytest.fixture
+def output_tree(temp_directory):
+    """Creates an output tree with two CSVs and one workbook."""
+    output = os.path.join(temp_directory, 'output')
+    _write(os.path.join(output, 'surplus', 'a.csv'), b'code,qty\n' * 50)
+    _write(os.path.join(output, 'shortage', 'b.csv'), b'code,need\n' * 50)
+    _write(os.path.join(output, 'book.xlsx'), b'PK' + b'x' * 100)
+    return output
+
+
+class TestArchiveStore:
+    """Tests for incremental storing and restoring of archives."""
+
+    def test_second_archive_only_adds_changed_blobs(
+        self, output_tree, temp_directory
+    ):
+        """Should reuse blobs for unchanged files across archives."""
+        store = os.path.join(temp_directory, 'store')
+        first = store_output(output_tree, store)
+        _write(os.path.join(output_tree, 'shortage', 'b.csv'), b'changed\n')
+        second = store_output(output_tree, store)
+
+        assert first['new_blobs'] == 3
+        assert second['new_blobs'] == 1
+        assert second['file_count'] == 3
+        assert list_stored_archives(store) == [
+            second['archive_id'], first['archive_id']
+        ]
+        files = load_archive_manifest(second['archive_id'], store)['files']
+        assert {entry['path'] for entry in files} == {
+            'surplus/a.csv', 'shortage/b.csv', 'book.xlsx'
+        }
+
+    def test_identical_rerun_adds_no_blobs(self, temp_directory):
+        """Should reuse workbook blobs when only save timestamps differ."""
+        output = os.path.join(temp_directory, 'output')
+        store = os.path.join(temp_directory, 'store')
+        frame = pd.DataFrame({'code': ['1'], 'sender_balance': [4.0]})
+        path = os.path.join(output, 'book.xlsx')
+        os.makedirs(output)
+        save_formatted_excel(frame, path)
+        first = store_output(output, store)
+        time.sleep(2)
+        save_formatted_excel(frame, path)
+        second = store_output(output, store)
+
+        blobs = os.path.join(store, 'blobs')
+        assert first['new_blobs'] == 1
+        assert second['new_blobs'] == 0
+        assert sum(len(files) for _, _, files in os.walk(blobs)) == 1
+
+    def test_restore_and_export_round_trip(self, output_tree, temp_directory):
+        """Should restore identical bytes, fully or by path prefix."""
+        store = os.path.join(temp_directory, 'store')
+        archive_id = store_output(output_tree, store)['archive_id']
+        restored = os.path.join(temp_directory, 'restored')
+
+        assert restore_archive(archive_id, restored, store, 'surplus/') == 1
+        assert not os.path.exists(os.path.join(restored, 'book.xlsx'))
+        assert restore_archive(archive_id, restored, store) == 3
+        for relative in ('surplus/a.csv', 'book.xlsx'):
+            with open(os.path.join(output_tree, relative), 'rb') as original, \
+                    open(os.path.join(restored, relative), 'rb') as copy:
+                assert original.read() == copy.read()
+
+        zip_path = export_archive_zip(
+            archive_id, os.path.join(temp_directory, 'out.zip'), store
+        )
+        with zipfile.ZipFile(zip_path) as archive:
+            assert archive.read('shortage/b.csv') == b'code,need\n' * 50
+
+    def test_missing_output_raises(self, temp_directory):
+        """Should reject a missing output directory."""
+        with pytest.raises(ValueError):
+            store_output(os.path.join(temp_directory, 'missing'))
@@ -0,0 +1,67 @@
+"""Unit tests for single-pass streaming archives."""
+
+import os
+import zipfile
+import pytest
+from src.shared.utility.archiver import (
+    archive_output_streaming, remove_retired_directories, swap_out_directory
+)
+from src.shared.utility.archiver import stream_ops
+
+
+@pytest.fixture
+def output_tree(temp_directory):
+    """Creates an output tree with one CSV and one workbook."""
+    output = os.path.join(temp_directory, 'output')
+    os.makedirs(os.path.join(output, 'surplus', 'csv'))
+    with open(os.path.join(output, 'surplus', 'csv', 'a.csv'), 'w') as file:
+        file.write('code,qty\n' * 50)
+    with open(os.path.join(output, 'book.xlsx'), 'wb') as file:
+        file.write(b'PK' + b'x' * 100)
+    return output
+
+
+class TestStreamingArchive:
+    """Tests for archive_output_streaming and swap_out_directory."""
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_zip_layout_and_compression(self, output_tree, temp_directory, workers):
+        """Should store workbooks, deflate text and keep output/ prefixes."""
+        archive_base = os.path.join(temp_directory, 'archive')
+        result = archive_output_streaming(output_tree, archive_base, workers)
+
+        assert result['file_count'] == 2
+        assert os.listdir(archive_base) == [os.path.basename(result['zip_file'])]
+        with zipfile.ZipFile(result['zip_file']) as archive:
+            csv_info = archive.getinfo('output/surplus/csv/a.csv')
+            assert csv_info.compress_type == zipfile.ZIP_DEFLATED
+            assert archive.getinfo('output/book.xlsx').compress_type == (
+                zipfile.ZIP_STORED
+            )
+            assert archive.read('output/surplus/csv/a.csv') == b'code,qty\n' * 50
+
+    def test_swap_out_leaves_empty_directory(self, output_tree, temp_directory):
+        """Should leave an empty output directory and no retired copy."""
+        assert swap_out_directory(output_tree) is True
+        assert os.listdir(output_tree) == []
+        assert os.listdir(temp_directory) == ['output']
+
+    def test_failed_delete_is_logged_and_retried(
+        self, output_tree, temp_directory, monkeypatch, caplog
+    ):
+        """Should keep going when the retired copy stays, then remove it."""
+        with monkeypatch.context() as patch:
+            patch.setattr(
+                stream_ops.shutil, 'rmtree',
+                lambda path: (_ for _ in ()).throw(PermissionError(path))
+            )
+            assert swap_out_directory(output_tree) is True
+        assert 'Could not delete' in caplog.text
+
+        assert remove_retired_directories(output_tree) == 1
+        assert os.listdir(temp_directory) == ['output']
+
+    def test_missing_output_raises(self, temp_directory):
+        """Should reject a missing output directory."""
+        with pytest.raises(ValueError, match="Output directory not found"):
+            archive_output_streaming(os.path.join(temp_directory, 'missing'))
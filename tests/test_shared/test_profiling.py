@@ -0,0 +1,91 @@
+"""Tests for the opt-in profiler hooks."""
+
+import os
+import threading
+
+import pytest
+
+from src.shared.config import paths
+from src.shared.utility import profiling
+from src.shared.utility.profiling import (
+    profile_block, set_profile_mode, get_profile_mode, get_session_directory
+)
+
+
+@pytest.fixture(autouse=True)
+def profile_directory(tmp_path, monkeypatch):
+    """Redirects reports to a temp dir and resets the mode afterwards."""
+    monkeypatch.setattr(paths, "PROFILES_DIR", str(tmp_path))
+    yield tmp_path
+    set_profile_mode(None)
+
+
+class TestProfiling:
+    """Tests for profile_block behaviour per mode."""
+
+    def test_disabled_writes_nothing(self, profile_directory):
+        """No mode should mean no reports and no session."""
+        with profile_block("optimize"):
+            sum(range(100))
+        assert get_profile_mode() is None
+        assert get_session_directory() is None
+        assert os.listdir(profile_directory) == []
+
+    def test_cpu_mode_writes_prof_and_summary(self):
+        """CPU mode should dump a .prof file and a text summary."""
+        set_profile_mode("cpu")
+        with profile_block("optimize"):
+            sorted(range(1000), reverse=True)
+
+        files = sorted(os.listdir(get_session_directory()))
+        assert files == ["01_optimize.prof", "01_optimize_cpu.txt"]
+
+    def test_mem_mode_writes_allocation_report(self):
+        """Memory mode should report peak and top allocations."""
+        set_profile_mode("mem")
+        with profile_block("segment"):
+            payload = [bytearray(1000) for _ in range(100)]
+        del payload
+
+        path = os.path.join(get_session_directory(), "01_segment_mem.txt")
+        with open(path, encoding="utf-8") as handle:
+            assert handle.readline().startswith("Peak traced memory")
+
+    def test_nested_blocks_profile_outermost_only(self):
+        """Nested services (rescues) should not start a second profiler."""
+        set_profile_mode("cpu")
+        with profile_block("outer"):
+            with profile_block("inner"):
+                pass
+        assert len(os.listdir(get_session_directory())) == 2
+
+    def test_mode_is_scoped_to_the_calling_context(self):
+        """Another session's thread should not see or change this mode."""
+        set_profile_mode("cpu")
+        seen = []
+
+        def other_session():
+            seen.append(get_profile_mode())
+            set_profile_mode(None)
+
+        worker = threading.Thread(target=other_session)
+        worker.start()
+        worker.join()
+
+        assert seen == [None]
+        assert get_profile_mode() == "cpu"
+
+    def test_session_carries_counter_across_runs(self):
+        """A stored session should keep numbering reports when reused."""
+        session = profiling.start_profile_session("cpu")
+        for name in ("first", "second"):
+            profiling.use_profile_session(session)
+            with profile_block(name):
+                pass
+        assert session.counter == 2
+        assert len(os.listdir(get_session_directory())) == 4
+
+    def test_invalid_mode_rejected(self):
+        """Unknown modes should raise ValueError."""
+        with pytest.raises(ValueError):
+            set_profile_mode("gpu")
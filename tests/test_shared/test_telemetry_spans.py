@@ -0,0 +1,110 @@
+"""Tests for hierarchical telemetry spans."""
+
+import os
+import threading
+
+import pytest
+
+from src.shared.utility.telemetry import (
+    start_run, finish_run, get_current_run, bind_run, telemetry_span,
+    file_span,
+    save_run, list_runs, load_run, flatten_spans
+)
+
+
+@pytest.fixture
+def run():
+    """Provides an active telemetry run and always closes it."""
+    active = start_run()
+    yield active
+    finish_run()
+
+
+class TestTelemetrySpans:
+    """Tests for span nesting and counters."""
+
+    def test_spans_nest_under_service(self, run):
+        """Phases should attach to the enclosing service span."""
+        with telemetry_span("optimize", kind="service"):
+            with telemetry_span("load") as span:
+                span.record_rows(rows_out=5)
+
+        service = run.spans[0]
+        assert service.name == "optimize"
+        assert service.children[0].name == "load"
+        assert service.children[0].rows_out == 5
+        assert service.wall_seconds >= service.children[0].wall_seconds
+
+    def test_file_span_counts_bytes_on_ancestors(self, run, temp_directory):
+        """File sizes should roll up to every open ancestor."""
+        path = os.path.join(temp_directory, "out.csv")
+        with telemetry_span("classify", kind="service"):
+            with telemetry_span("persist"):
+                with file_span(path):
+                    with open(path, "w") as handle:
+                        handle.write("abc")
+
+        service = run.spans[0]
+        phase = service.children[0]
+        assert phase.children[0].bytes_written == 3
+        assert phase.files_written == 1
+        assert service.bytes_written == 3
+
+    def test_worker_thread_spans_attach_to_service(self, run):
+        """Spans opened in worker threads should join the active service."""
+        def work():
+            with telemetry_span("branch"):
+                pass
+
+        with telemetry_span("consolidate", kind="service"):
+            worker = threading.Thread(target=bind_run(work))
+            worker.start()
+            worker.join()
+
+        assert run.spans[0].children[0].name == "branch"
+
+    def test_unbound_threads_do_not_see_the_run(self, run):
+        """Other sessions' threads should not report into this run."""
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(get_current_run()))
+        worker.start()
+        worker.join()
+
+        assert get_current_run() is run
+        assert seen == [None]
+
+    def test_memory_peak_recorded_when_tracing(self):
+        """Tracing runs should capture the allocation peak of a span."""
+        start_run(trace_memory=True)
+        try:
+            with telemetry_span("compute") as span:
+                payload = bytearray(2_000_000)
+                del payload
+        finally:
+            finish_run()
+        assert span.memory_peak_bytes >= 2_000_000
+
+    def test_no_active_run_is_noop(self):
+        """Spans outside a run should not be collected anywhere."""
+        with telemetry_span("orphan") as span:
+            span.record_rows(rows_in=1)
+        assert span.rows_in == 1
+
+
+class TestSpanStore:
+    """Tests for run persistence."""
+
+    def test_save_list_and_flatten(self, temp_directory):
+        """Saved runs should be listed and flatten into depth rows."""
+        start_run()
+        with telemetry_span("segment", kind="service"):
+            with telemetry_span("persist"):
+                pass
+        path = save_run(finish_run(), temp_directory)
+
+        assert list_runs(temp_directory) == [path]
+        rows = flatten_spans(load_run(path)["spans"])
+        assert [row["path"] for row in rows] == [
+            "segment", "segment/persist"
+        ]
+        assert rows[1]["depth"] == 1